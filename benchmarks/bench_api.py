@@ -0,0 +1,425 @@
+"""Time every API endpoint in-process against a seeded SQLite database.
+
+A dataset preset (or explicit --lists / --items-per-list) is seeded into a fresh
+database file, then each endpoint is called through the ASGI app with httpx, so
+routing, dependencies, middleware and serialization are all included. Reads run
+before writes; every write case works on its own list so reads see the seeded data.
+
+Results are written as JSON. With --baseline, the median of every endpoint is
+compared to a stored result file and the script exits with status 1 when any
+endpoint got slower than --threshold (a fraction, 0.2 = 20%).
+
+Usage: python benchmarks/bench_api.py [--dataset small] [--iterations 50]
+           [--output results.json] [--baseline baseline.json] [--threshold 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Generator, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import sqlalchemy
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from ul_packing.cache import shared_view_cache
+from ul_packing.config import settings
+from ul_packing.db import Base, apply_sqlite_pragmas, engine_options, get_db, get_read_db
+from ul_packing.main import create_app
+from ul_packing.models import Category, GearItem, ItemKind, PackingList
+from ul_packing.ordering import SORT_ORDER_STEP
+from ul_packing.services import generate_share_token, rebuild_list_summaries
+from ul_packing.synthetic import generate_synthetic_data
+
+
+@dataclass(frozen=True)
+class Dataset:
+    lists: int
+    items_per_list: int
+    # One list this size backs the "large" detail, summary and shared-view cases.
+    large_list_items: int
+
+
+DATASETS = {
+    "small": Dataset(lists=100, items_per_list=10, large_list_items=500),
+    "medium": Dataset(lists=10_000, items_per_list=10, large_list_items=5_000),
+    "large": Dataset(lists=100_000, items_per_list=10, large_list_items=5_000),
+}
+
+DEFAULT_THRESHOLD = 0.2
+_STATEMENTS = re.compile(r'desc="(\d+) queries"')
+
+Params = dict[str, str]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    method: str
+    path: str
+    # Builds the JSON body from the iteration number and the request parameters.
+    body: Callable[[int, Params], Any] | None = None
+    content: bytes | None = None
+    # Untimed per-iteration preparation; may add parameters for this iteration.
+    before: Callable[[httpx.AsyncClient, Params], Awaitable[Params]] | None = None
+    # Write cases seed a dedicated list of items_per_list items as {list_id}.
+    own_list: bool = False
+
+
+@dataclass
+class CaseResult:
+    iterations: int
+    median_ms: float
+    mean_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    statements: int | None
+    response_bytes: int
+    samples_ms: list[float] = field(repr=False)
+
+
+def _item_rows(list_id: str, count: int) -> Iterator[dict[str, Any]]:
+    categories = list(Category)
+    kinds = list(ItemKind)
+    for index in range(count):
+        yield {
+            "list_id": list_id,
+            "name": f"Item {index}",
+            "category": categories[index % len(categories)],
+            "weight_grams": 10 + index % 990,
+            "quantity": 1 + index % 3,
+            "kind": kinds[index % len(kinds)],
+            "notes": "benchmark item",
+            "sort_order": (index + 1) * SORT_ORDER_STEP,
+        }
+
+
+def _insert_lists(db: Session, title: str, sizes: list[int]) -> list[str]:
+    if not sizes:
+        return []
+    lists = [{"title": f"{title} {index}", "share_token": generate_share_token()} for index in range(len(sizes))]
+    list_ids = list(db.scalars(insert(PackingList).returning(PackingList.id), lists))
+    items = [row for list_id, size in zip(list_ids, sizes, strict=True) for row in _item_rows(list_id, size)]
+    if items:
+        db.execute(insert(GearItem), items)
+    return list_ids
+
+
+def seed(engine: Engine, dataset: Dataset, write_lists: int) -> Params:
+    """Generate the dataset, add the large and per-case lists and return ids the cases refer to."""
+    with Session(engine) as db:
+        generate_synthetic_data(db, dataset.lists, min_items=dataset.items_per_list, max_items=dataset.items_per_list)
+        [large_list_id] = _insert_lists(db, "Benchmark large", [dataset.large_list_items])
+        own_lists = _insert_lists(db, "Benchmark writes", [dataset.items_per_list] * write_lists)
+        rebuild_list_summaries(db, [large_list_id, *own_lists])
+        db.commit()
+
+        list_id = db.scalar(
+            select(PackingList.id).where(PackingList.is_shared).order_by(PackingList.created_at, PackingList.id).limit(1)
+        )
+        tokens = dict(
+            db.execute(
+                select(PackingList.id, PackingList.share_token).where(PackingList.id.in_([list_id, large_list_id]))
+            ).all()
+        )
+    return {
+        "list_id": list_id,
+        "large_list_id": large_list_id,
+        "share_token": tokens[list_id],
+        "large_share_token": tokens[large_list_id],
+        "own_lists": ",".join(own_lists),
+    }
+
+
+async def _item_ids(client: httpx.AsyncClient, params: Params) -> list[str]:
+    response = await client.get(f"/api/v1/lists/{params['list_id']}")
+    return [item["id"] for item in response.json()["data"]["items"]]
+
+
+async def _middle_and_ends(client: httpx.AsyncClient, params: Params) -> Params:
+    ids = await _item_ids(client, params)
+    return {"item_id": ids[len(ids) // 2], "first_id": ids[0], "last_id": ids[-1]}
+
+
+async def _any_item(client: httpx.AsyncClient, params: Params) -> Params:
+    return {"item_id": (await _item_ids(client, params))[0]}
+
+
+async def _all_items(client: httpx.AsyncClient, params: Params) -> Params:
+    return {"item_ids": ",".join(await _item_ids(client, params))}
+
+
+async def _new_item(client: httpx.AsyncClient, params: Params) -> Params:
+    response = await client.post(
+        f"/api/v1/lists/{params['list_id']}/items", json={"name": "Disposable", "weight_grams": 1}
+    )
+    return {"item_id": response.json()["data"]["items"][-1]["id"]}
+
+
+async def _clear_shared_cache(_: httpx.AsyncClient, __: Params) -> Params:
+    shared_view_cache.clear()
+    return {}
+
+
+def _item(index: int) -> dict[str, Any]:
+    return {"name": f"Bench {index}", "category": "other", "weight_grams": 100 + index % 50, "quantity": 1}
+
+
+_IMPORT_CSV = "".join(
+    ["name,category,weight_grams,quantity,kind\n", *(f"Imported {index},other,{10 + index},1,base\n" for index in range(50))]
+).encode()
+
+CASES = [
+    Case("get_lists", "GET", "/api/v1/lists"),
+    Case("get_lists_max_page", "GET", "/api/v1/lists?limit=200"),
+    Case("get_gear_items", "GET", "/api/v1/gear-items"),
+    Case("get_gear_items_filtered", "GET", "/api/v1/gear-items?category=shelter&sort=-weight"),
+    Case("get_list_detail", "GET", "/api/v1/lists/{list_id}"),
+    Case("get_list_detail_large", "GET", "/api/v1/lists/{large_list_id}"),
+    Case("get_list_summary", "GET", "/api/v1/lists/{list_id}/summary"),
+    Case("get_list_summary_breakdown_large", "GET", "/api/v1/lists/{large_list_id}/summary?breakdown=category"),
+    Case("shared_view", "GET", "/api/v1/shared/{share_token}"),
+    Case("shared_view_large_uncached", "GET", "/api/v1/shared/{large_share_token}", before=_clear_shared_cache),
+    Case("shared_view_large_cached", "GET", "/api/v1/shared/{large_share_token}"),
+    Case("export_gear_items_ndjson", "GET", "/api/v1/export/gear-items?format=ndjson"),
+    Case("create_list", "POST", "/api/v1/lists", body=lambda i, _: {"title": f"Created {i}"}),
+    Case(
+        "update_list",
+        "PATCH",
+        "/api/v1/lists/{list_id}",
+        body=lambda i, _: {"title": f"Renamed {i}"},
+        own_list=True,
+    ),
+    Case("duplicate_list", "POST", "/api/v1/lists/{list_id}/duplicate", body=lambda i, _: {}, own_list=True),
+    Case("create_item", "POST", "/api/v1/lists/{list_id}/items", body=lambda i, _: _item(i), own_list=True),
+    Case(
+        "create_item_delta",
+        "POST",
+        "/api/v1/lists/{list_id}/items?response=delta",
+        body=lambda i, _: _item(i),
+        own_list=True,
+    ),
+    Case(
+        "create_items_batch",
+        "POST",
+        "/api/v1/lists/{list_id}/items:batch",
+        body=lambda i, _: [_item(i * 10 + offset) for offset in range(10)],
+        own_list=True,
+    ),
+    Case(
+        "update_items_batch",
+        "PATCH",
+        "/api/v1/lists/{list_id}/items:batch",
+        body=lambda i, _: {"bulk": [{"where": {"kind": "base"}, "changes": {"quantity": 1 + i % 2}}]},
+        own_list=True,
+    ),
+    Case(
+        "import_items_csv",
+        "POST",
+        "/api/v1/lists/{list_id}/items:import?format=csv",
+        content=_IMPORT_CSV,
+        own_list=True,
+    ),
+    Case(
+        "update_item",
+        "PATCH",
+        "/api/v1/lists/{list_id}/items/{item_id}",
+        body=lambda i, _: _item(i),
+        before=_any_item,
+        own_list=True,
+    ),
+    Case(
+        "move_item",
+        "POST",
+        "/api/v1/lists/{list_id}/items/{item_id}:move",
+        # Alternate between the two ends so every iteration really moves the item.
+        body=lambda i, p: {"after_id": p["last_id"]} if i % 2 == 0 else {"before_id": p["first_id"]},
+        before=_middle_and_ends,
+        own_list=True,
+    ),
+    Case(
+        "reorder_items",
+        "POST",
+        "/api/v1/lists/{list_id}/items:reorder",
+        body=lambda i, p: {"item_ids": p["item_ids"].split(",")[::-1]},
+        before=_all_items,
+        own_list=True,
+    ),
+    Case(
+        "delete_item",
+        "DELETE",
+        "/api/v1/lists/{list_id}/items/{item_id}",
+        before=_new_item,
+        own_list=True,
+    ),
+    Case("set_unit", "PATCH", "/api/v1/lists/{list_id}/unit", body=lambda i, _: {"unit": "oz" if i % 2 else "g"}, own_list=True),
+    Case("create_gear_item", "POST", "/api/v1/gear-items", body=lambda i, _: _item(i)),
+    Case("regenerate_share_token", "POST", "/api/v1/lists/{list_id}/share/regenerate", own_list=True),
+]
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))]
+
+
+async def _run_case(client: httpx.AsyncClient, case: Case, params: Params, iterations: int, warmup: int) -> CaseResult:
+    samples: list[float] = []
+    statements: int | None = None
+    size = 0
+    for iteration in range(warmup + iterations):
+        request_params = dict(params)
+        if case.before is not None:
+            request_params.update(await case.before(client, request_params))
+        body = case.body(iteration, request_params) if case.body is not None else None
+        started = time.perf_counter()
+        response = await client.request(
+            case.method, case.path.format(**request_params), json=body, content=case.content
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+        if response.status_code >= 400:
+            raise RuntimeError(f"{case.name}: HTTP {response.status_code} {response.text[:200]}")
+        if iteration >= warmup:
+            samples.append(elapsed)
+            match = _STATEMENTS.search(response.headers.get("server-timing", ""))
+            statements = int(match.group(1)) if match else None
+            size = len(response.content)
+    return CaseResult(
+        iterations=iterations,
+        median_ms=round(statistics.median(samples), 3),
+        mean_ms=round(statistics.fmean(samples), 3),
+        p95_ms=round(_percentile(samples, 0.95), 3),
+        min_ms=round(min(samples), 3),
+        max_ms=round(max(samples), 3),
+        statements=statements,
+        response_bytes=size,
+        samples_ms=[round(sample, 3) for sample in samples],
+    )
+
+
+async def run_cases(engine: Engine, params: Params, cases: list[Case], iterations: int, warmup: int) -> dict[str, CaseResult]:
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def bench_db() -> Generator[Session, None, None]:
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app(database_async=False, internal_endpoints=False)
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_read_db] = bench_db
+    shared_view_cache.clear()
+
+    own_lists = iter(params["own_lists"].split(","))
+    results: dict[str, CaseResult] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for case in cases:
+            case_params = {**params, "list_id": next(own_lists)} if case.own_list else params
+            results[case.name] = await _run_case(client, case, case_params, iterations, warmup)
+            print(f"  {case.name:<34} {results[case.name].median_ms:9.3f} ms median", file=sys.stderr)
+    return results
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print median changes per endpoint and return the names that regressed past ``threshold``."""
+    regressions = []
+    print(f"{'endpoint':<34} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:<34} {'-':>10} {result['median_ms']:10.3f} {'new':>8}")
+            continue
+        change = result["median_ms"] / previous["median_ms"] - 1 if previous["median_ms"] else 0.0
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        marker = "  REGRESSION" if regressed else ""
+        print(f"{name:<34} {previous['median_ms']:10.3f} {result['median_ms']:10.3f} {change:+8.1%}{marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", choices=sorted(DATASETS), default="small")
+    parser.add_argument("--lists", type=int, help="override the preset's list count")
+    parser.add_argument("--items-per-list", type=int, help="override the preset's items per list")
+    parser.add_argument("--large-list-items", type=int, help="override the preset's large list size")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", action="append", metavar="CASE", help="run only these cases (repeatable)")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    preset = DATASETS[args.dataset]
+    dataset = Dataset(
+        lists=args.lists if args.lists is not None else preset.lists,
+        items_per_list=args.items_per_list if args.items_per_list is not None else preset.items_per_list,
+        large_list_items=args.large_list_items if args.large_list_items is not None else preset.large_list_items,
+    )
+    cases = [case for case in CASES if not args.only or case.name in args.only]
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    if baseline is not None and baseline["dataset"] != asdict(dataset):
+        parser.error(f"baseline was recorded with dataset {baseline['dataset']}, not {asdict(dataset)}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite+pysqlite:///{Path(directory) / 'bench.db'}"
+        # Same pool and SQLITE_PROFILE pragmas as the app's engine.
+        engine = create_engine(database_url, **engine_options(database_url))
+        apply_sqlite_pragmas(engine, settings.sqlite_pragmas())
+        Base.metadata.create_all(engine)
+        started = time.perf_counter()
+        params = seed(engine, dataset, write_lists=sum(case.own_list for case in cases))
+        print(f"seeded {asdict(dataset)} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        results = asyncio.run(run_cases(engine, params, cases, args.iterations, args.warmup))
+        engine.dispose()
+
+    report = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "dataset": asdict(dataset),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "sqlite": engine.dialect.dbapi.sqlite_version,
+        },
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"wrote {args.output}", file=sys.stderr)
+
+    if baseline is None:
+        for name, result in results.items():
+            print(f"{name:<34} {result.median_ms:9.3f} ms median  {result.p95_ms:9.3f} ms p95  {result.statements} queries")
+        return
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} endpoint(s) slower than the baseline by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare the legacy list-detail response path with the single-pass one.
+
+Each iteration opens a fresh session, as a request would, so item loading is
+included in the timings.
+
+Usage: python benchmarks/bench_serialization.py [--items 500] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from ul_packing.db import Base
+from ul_packing.models import Category, GearItem, ItemKind, PackingList
+from ul_packing.routes_api import _list_response
+from ul_packing.schemas_api import GearItemOut, PackingListDetailOut, PackingListListItemOut
+from ul_packing.services import generate_share_token, rebuild_list_summaries
+
+
+def _legacy_list_response(packing_list: PackingList) -> JSONResponse:
+    # The pre-optimization path: lazy-load ORM items, validate, dump to dicts,
+    # rebuild the detail model from those dicts, dump again and json.dumps.
+    data = PackingListListItemOut.model_validate(packing_list).model_dump(mode="json")
+    detail = PackingListDetailOut(
+        **data,
+        items=[GearItemOut.model_validate(item) for item in packing_list.items],
+    )
+    return JSONResponse({"data": detail.model_dump(mode="json")})
+
+
+def _seed(db: Session, item_count: int) -> str:
+    packing_list = PackingList(title="Benchmark", description="", share_token=generate_share_token())
+    db.add(packing_list)
+    db.flush()
+    categories = list(Category)
+    kinds = list(ItemKind)
+    db.add_all(
+        GearItem(
+            list_id=packing_list.id,
+            name=f"Item {index}",
+            category=categories[index % len(categories)],
+            weight_grams=10 + index,
+            quantity=1 + index % 3,
+            kind=kinds[index % len(kinds)],
+            notes="benchmark item",
+            sort_order=index,
+        )
+        for index in range(item_count)
+    )
+    db.flush()
+    rebuild_list_summaries(db, [packing_list.id])
+    db.commit()
+    return packing_list.id
+
+
+def _legacy_request(engine: Engine, list_id: str) -> bytes:
+    with Session(engine) as db:
+        return bytes(_legacy_list_response(db.get(PackingList, list_id)).body)
+
+
+def _fast_request(engine: Engine, list_id: str) -> bytes:
+    with Session(engine) as db:
+        return bytes(_list_response(db, db.get(PackingList, list_id), include_items=True).body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        list_id = _seed(db, args.items)
+
+    legacy = _legacy_request(engine, list_id)
+    fast = _fast_request(engine, list_id)
+    assert legacy == fast, "wire format changed"
+
+    results = {
+        "legacy": timeit.timeit(lambda: _legacy_request(engine, list_id), number=args.repeat),
+        "single-pass": timeit.timeit(lambda: _fast_request(engine, list_id), number=args.repeat),
+    }
+
+    print(f"{args.items} items, {args.repeat} iterations, {len(fast)} bytes per response")
+    for name, seconds in results.items():
+        print(f"  {name:<12} {seconds / args.repeat * 1000:8.3f} ms/response")
+    print(f"  speedup      {results['legacy'] / results['single-pass']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare SQLite write throughput with and without the "production" PRAGMA profile.
+
+Every write is one small transaction (insert an item and bump the list summary),
+as an item POST would be. The concurrent run uses several threads against the
+same database file and counts "database is locked" failures.
+
+Usage: python benchmarks/bench_sqlite_pragmas.py [--writes 500] [--threads 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from ul_packing.config import SQLITE_PROFILES
+from ul_packing.db import Base, apply_sqlite_pragmas
+from ul_packing.models import Category, ItemKind, PackingList
+from ul_packing.services import bulk_insert_items, generate_share_token
+
+
+def _engine(path: Path, profile: str) -> Engine:
+    # A short driver timeout so lock contention surfaces as errors unless busy_timeout is raised.
+    engine = create_engine(f"sqlite+pysqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 0.1})
+    apply_sqlite_pragmas(engine, SQLITE_PROFILES[profile])
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _write(engine: Engine, list_id: str, index: int) -> None:
+    with Session(engine) as db:
+        item = {
+            "name": f"Item {index}",
+            "category": Category.OTHER,
+            "weight_grams": 10,
+            "quantity": 1,
+            "kind": ItemKind.BASE,
+            "notes": "",
+        }
+        bulk_insert_items(db, list_id, [item], start_sort_order=index)
+        db.commit()
+
+
+def _create_list(engine: Engine) -> str:
+    with Session(engine) as db:
+        packing_list = PackingList(title="Benchmark", share_token=generate_share_token())
+        db.add(packing_list)
+        db.commit()
+        return packing_list.id
+
+
+def _sequential(engine: Engine, writes: int) -> float:
+    list_id = _create_list(engine)
+    started = time.perf_counter()
+    for index in range(writes):
+        _write(engine, list_id, index)
+    return writes / (time.perf_counter() - started)
+
+
+def _concurrent(engine: Engine, writes: int, threads: int) -> tuple[float, int]:
+    list_id = _create_list(engine)
+    failures = 0
+    lock = threading.Lock()
+
+    def worker(offset: int) -> None:
+        nonlocal failures
+        for index in range(offset, writes, threads):
+            try:
+                _write(engine, list_id, index)
+            except OperationalError:
+                with lock:
+                    failures += 1
+
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return (writes - failures) / (time.perf_counter() - started), failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{args.writes} single-item write transactions per run")
+    results: dict[str, float] = {}
+    for profile in ("default", "production"):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = _engine(Path(tmp) / "bench.db", profile)
+            try:
+                results[profile] = _sequential(engine, args.writes)
+                concurrent, failures = _concurrent(engine, args.writes, args.threads)
+            finally:
+                engine.dispose()
+        print(
+            f"  {profile:<11} sequential {results[profile]:9.1f} writes/s   "
+            f"{args.threads} threads {concurrent:9.1f} writes/s, {failures} locked"
+        )
+    print(f"  speedup     {results['production'] / results['default']:8.2f}x sequential")
+
+
+if __name__ == "__main__":
+    main()
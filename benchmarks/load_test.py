@@ -0,0 +1,333 @@
+"""Drive a locally started uvicorn with concurrent clients and report latency percentiles.
+
+The server runs as a subprocess on a fresh SQLite file (extra environment such as
+SQLITE_PROFILE is passed through). After seeding lists over HTTP, every scenario
+runs --concurrency closed-loop clients for --duration seconds, each picking
+operations by weight, and reports throughput, p50/p95/p99 latency, the error rate
+(transport errors and 5xx) and the lock rate ("database is locked" in the server log).
+
+Usage: python benchmarks/load_test.py [--scenario shared-views] [--concurrency 32]
+           [--duration 20] [--workers 1] [--sqlite-profile production] [--output load.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
+
+SEED_LISTS = 200
+SEED_ITEMS_PER_LIST = 20
+LOCKED_MESSAGE = "database is locked"
+
+
+@dataclass
+class Pool:
+    """Ids created during seeding that operations pick from."""
+
+    list_ids: list[str] = field(default_factory=list)
+    share_tokens: list[str] = field(default_factory=list)
+    # Lists that the editing operations write to, kept apart from the read set.
+    edit_list_ids: list[str] = field(default_factory=list)
+    items: dict[str, list[str]] = field(default_factory=dict)
+
+
+Operation = Callable[[httpx.AsyncClient, Pool, random.Random], Awaitable[httpx.Response]]
+
+
+def _item(rng: random.Random) -> dict[str, object]:
+    return {
+        "name": f"Load item {rng.randrange(1_000_000)}",
+        "category": rng.choice(["shelter", "sleeping", "clothing", "cooking", "other"]),
+        "weight_grams": rng.randint(5, 1500),
+        "quantity": rng.randint(1, 3),
+    }
+
+
+async def get_shared_view(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    return await client.get(f"/api/v1/shared/{rng.choice(pool.share_tokens)}")
+
+
+async def get_list_detail(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    return await client.get(f"/api/v1/lists/{rng.choice(pool.list_ids)}")
+
+
+async def get_lists(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    return await client.get("/api/v1/lists")
+
+
+async def get_gear_items(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    return await client.get("/api/v1/gear-items", params={"sort": "-weight"})
+
+
+async def create_item(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    list_id = rng.choice(pool.edit_list_ids)
+    response = await client.post(f"/api/v1/lists/{list_id}/items?response=delta", json=_item(rng))
+    if response.status_code == 200:
+        pool.items[list_id].append(response.json()["data"]["item"]["id"])
+    return response
+
+
+async def update_item(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    list_id = rng.choice(pool.edit_list_ids)
+    item_id = rng.choice(pool.items[list_id])
+    return await client.patch(f"/api/v1/lists/{list_id}/items/{item_id}?response=delta", json=_item(rng))
+
+
+async def move_item(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    list_id = rng.choice(pool.edit_list_ids)
+    item_id, anchor_id = rng.sample(pool.items[list_id], 2)
+    return await client.post(
+        f"/api/v1/lists/{list_id}/items/{item_id}:move?response=delta", json={"after_id": anchor_id}
+    )
+
+
+async def create_gear_item(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    return await client.post("/api/v1/gear-items", json=_item(rng))
+
+
+async def create_items_batch(client: httpx.AsyncClient, pool: Pool, rng: random.Random) -> httpx.Response:
+    list_id = rng.choice(pool.edit_list_ids)
+    return await client.post(f"/api/v1/lists/{list_id}/items:batch", json=[_item(rng) for _ in range(50)])
+
+
+SCENARIOS: dict[str, dict[Operation, int]] = {
+    "shared-views": {get_shared_view: 90, get_list_detail: 8, get_lists: 2},
+    "mixed-editing": {
+        get_list_detail: 35,
+        get_shared_view: 20,
+        get_lists: 5,
+        create_item: 25,
+        update_item: 10,
+        move_item: 5,
+    },
+    "bulk-gear": {create_gear_item: 60, create_items_batch: 20, get_gear_items: 20},
+}
+
+
+@dataclass
+class Sample:
+    operation: str
+    latency: float
+    ok: bool
+
+
+@dataclass
+class OperationReport:
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass
+class ScenarioReport:
+    concurrency: int
+    duration_s: float
+    requests: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    error_rate: float
+    lock_rate: float
+    operations: dict[str, OperationReport]
+
+
+def _percentile(latencies: list[float], fraction: float) -> float:
+    if not latencies:
+        return 0.0
+    ordered = sorted(latencies)
+    return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 3)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database: Path, port: int, workers: int, log: BinaryIO, env: dict[str, str]) -> subprocess.Popen[bytes]:
+    command = [
+        sys.executable, "-m", "uvicorn", "ul_packing.main:app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--no-access-log",
+    ]  # fmt: skip
+    server_env = {**os.environ, "DATABASE_URL": f"sqlite+pysqlite:///{database}", **env}
+    # Create the schema once up front rather than in every worker's startup.
+    subprocess.run(
+        [sys.executable, "-m", "ul_packing.cli", "migrate"], env=server_env, stdout=log, stderr=subprocess.STDOUT, check=True
+    )
+    return subprocess.Popen(command, env=server_env, stdout=log, stderr=subprocess.STDOUT)
+
+
+async def wait_until_ready(client: httpx.AsyncClient, server: subprocess.Popen[bytes], timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with status {server.returncode}")
+        try:
+            if (await client.get("/api/v1/lists")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+async def seed(client: httpx.AsyncClient, lists: int, items_per_list: int, rng: random.Random) -> Pool:
+    pool = Pool()
+    for index in range(lists):
+        created = (await client.post("/api/v1/lists", json={"title": f"Load list {index}"})).json()["data"]
+        response = await client.post(
+            f"/api/v1/lists/{created['id']}/items:batch", json=[_item(rng) for _ in range(items_per_list)]
+        )
+        response.raise_for_status()
+        detail = (await client.get(f"/api/v1/lists/{created['id']}")).json()["data"]
+        # Every fourth list takes the writes so reads mostly see stable lists.
+        if index % 4 == 0:
+            pool.edit_list_ids.append(created["id"])
+        pool.list_ids.append(created["id"])
+        pool.share_tokens.append(created["share_token"])
+        pool.items[created["id"]] = [item["id"] for item in detail["items"]]
+    return pool
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, pool: Pool, weights: dict[Operation, int], concurrency: int, duration: float, seed: int
+) -> tuple[list[Sample], float]:
+    operations = list(weights)
+    samples: list[Sample] = []
+    deadline = time.perf_counter() + duration
+
+    async def user(rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            [operation] = rng.choices(operations, weights=list(weights.values()))
+            started = time.perf_counter()
+            try:
+                ok = (await operation(client, pool, rng)).status_code < 500
+            except httpx.TransportError:
+                ok = False
+            samples.append(Sample(operation.__name__, time.perf_counter() - started, ok))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user(random.Random(seed + index)) for index in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples: list[Sample], elapsed: float, concurrency: int, locked: int) -> ScenarioReport:
+    latencies = [sample.latency for sample in samples]
+    by_operation: dict[str, list[Sample]] = {}
+    for sample in samples:
+        by_operation.setdefault(sample.operation, []).append(sample)
+    total = len(samples) or 1
+    return ScenarioReport(
+        concurrency=concurrency,
+        duration_s=round(elapsed, 3),
+        requests=len(samples),
+        throughput_rps=round(len(samples) / elapsed, 1),
+        p50_ms=_percentile(latencies, 0.50),
+        p95_ms=_percentile(latencies, 0.95),
+        p99_ms=_percentile(latencies, 0.99),
+        error_rate=round(sum(not sample.ok for sample in samples) / total, 4),
+        lock_rate=round(locked / total, 4),
+        operations={
+            name: OperationReport(
+                requests=len(group),
+                errors=sum(not sample.ok for sample in group),
+                p50_ms=_percentile([sample.latency for sample in group], 0.50),
+                p95_ms=_percentile([sample.latency for sample in group], 0.95),
+                p99_ms=_percentile([sample.latency for sample in group], 0.99),
+            )
+            for name, group in sorted(by_operation.items())
+        },
+    )
+
+
+def print_report(name: str, report: ScenarioReport) -> None:
+    print(
+        f"{name}: {report.requests} requests in {report.duration_s:.1f}s, {report.throughput_rps} req/s, "
+        f"p50 {report.p50_ms} ms, p95 {report.p95_ms} ms, p99 {report.p99_ms} ms, "
+        f"errors {report.error_rate:.2%}, locked {report.lock_rate:.2%}"
+    )
+    for operation, stats in report.operations.items():
+        print(
+            f"  {operation:<20} {stats.requests:>7} req  {stats.errors:>5} err  "
+            f"p50 {stats.p50_ms:8.2f}  p95 {stats.p95_ms:8.2f}  p99 {stats.p99_ms:8.2f} ms"
+        )
+
+
+async def run(args: argparse.Namespace, log: Path, port: int, server: subprocess.Popen[bytes]) -> dict[str, ScenarioReport]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    reports: dict[str, ScenarioReport] = {}
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30.0) as client:
+        await wait_until_ready(client, server)
+        pool = await seed(client, args.lists, args.items_per_list, random.Random(args.seed))
+        for name in args.scenario or list(SCENARIOS):
+            log_offset = log.stat().st_size
+            samples, elapsed = await run_scenario(
+                client, pool, SCENARIOS[name], args.concurrency, args.duration, args.seed
+            )
+            with log.open("rb") as server_log:
+                server_log.seek(log_offset)
+                locked = server_log.read().decode(errors="replace").count(LOCKED_MESSAGE)
+            reports[name] = summarize(samples, elapsed, args.concurrency, locked)
+            print_report(name, reports[name])
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="repeatable; default: all")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per scenario")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--lists", type=int, default=SEED_LISTS)
+    parser.add_argument("--items-per-list", type=int, default=SEED_ITEMS_PER_LIST)
+    parser.add_argument("--sqlite-profile", help="SQLITE_PROFILE for the server")
+    parser.add_argument("--database-async", action="store_true", help="run the server with DATABASE_ASYNC=true")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for operation choice")
+    parser.add_argument("--output", type=Path, help="write the reports as JSON")
+    args = parser.parse_args()
+
+    env = {"SEED_SAMPLE_DATA": "false"}
+    if args.sqlite_profile:
+        env["SQLITE_PROFILE"] = args.sqlite_profile
+    if args.database_async:
+        env["DATABASE_ASYNC"] = "true"
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = Path(directory) / "server.log"
+        port = _free_port()
+        with log.open("wb") as log_file:
+            server = start_server(Path(directory) / "load.db", port, args.workers, log_file, env)
+            try:
+                reports = asyncio.run(run(args, log, port, server))
+            except RuntimeError:
+                print(log.read_text(errors="replace")[-4000:], file=sys.stderr)
+                raise
+            finally:
+                server.terminate()
+                server.wait(timeout=10)
+
+    if args.output:
+        settings = {**vars(args), "output": str(args.output)}
+        scenarios = {name: asdict(report) for name, report in reports.items()}
+        args.output.write_text(json.dumps({"settings": settings, "scenarios": scenarios}, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,14 @@
-import { useQuery } from '@tanstack/react-query'
+import { keepPreviousData, useInfiniteQuery } from '@tanstack/react-query'
 import { useDraggable } from '@dnd-kit/core'
 import { GripVerticalIcon, PackageIcon } from 'lucide-react'
 
 import { Badge } from '@/components/ui/badge'
+import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { api } from '@/lib/api'
 import { categoryLabel, formatWeight, kindLabel } from '@/lib/format'
 import type { GearListItem, Unit } from '@/lib/types'
-import { useState } from 'react'
+import { useDeferredValue, useState } from 'react'
 
 function DraggableGearItem({ item, unit }: { item: GearListItem; unit: Unit }) {
   const { attributes, listeners, setNodeRef, transform, isDragging } = useDraggable({
@@ -58,26 +59,24 @@ type GearSidebarProps = {
 
 export function GearSidebar({ unit, currentListId }: GearSidebarProps) {
   const [search, setSearch] = useState('')
+  const deferredSearch = useDeferredValue(search.trim())
+  const filters = { q: deferredSearch || undefined }
 
-  const gearQuery = useQuery({
-    queryKey: ['gear-items'],
-    queryFn: () => api.getGearItems(),
+  // The name search runs on the server; pages are loaded on demand.
+  const gearQuery = useInfiniteQuery({
+    queryKey: ['gear-items', filters],
+    queryFn: ({ pageParam }) => api.getGearItems(filters, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+    placeholderData: keepPreviousData,
   })
 
   if (gearQuery.isLoading) return <p className="p-4 text-sm text-muted-foreground">読み込み中...</p>
   if (gearQuery.isError) return <p className="p-4 text-sm text-destructive">ギアの取得に失敗しました。</p>
 
-  const allItems = gearQuery.data ?? []
+  const loadedItems = gearQuery.data?.pages.flatMap((page) => page.data) ?? []
   // Filter out items that belong to the current list
-  const availableItems = allItems.filter((item) => item.list_id !== currentListId)
-
-  const filteredItems = search.trim()
-    ? availableItems.filter(
-        (item) =>
-          item.name.toLowerCase().includes(search.toLowerCase()) ||
-          categoryLabel(item.category).includes(search)
-      )
-    : availableItems
+  const availableItems = loadedItems.filter((item) => item.list_id !== currentListId)
 
   return (
     <div className="flex h-full flex-col">
@@ -94,15 +93,26 @@ export function GearSidebar({ unit, currentListId }: GearSidebarProps) {
         />
       </div>
       <div className="flex-1 space-y-1 overflow-y-auto px-3 pb-3">
-        {filteredItems.length === 0 ? (
+        {availableItems.length === 0 && !gearQuery.hasNextPage ? (
           <p className="py-4 text-center text-xs text-muted-foreground">
-            {availableItems.length === 0 ? 'ギアが登録されていません' : '該当するギアがありません'}
+            {filters.q ? '該当するギアがありません' : 'ギアが登録されていません'}
           </p>
         ) : (
-          filteredItems.map((item) => (
+          availableItems.map((item) => (
             <DraggableGearItem key={item.id} item={item} unit={unit} />
           ))
         )}
+        {gearQuery.hasNextPage ? (
+          <Button
+            variant="ghost"
+            size="sm"
+            className="w-full text-xs"
+            disabled={gearQuery.isFetchingNextPage}
+            onClick={() => gearQuery.fetchNextPage()}
+          >
+            {gearQuery.isFetchingNextPage ? '読み込み中...' : 'さらに読み込む'}
+          </Button>
+        ) : null}
       </div>
     </div>
   )
@@ -1,6 +1,9 @@
 import type {
   ApiErrorBody,
+  Category,
   GearListItem,
+  ItemKind,
+  Page,
   PackingList,
   PackingListDetail,
   SharedPackingList,
@@ -24,8 +27,10 @@ class ApiError extends Error {
 const apiErrorMessage = (error: unknown, fallback: string) =>
   error instanceof ApiError ? error.message : fallback
 
-const request = async <T>(path: string, init?: RequestInit): Promise<T> => {
+const send = async <T>(path: string, init?: RequestInit): Promise<{ data: T; next_cursor?: string | null }> => {
   const response = await fetch(`${API_BASE_URL}${path}`, {
+    // Sends the read-your-writes cookie so reads right after a write hit the primary DB.
+    credentials: 'include',
     ...init,
     headers: {
       'Content-Type': 'application/json',
@@ -33,7 +38,7 @@ const request = async <T>(path: string, init?: RequestInit): Promise<T> => {
     },
   })
 
-  const payload = (await response.json()) as { data?: T; error?: ApiErrorBody }
+  const payload = (await response.json()) as { data?: T; next_cursor?: string | null; error?: ApiErrorBody }
 
   if (!response.ok || payload.error) {
     throw new ApiError(
@@ -48,7 +53,24 @@ const request = async <T>(path: string, init?: RequestInit): Promise<T> => {
     throw new ApiError({ code: 'invalid_response', message: 'API response has no data field' })
   }
 
-  return payload.data
+  return { data: payload.data, next_cursor: payload.next_cursor }
+}
+
+const request = async <T>(path: string, init?: RequestInit): Promise<T> => (await send<T>(path, init)).data
+
+const pagePath = (path: string, cursor?: string | null, filters: Record<string, string | undefined> = {}) => {
+  const params = new URLSearchParams()
+  for (const [name, value] of Object.entries(filters)) {
+    if (value) params.set(name, value)
+  }
+  if (cursor) params.set('cursor', cursor)
+  const query = params.toString()
+  return query ? `${path}?${query}` : path
+}
+
+const requestPage = async <T>(path: string): Promise<Page<T>> => {
+  const payload = await send<T[]>(path)
+  return { data: payload.data, next_cursor: payload.next_cursor ?? null }
 }
 
 const requestWithBody = <T>(path: string, method: 'POST' | 'PATCH', body: object) =>
@@ -73,9 +95,16 @@ export type ItemPayload = {
   notes: string
 }
 
+export type GearItemFilters = {
+  category?: Category
+  kind?: ItemKind
+  q?: string
+}
+
 export const api = {
-  getLists: () => request<PackingList[]>('/api/v1/lists'),
-  getGearItems: () => request<GearListItem[]>('/api/v1/gear-items'),
+  getLists: (cursor?: string | null) => requestPage<PackingList>(pagePath('/api/v1/lists', cursor)),
+  getGearItems: (filters: GearItemFilters = {}, cursor?: string | null) =>
+    requestPage<GearListItem>(pagePath('/api/v1/gear-items', cursor, filters)),
   createGearItem: (payload: ItemPayload) => requestWithBody<GearListItem>('/api/v1/gear-items', 'POST', payload),
   createList: (payload: ListPayload) => requestWithBody<PackingList>('/api/v1/lists', 'POST', payload),
   updateList: (listId: string, payload: ListPayload) => requestWithBody<PackingList>(listPath(listId), 'PATCH', payload),
@@ -56,6 +56,11 @@ export type PackingList = {
   updated_at: string
 }
 
+export type Page<T> = {
+  data: T[]
+  next_cursor: string | null
+}
+
 export type PackingListDetail = PackingList & {
   items: GearItem[]
   summary: Summary
@@ -5,6 +5,7 @@ import { MemoryRouter } from 'react-router-dom'
 
 import { GearPage } from '@/pages/gear-page'
 import { api } from '@/lib/api'
+import type { GearListItem } from '@/lib/types'
 
 vi.mock('@/lib/api', async (importOriginal) => {
   const actual = await importOriginal<typeof import('@/lib/api')>()
@@ -25,6 +26,21 @@ const mockedCreateGearItem = vi.mocked(api.createGearItem)
 const mockedUpdateItem = vi.mocked(api.updateItem)
 const mockedDeleteItem = vi.mocked(api.deleteItem)
 
+const page = (data: GearListItem[], next_cursor: string | null = null) => ({ data, next_cursor })
+
+const gearItem = (id: string, name: string): GearListItem => ({
+  id,
+  list_id: 'list-1',
+  list_title: 'Yari 2D',
+  name,
+  category: 'shelter',
+  kind: 'base',
+  weight_grams: 800,
+  quantity: 1,
+  notes: '',
+  sort_order: 0,
+})
+
 const renderPage = () => {
   const queryClient = new QueryClient({
     defaultOptions: {
@@ -114,7 +130,7 @@ describe('GearPage', () => {
   })
 
   it('shows table data without list links', async () => {
-    mockedGetGearItems.mockResolvedValue([
+    mockedGetGearItems.mockResolvedValue(page([
       {
         id: 'item-1',
         list_id: 'list-1',
@@ -127,7 +143,7 @@ describe('GearPage', () => {
         notes: '',
         sort_order: 0,
       },
-    ])
+    ]))
 
     renderPage()
 
@@ -136,9 +152,42 @@ describe('GearPage', () => {
     expect(screen.queryByRole('link', { name: 'リストを開く' })).not.toBeInTheDocument()
   })
 
+  it('sends the search to the server instead of filtering loaded rows', async () => {
+    const user = userEvent.setup()
+    mockedGetGearItems.mockResolvedValue(page([gearItem('item-1', 'Tent')]))
+
+    renderPage()
+
+    await screen.findByText('Tent')
+    expect(mockedGetGearItems).toHaveBeenLastCalledWith({ category: undefined, kind: undefined, q: undefined }, null)
+    mockedGetGearItems.mockResolvedValue(page([]))
+    await user.type(screen.getByLabelText('ギアを検索'), 'stove')
+
+    await waitFor(() => {
+      expect(mockedGetGearItems).toHaveBeenLastCalledWith({ category: undefined, kind: undefined, q: 'stove' }, null)
+    })
+    expect(await screen.findByText('条件に一致するギアがありません。')).toBeInTheDocument()
+  })
+
+  it('loads the next page of gear on demand', async () => {
+    const user = userEvent.setup()
+    mockedGetGearItems
+      .mockResolvedValueOnce(page([gearItem('item-1', 'Tent')], 'cursor-1'))
+      .mockResolvedValueOnce(page([gearItem('item-2', 'Tarp')]))
+
+    renderPage()
+
+    await user.click(await screen.findByRole('button', { name: 'さらに読み込む' }))
+
+    expect(await screen.findByText('Tarp')).toBeInTheDocument()
+    expect(screen.getByText('Tent')).toBeInTheDocument()
+    expect(mockedGetGearItems).toHaveBeenLastCalledWith({ category: undefined, kind: undefined, q: undefined }, 'cursor-1')
+    expect(screen.queryByRole('button', { name: 'さらに読み込む' })).not.toBeInTheDocument()
+  })
+
   it('can add new gear row via table add button', async () => {
     const user = userEvent.setup()
-    mockedGetGearItems.mockResolvedValue([])
+    mockedGetGearItems.mockResolvedValue(page([]))
 
     renderPage()
 
@@ -162,7 +211,7 @@ describe('GearPage', () => {
 
   it('can enter edit mode and auto-save on row blur', async () => {
     const user = userEvent.setup()
-    mockedGetGearItems.mockResolvedValue([
+    mockedGetGearItems.mockResolvedValue(page([
       {
         id: 'item-1',
         list_id: 'list-1',
@@ -175,7 +224,7 @@ describe('GearPage', () => {
         notes: '',
         sort_order: 0,
       },
-    ])
+    ]))
 
     renderPage()
 
@@ -199,7 +248,7 @@ describe('GearPage', () => {
 
   it('keeps edit mode and shows error when auto-save fails', async () => {
     const user = userEvent.setup()
-    mockedGetGearItems.mockResolvedValue([
+    mockedGetGearItems.mockResolvedValue(page([
       {
         id: 'item-1',
         list_id: 'list-1',
@@ -212,7 +261,7 @@ describe('GearPage', () => {
         notes: '',
         sort_order: 0,
       },
-    ])
+    ]))
     mockedUpdateItem.mockRejectedValue(new Error('update failed'))
 
     renderPage()
@@ -232,7 +281,7 @@ describe('GearPage', () => {
 
   it('can delete item', async () => {
     const user = userEvent.setup()
-    mockedGetGearItems.mockResolvedValue([
+    mockedGetGearItems.mockResolvedValue(page([
       {
         id: 'item-1',
         list_id: 'list-1',
@@ -245,7 +294,7 @@ describe('GearPage', () => {
         notes: '',
         sort_order: 0,
       },
-    ])
+    ]))
 
     renderPage()
 
@@ -259,7 +308,7 @@ describe('GearPage', () => {
 
   it('keeps editing same row when validation error exists', async () => {
     const user = userEvent.setup()
-    mockedGetGearItems.mockResolvedValue([
+    mockedGetGearItems.mockResolvedValue(page([
       {
         id: 'item-1',
         list_id: 'list-1',
@@ -284,7 +333,7 @@ describe('GearPage', () => {
         notes: '',
         sort_order: 1,
       },
-    ])
+    ]))
 
     renderPage()
 
@@ -299,7 +348,7 @@ describe('GearPage', () => {
 
   it('focuses clicked cell field immediately', async () => {
     const user = userEvent.setup()
-    mockedGetGearItems.mockResolvedValue([
+    mockedGetGearItems.mockResolvedValue(page([
       {
         id: 'item-1',
         list_id: 'list-1',
@@ -312,7 +361,7 @@ describe('GearPage', () => {
         notes: 'memo',
         sort_order: 0,
       },
-    ])
+    ]))
 
     renderPage()
 
@@ -21,6 +21,17 @@ vi.mock('@/lib/api', async (importOriginal) => {
 const mockedGetLists = vi.mocked(api.getLists)
 const mockedCreateList = vi.mocked(api.createList)
 
+const packingList = (id: string, title: string) => ({
+  id,
+  title,
+  description: '2 days',
+  unit: 'g' as const,
+  share_token: '',
+  is_shared: false,
+  created_at: '',
+  updated_at: '',
+})
+
 const renderPage = () => {
   const queryClient = new QueryClient({
     defaultOptions: {
@@ -58,18 +69,7 @@ describe('ListsPage', () => {
   })
 
   it('shows packing lists only', async () => {
-    mockedGetLists.mockResolvedValue([
-      {
-        id: 'list-1',
-        title: 'Yari 2D',
-        description: '2 days',
-        unit: 'g',
-        share_token: '',
-        is_shared: false,
-        created_at: '',
-        updated_at: '',
-      },
-    ])
+    mockedGetLists.mockResolvedValue({ data: [packingList('list-1', 'Yari 2D')], next_cursor: null })
 
     renderPage()
 
@@ -80,8 +80,24 @@ describe('ListsPage', () => {
     expect(screen.queryByText('マイギア')).not.toBeInTheDocument()
   })
 
+  it('loads the next page of packing lists on demand', async () => {
+    const user = userEvent.setup()
+    mockedGetLists
+      .mockResolvedValueOnce({ data: [packingList('list-1', 'Yari 2D')], next_cursor: 'cursor-1' })
+      .mockResolvedValueOnce({ data: [packingList('list-2', 'Kita 3D')], next_cursor: null })
+
+    renderPage()
+
+    await user.click(await screen.findByRole('button', { name: 'さらに読み込む' }))
+
+    expect(await screen.findByText('Kita 3D')).toBeInTheDocument()
+    expect(screen.getByText('Yari 2D')).toBeInTheDocument()
+    expect(mockedGetLists).toHaveBeenLastCalledWith('cursor-1')
+    expect(screen.queryByRole('button', { name: 'さらに読み込む' })).not.toBeInTheDocument()
+  })
+
   it('shows empty packing list helper text', async () => {
-    mockedGetLists.mockResolvedValue([])
+    mockedGetLists.mockResolvedValue({ data: [], next_cursor: null })
 
     renderPage()
 
@@ -90,7 +106,7 @@ describe('ListsPage', () => {
 
   it('opens create list dialog from packing lists card action', async () => {
     const user = userEvent.setup()
-    mockedGetLists.mockResolvedValue([])
+    mockedGetLists.mockResolvedValue({ data: [], next_cursor: null })
 
     renderPage()
 
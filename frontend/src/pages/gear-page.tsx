@@ -1,5 +1,5 @@
-import { useEffect, useRef, useState } from 'react'
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
+import { useDeferredValue, useEffect, useRef, useState } from 'react'
+import { keepPreviousData, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { Trash2Icon } from 'lucide-react'
 import { toast } from 'sonner'
 
@@ -34,8 +34,8 @@ import {
 } from '@/components/ui/table'
 import { categoryOptions, itemKindOptions } from '@/lib/constants'
 import { categoryLabel, kindLabel } from '@/lib/format'
-import { api, apiErrorMessage } from '@/lib/api'
-import type { GearListItem, ItemKind } from '@/lib/types'
+import { api, apiErrorMessage, type GearItemFilters } from '@/lib/api'
+import type { Category, GearListItem, ItemKind } from '@/lib/types'
 
 type ItemDraft = {
   name: string
@@ -103,7 +103,26 @@ export function GearPage() {
   const categoryTriggerRef = useRef<HTMLButtonElement | null>(null)
   const kindTriggerRef = useRef<HTMLButtonElement | null>(null)
 
-  const gearItemsQuery = useQuery({ queryKey: ['gear-items'], queryFn: api.getGearItems })
+  const [search, setSearch] = useState('')
+  const [categoryFilter, setCategoryFilter] = useState<Category | 'all'>('all')
+  const [kindFilter, setKindFilter] = useState<ItemKind | 'all'>('all')
+  const deferredSearch = useDeferredValue(search.trim())
+
+  // Filtering happens on the server; the table only holds the pages loaded so far.
+  const gearFilters: GearItemFilters = {
+    category: categoryFilter === 'all' ? undefined : categoryFilter,
+    kind: kindFilter === 'all' ? undefined : kindFilter,
+    q: deferredSearch || undefined,
+  }
+  const isFiltered = Boolean(gearFilters.category || gearFilters.kind || gearFilters.q)
+  const gearItemsQuery = useInfiniteQuery({
+    queryKey: ['gear-items', gearFilters],
+    queryFn: ({ pageParam }) => api.getGearItems(gearFilters, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+    placeholderData: keepPreviousData,
+  })
+  const gearItems = gearItemsQuery.data?.pages.flatMap((page) => page.data)
   const invalidateQueries = async () => {
     await queryClient.invalidateQueries({ queryKey: ['gear-items'] })
     await queryClient.invalidateQueries({ queryKey: ['lists'] })
@@ -181,13 +200,48 @@ export function GearPage() {
       <div className="mb-4">
         <h1 className="text-2xl font-semibold tracking-tight">マイギア</h1>
       </div>
+      <div className="mb-3 flex flex-wrap items-center gap-2">
+        <Input
+          aria-label="ギアを検索"
+          placeholder="名前で検索..."
+          value={search}
+          onChange={(event) => setSearch(event.target.value)}
+          className="w-56"
+        />
+        <Select value={categoryFilter} onValueChange={(value) => setCategoryFilter(value as Category | 'all')}>
+          <SelectTrigger aria-label="カテゴリで絞り込み" className="w-40">
+            <SelectValue />
+          </SelectTrigger>
+          <SelectContent>
+            <SelectItem value="all">すべてのカテゴリ</SelectItem>
+            {categoryOptions.map((option) => (
+              <SelectItem key={option.value} value={option.value}>
+                {option.label}
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+        <Select value={kindFilter} onValueChange={(value) => setKindFilter(value as ItemKind | 'all')}>
+          <SelectTrigger aria-label="種別で絞り込み" className="w-32">
+            <SelectValue />
+          </SelectTrigger>
+          <SelectContent>
+            <SelectItem value="all">すべての種別</SelectItem>
+            {itemKindOptions.map((option) => (
+              <SelectItem key={option.value} value={option.value}>
+                {option.label}
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+      </div>
       <div>
         {gearItemsQuery.isLoading ? <p>読み込み中...</p> : null}
         {gearItemsQuery.isError ? (
           <p className="text-destructive">ギア一覧の読み込みに失敗しました。</p>
         ) : null}
-        {gearItemsQuery.data?.length === 0 ? <p>まだギアがありません。</p> : null}
-        {gearItemsQuery.data ? (
+        {gearItems?.length === 0 ? <p>{isFiltered ? '条件に一致するギアがありません。' : 'まだギアがありません。'}</p> : null}
+        {gearItems ? (
           <Table className="table-fixed">
             <TableHeader>
               <TableRow>
@@ -347,7 +401,7 @@ export function GearPage() {
                   </TableCell>
                 </TableRow>
               ) : null}
-              {(gearItemsQuery.data ?? []).map((item) => (
+              {gearItems.map((item) => (
                 <TableRow
                   key={item.id}
                   ref={editingItemId === item.id ? editingRowRef : null}
@@ -533,6 +587,18 @@ export function GearPage() {
             </TableBody>
           </Table>
         ) : null}
+        {gearItemsQuery.hasNextPage ? (
+          <div className="mt-3 flex justify-center">
+            <Button
+              variant="outline"
+              size="sm"
+              disabled={gearItemsQuery.isFetchingNextPage}
+              onClick={() => gearItemsQuery.fetchNextPage()}
+            >
+              {gearItemsQuery.isFetchingNextPage ? '読み込み中...' : 'さらに読み込む'}
+            </Button>
+          </div>
+        ) : null}
       </div>
 
       <AlertDialog
@@ -1,5 +1,5 @@
 import { useState } from 'react'
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { useNavigate } from 'react-router-dom'
 import { toast } from 'sonner'
 
@@ -28,7 +28,13 @@ export function ListsPage() {
   const queryClient = useQueryClient()
   const [isCreateListOpen, setIsCreateListOpen] = useState(false)
 
-  const listQuery = useQuery({ queryKey: ['lists'], queryFn: api.getLists })
+  const listQuery = useInfiniteQuery({
+    queryKey: ['lists'],
+    queryFn: ({ pageParam }) => api.getLists(pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
+  })
+  const lists = listQuery.data?.pages.flatMap((page) => page.data)
   const createListMutation = useMutation({
     mutationFn: api.createList,
     onSuccess: async (list) => {
@@ -47,7 +53,7 @@ export function ListsPage() {
       <div>
         {listQuery.isLoading ? <p>読み込み中...</p> : null}
         {listQuery.isError ? <p className="text-destructive">リストの読み込みに失敗しました。</p> : null}
-        {listQuery.data?.length === 0 ? (
+        {lists?.length === 0 ? (
           <div className="grid justify-items-center gap-3 py-6 text-center">
             <p className="text-sm text-muted-foreground">
               まだパッキングリストがありません。最初のリストを作成しましょう。
@@ -57,7 +63,7 @@ export function ListsPage() {
             </Button>
           </div>
         ) : null}
-        {listQuery.data && listQuery.data.length > 0 ? (
+        {lists && lists.length > 0 ? (
           <Table className="[&_td]:py-3">
             <TableHeader>
               <TableRow>
@@ -73,7 +79,7 @@ export function ListsPage() {
                   </DialogTrigger>
                 </TableCell>
               </TableRow>
-              {listQuery.data.map((list) => (
+              {lists.map((list) => (
                 <TableRow
                   key={list.id}
                   tabIndex={0}
@@ -92,6 +98,18 @@ export function ListsPage() {
             </TableBody>
           </Table>
         ) : null}
+        {listQuery.hasNextPage ? (
+          <div className="mt-3 flex justify-center">
+            <Button
+              variant="outline"
+              size="sm"
+              disabled={listQuery.isFetchingNextPage}
+              onClick={() => listQuery.fetchNextPage()}
+            >
+              {listQuery.isFetchingNextPage ? '読み込み中...' : 'さらに読み込む'}
+            </Button>
+          </div>
+        ) : null}
       </div>
       <DialogContent>
         <DialogHeader>
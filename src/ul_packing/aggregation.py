@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ul_packing.models import GearItem
+
+Breakdown = Literal["kind", "category"]
+
+_BREAKDOWN_COLUMNS = {
+    "kind": GearItem.kind,
+    "category": GearItem.category,
+}
+
+
+@dataclass(frozen=True)
+class WeightBucket:
+    key: str
+    weight_g: int
+    item_count: int
+
+
+def aggregate_weights(db: Session, list_ids: Sequence[str], breakdown: Breakdown) -> dict[str, list[WeightBucket]]:
+    """Sum ``weight_grams * quantity`` per list and ``breakdown`` bucket in a single grouped query.
+
+    Buckets are ordered heaviest first; lists without items map to an empty list.
+    """
+    result: dict[str, list[WeightBucket]] = {list_id: [] for list_id in list_ids}
+    if not list_ids:
+        return result
+
+    column = _BREAKDOWN_COLUMNS[breakdown]
+    weight = func.sum(GearItem.weight_grams * GearItem.quantity)
+    rows = db.execute(
+        select(GearItem.list_id, column, weight, func.count(GearItem.id))
+        .where(GearItem.list_id.in_(list_ids))
+        .group_by(GearItem.list_id, column)
+        .order_by(GearItem.list_id, weight.desc(), column)
+    ).all()
+    for list_id, key, weight_g, item_count in rows:
+        result[list_id].append(WeightBucket(key=key.value, weight_g=weight_g, item_count=item_count))
+    return result
+
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from ul_packing.config import settings
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe LRU cache whose entries also expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[K, V], bool]) -> int:
+        with self._lock:
+            stale = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+@dataclass(frozen=True)
+class CachedSharedView:
+    list_id: str
+    etag: str
+    body: bytes
+
+
+NOT_FOUND = CachedSharedView(list_id="", etag="", body=b"")
+
+
+class SharedViewCache:
+    """Serialized ``/shared/{share_token}`` responses keyed by share token.
+
+    Misses are cached as ``NOT_FOUND`` for a shorter TTL so unknown tokens do not
+    reach the database on every probe. The cache is per process: writes invalidate
+    it locally, other workers converge within the TTL.
+
+    A reader takes ``generation`` before its database read and passes it to
+    ``store``; any invalidation in between bumps the generation and the possibly
+    stale result is not cached. The counter is cache-wide because the list id is
+    only known after the read. With ``invalidation_hold`` set (read replicas), a
+    list invalidated that recently is not cached either, since the replica may
+    still return the old rows.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float, invalidation_hold: float = 0.0) -> None:
+        self.entries: TTLCache[str, CachedSharedView] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.negative_ttl = negative_ttl
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._recently_invalidated: TTLCache[str, bool] | None = (
+            TTLCache(maxsize=max(maxsize, 1024), ttl=invalidation_hold) if invalidation_hold > 0 else None
+        )
+
+    def get(self, share_token: str) -> CachedSharedView | None:
+        return self.entries.get(share_token)
+
+    def store(self, share_token: str, view: CachedSharedView, generation: int) -> bool:
+        """Cache ``view`` unless an invalidation happened since ``generation`` was read."""
+        with self._lock:
+            if generation != self.generation:
+                return False
+            if self._recently_invalidated is not None and self._recently_invalidated.get(view.list_id):
+                return False
+            self.entries.set(share_token, view)
+            return True
+
+    def store_not_found(self, share_token: str, generation: int) -> bool:
+        with self._lock:
+            if generation != self.generation:
+                return False
+            self.entries.set(share_token, NOT_FOUND, ttl=self.negative_ttl)
+            return True
+
+    def invalidate_list(self, list_id: str) -> None:
+        with self._lock:
+            self.generation += 1
+            if self._recently_invalidated is not None:
+                self._recently_invalidated.set(list_id, True)
+            self.entries.delete_where(lambda _, view: view.list_id == list_id)
+
+    def invalidate_token(self, share_token: str) -> None:
+        with self._lock:
+            self.generation += 1
+            self.entries.delete(share_token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self.entries.clear()
+            if self._recently_invalidated is not None:
+                self._recently_invalidated.clear()
+
+
+shared_view_cache = SharedViewCache(
+    maxsize=settings.shared_cache_size,
+    ttl=settings.shared_cache_ttl,
+    negative_ttl=settings.shared_cache_negative_ttl,
+    invalidation_hold=settings.read_your_writes_seconds if settings.database_replica_url else 0.0,
+)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Sequence
+
+from ul_packing.db import SessionLocal, engine
+from ul_packing.importing import IMPORT_CHUNK_SIZE, ImportReport, import_items
+from ul_packing.migrations import HEAD_VERSION, current_version, upgrade_schema
+from ul_packing.models import PackingList
+from ul_packing.services import check_list_summaries
+from ul_packing.synthetic import SYNTHETIC_BATCH_ROWS, SyntheticReport, generate_synthetic_data
+
+
+def _migrate(_: argparse.Namespace) -> int:
+    applied = upgrade_schema(engine)
+    if applied:
+        print(f"Applied migrations: {', '.join(str(version) for version in applied)}")
+    else:
+        print(f"Schema is up to date (version {HEAD_VERSION})")
+    return 0
+
+
+def _schema_version(_: argparse.Namespace) -> int:
+    with engine.connect() as conn:
+        version = current_version(conn)
+    print(f"current: {'empty' if version is None else version}, head: {HEAD_VERSION}")
+    return 0
+
+
+def _check_summaries(args: argparse.Namespace) -> int:
+    with SessionLocal() as db:
+        inconsistent = check_list_summaries(db, repair=args.repair)
+    for list_id in inconsistent:
+        print(list_id)
+    if not inconsistent:
+        print("All list summaries are consistent")
+        return 0
+    print(f"{len(inconsistent)} list(s) {'rebuilt' if args.repair else 'inconsistent'}")
+    return 0 if args.repair else 1
+
+
+def _print_import_progress(report: ImportReport) -> None:
+    print(f"chunk {report.chunks}: {report.imported} imported, {report.failed} failed", file=sys.stderr)
+
+
+def _import(args: argparse.Namespace) -> int:
+    with SessionLocal() as db:
+        if db.get(PackingList, args.list_id) is None:
+            print(f"List not found: {args.list_id}", file=sys.stderr)
+            return 1
+        with args.file as lines:
+            report = import_items(
+                db,
+                args.list_id,
+                lines,
+                import_format=args.format,
+                chunk_size=args.chunk_size,
+                progress=_print_import_progress,
+            )
+    for failure in report.failures:
+        print(f"line {failure.line}: {failure.message}")
+    print(f"{report.imported} item(s) imported, {report.failed} failed")
+    return 0 if not report.failed else 1
+
+
+def _print_generate_progress(report: SyntheticReport) -> None:
+    print(f"batch {report.batches}: {report.lists} lists, {report.items} items", file=sys.stderr)
+
+
+def _generate(args: argparse.Namespace) -> int:
+    if not 0 <= args.min_items <= args.max_items:
+        print("--min-items must be between 0 and --max-items", file=sys.stderr)
+        return 2
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        report = generate_synthetic_data(
+            db,
+            args.lists,
+            min_items=args.min_items,
+            max_items=args.max_items,
+            seed=args.seed,
+            batch_rows=args.batch_rows,
+            progress=_print_generate_progress,
+        )
+    print(f"Generated {report.lists} list(s) and {report.items} item(s) in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="ul-packing", description="UL Packing maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subparsers.add_parser("migrate", help="Apply pending schema migrations")
+    migrate.set_defaults(handler=_migrate)
+
+    version = subparsers.add_parser("schema-version", help="Show the current and head schema versions")
+    version.set_defaults(handler=_schema_version)
+
+    check = subparsers.add_parser("check-summaries", help="Verify stored list summaries against their items")
+    check.add_argument("--repair", action="store_true", help="Rebuild summaries that have drifted")
+    check.set_defaults(handler=_check_summaries)
+
+    import_cmd = subparsers.add_parser("import", help="Import items from a CSV or LighterPack export into a list")
+    import_cmd.add_argument("list_id", help="Target list id")
+    import_cmd.add_argument(
+        "file",
+        type=argparse.FileType("r", encoding="utf-8-sig", errors="replace"),
+        help="CSV file to import ('-' for stdin)",
+    )
+    import_cmd.add_argument("--format", choices=["csv", "lighterpack"], default="csv", help="Input format")
+    import_cmd.add_argument(
+        "--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="Rows inserted and committed per transaction"
+    )
+    import_cmd.set_defaults(handler=_import)
+
+    generate = subparsers.add_parser("generate", help="Insert synthetic lists and items for benchmarks and capacity tests")
+    generate.add_argument("--lists", type=int, required=True, help="Number of lists to create")
+    generate.add_argument("--min-items", type=int, default=10, help="Fewest items per list")
+    generate.add_argument("--max-items", type=int, default=50, help="Most items per list")
+    generate.add_argument("--seed", type=int, default=0, help="Random seed; the same seed produces the same rows")
+    generate.add_argument(
+        "--batch-rows", type=int, default=SYNTHETIC_BATCH_ROWS, help="List and item rows inserted and committed per transaction"
+    )
+    generate.set_defaults(handler=_generate)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
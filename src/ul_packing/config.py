@@ -29,11 +29,95 @@ def _parse_bool_env(name: str, default: bool = False) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _parse_int_env(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    return int(raw)
+
+
+def _parse_float_env(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    return float(raw)
+
+
+def _parse_optional_int_env(name: str) -> int | None:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return None
+    return int(raw)
+
+
+def _parse_optional_bool_env(name: str) -> bool | None:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return None
+    return _parse_bool_env(name)
+
+
+# Connect-time PRAGMAs per SQLITE_PROFILE. "default" keeps SQLite's own defaults.
+SQLITE_PROFILES: dict[str, dict[str, str | int | bool]] = {
+    "default": {},
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,  # negative = KiB, i.e. 64 MiB of page cache
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "foreign_keys": True,
+    },
+}
+
+
 @dataclass(frozen=True)
 class Settings:
     database_url: str = os.getenv("DATABASE_URL", "sqlite+pysqlite:///./data/app.db")
+    database_replica_url: str | None = os.getenv("DATABASE_REPLICA_URL") or None
+    read_your_writes_seconds: float = _parse_float_env("READ_YOUR_WRITES_SECONDS", default=5.0)
+    database_async: bool = _parse_bool_env("DATABASE_ASYNC", default=False)
+    sqlite_profile: str = os.getenv("SQLITE_PROFILE", "default")
+    sqlite_journal_mode: str | None = os.getenv("SQLITE_JOURNAL_MODE")
+    sqlite_synchronous: str | None = os.getenv("SQLITE_SYNCHRONOUS")
+    sqlite_cache_size: int | None = _parse_optional_int_env("SQLITE_CACHE_SIZE")
+    sqlite_mmap_size: int | None = _parse_optional_int_env("SQLITE_MMAP_SIZE")
+    sqlite_temp_store: str | None = os.getenv("SQLITE_TEMP_STORE")
+    sqlite_busy_timeout: int | None = _parse_optional_int_env("SQLITE_BUSY_TIMEOUT")
+    sqlite_foreign_keys: bool | None = _parse_optional_bool_env("SQLITE_FOREIGN_KEYS")
+    db_pool_size: int = _parse_int_env("DB_POOL_SIZE", default=5)
+    db_max_overflow: int = _parse_int_env("DB_MAX_OVERFLOW", default=10)
+    db_pool_timeout: float = _parse_float_env("DB_POOL_TIMEOUT", default=30.0)
+    db_pool_recycle: int = _parse_int_env("DB_POOL_RECYCLE", default=-1)
+    db_pool_pre_ping: bool = _parse_bool_env("DB_POOL_PRE_PING", default=False)
+    db_statement_timeout_ms: int | None = _parse_optional_int_env("DB_STATEMENT_TIMEOUT_MS")
+    query_budget_strict: bool = _parse_bool_env("QUERY_BUDGET_STRICT", default=False)
+    metrics_enabled: bool = _parse_bool_env("METRICS_ENABLED", default=False)
+    internal_endpoints: bool = _parse_bool_env("INTERNAL_ENDPOINTS", default=False)
     allowed_origins: list[str] = field(default_factory=_parse_allowed_origins)
     seed_sample_data: bool = _parse_bool_env("SEED_SAMPLE_DATA", default=False)
+    shared_cache_max_age: int = _parse_int_env("SHARED_CACHE_MAX_AGE", default=60)
+    shared_cache_size: int = _parse_int_env("SHARED_CACHE_SIZE", default=1024)
+    shared_cache_ttl: float = _parse_float_env("SHARED_CACHE_TTL", default=60.0)
+    shared_cache_negative_ttl: float = _parse_float_env("SHARED_CACHE_NEGATIVE_TTL", default=5.0)
+
+    def sqlite_pragmas(self) -> dict[str, str | int | bool]:
+        """PRAGMAs of ``sqlite_profile`` with the individual ``SQLITE_*`` overrides applied."""
+        if self.sqlite_profile not in SQLITE_PROFILES:
+            raise ValueError(f"Unknown SQLITE_PROFILE {self.sqlite_profile!r}; expected one of {', '.join(SQLITE_PROFILES)}")
+        pragmas = dict(SQLITE_PROFILES[self.sqlite_profile])
+        overrides = {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "cache_size": self.sqlite_cache_size,
+            "mmap_size": self.sqlite_mmap_size,
+            "temp_store": self.sqlite_temp_store,
+            "busy_timeout": self.sqlite_busy_timeout,
+            "foreign_keys": self.sqlite_foreign_keys,
+        }
+        pragmas.update({name: value for name, value in overrides.items() if value is not None})
+        return pragmas
 
 
 settings = Settings()
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator, Mapping
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import make_url
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from starlette.requests import Request
 
 from ul_packing.config import settings
+from ul_packing.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
 
 
 class Base(DeclarativeBase):
@@ -23,14 +27,121 @@ def _ensure_sqlite_parent_dir(database_url: str) -> None:
     Path(url.database).parent.mkdir(parents=True, exist_ok=True)
 
 
-_ensure_sqlite_parent_dir(settings.database_url)
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def to_async_url(database_url: str) -> URL:
+    """Swap the driver of a sync database URL for its async counterpart (aiosqlite / asyncpg)."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"Async mode is not supported for {backend} databases")
+    return url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Mapping[str, str | int | bool]) -> None:
+    """Run ``PRAGMA name = value`` on every new DBAPI connection of ``engine``."""
+    if not pragmas:
+        return
+    statements = [
+        f"PRAGMA {name} = {('ON' if value else 'OFF') if isinstance(value, bool) else value}"
+        for name, value in pragmas.items()
+    ]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def engine_options(database_url: str | URL, *, is_async: bool = False) -> dict[str, Any]:
+    """``create_engine`` keyword arguments for the pool and statement-timeout settings."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    options: dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping, "pool_recycle": settings.db_pool_recycle}
+    connect_args: dict[str, Any] = {}
+    if backend == "sqlite":
+        if not is_async:
+            connect_args["check_same_thread"] = False
+        if url.database in (None, "", ":memory:"):
+            # In-memory databases keep SQLAlchemy's single-connection pools.
+            return {**options, "connect_args": connect_args}
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    if settings.db_statement_timeout_ms is not None and backend == "postgresql":
+        if is_async:
+            connect_args["server_settings"] = {"statement_timeout": str(settings.db_statement_timeout_ms)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    options["connect_args"] = connect_args
+    return options
+
+
+def _create_sync_engine(database_url: str) -> Engine:
+    _ensure_sqlite_parent_dir(database_url)
+    sync_engine = create_engine(database_url, **engine_options(database_url))
+    if sync_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(sync_engine, settings.sqlite_pragmas())
+    return sync_engine
+
+
+def _create_async_engine(database_url: str) -> AsyncEngine:
+    async_url = to_async_url(database_url)
+    created = create_async_engine(async_url, **engine_options(async_url, is_async=True))
+    if created.dialect.name == "sqlite":
+        apply_sqlite_pragmas(created.sync_engine, settings.sqlite_pragmas())
+    return created
+
+
 is_sqlite = settings.database_url.startswith("sqlite")
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if is_sqlite else {},
-)
+engine = _create_sync_engine(settings.database_url)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+# The sync engine stays available in async mode for migrations and the CLI.
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+if settings.database_async:
+    async_engine = _create_async_engine(settings.database_url)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False)
+
+# Optional read replica, used by read-only GET routes through get_read_db.
+replica_engine: Engine | None = None
+ReplicaSessionLocal: sessionmaker[Session] | None = None
+async_replica_engine: AsyncEngine | None = None
+AsyncReplicaSessionLocal: async_sessionmaker[AsyncSession] | None = None
+if settings.database_replica_url:
+    if settings.database_async:
+        async_replica_engine = _create_async_engine(settings.database_replica_url)
+        AsyncReplicaSessionLocal = async_sessionmaker(bind=async_replica_engine, autoflush=False)
+    else:
+        replica_engine = _create_sync_engine(settings.database_replica_url)
+        ReplicaSessionLocal = sessionmaker(bind=replica_engine, autoflush=False, autocommit=False)
+
+
+def named_engines() -> dict[str, Engine]:
+    """Every configured engine by role; async engines are reported through their sync side."""
+    engines = {"primary": engine}
+    if async_engine is not None:
+        engines["primary_async"] = async_engine.sync_engine
+    if replica_engine is not None:
+        engines["replica"] = replica_engine
+    if async_replica_engine is not None:
+        engines["replica_async"] = async_replica_engine.sync_engine
+    return engines
+
+
+def _reads_from_primary(request: Request) -> bool:
+    # Set by the read-your-writes middleware in main.py, which owns the cookie.
+    return getattr(request.state, "read_primary", False)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -38,3 +149,32 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    if AsyncSessionLocal is None:
+        raise RuntimeError("DATABASE_ASYNC is not enabled")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """Session for read-only routes: the replica, or the primary inside the read-your-writes window."""
+    factory = SessionLocal
+    if ReplicaSessionLocal is not None and not _reads_from_primary(request):
+        factory = ReplicaSessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    factory = AsyncSessionLocal
+    if AsyncReplicaSessionLocal is not None and not _reads_from_primary(request):
+        factory = AsyncReplicaSessionLocal
+    if factory is None:
+        raise RuntimeError("DATABASE_ASYNC is not enabled")
+    async with factory() as db:
+        yield db
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any, Literal
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ul_packing.models import GearItem, PackingList
+
+ExportFormat = Literal["ndjson", "csv"]
+ExportResource = Literal["gear-items", "lists"]
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _gear_items_query() -> Select[Any]:
+    return (
+        select(
+            GearItem.id,
+            GearItem.list_id,
+            PackingList.title.label("list_title"),
+            GearItem.name,
+            GearItem.category,
+            GearItem.kind,
+            GearItem.weight_grams,
+            GearItem.quantity,
+            GearItem.notes,
+            GearItem.sort_order,
+        )
+        .join(PackingList, GearItem.list_id == PackingList.id)
+        .order_by(GearItem.list_id, GearItem.sort_order, GearItem.id)
+    )
+
+
+def _lists_query() -> Select[Any]:
+    return select(
+        PackingList.id,
+        PackingList.title,
+        PackingList.description,
+        PackingList.unit,
+        PackingList.share_token,
+        PackingList.is_shared,
+        PackingList.created_at,
+        PackingList.updated_at,
+    ).order_by(PackingList.created_at, PackingList.id)
+
+
+_EXPORT_QUERIES = {
+    "gear-items": _gear_items_query,
+    "lists": _lists_query,
+}
+
+
+def _to_json_value(value: object) -> object:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _to_rows(partition: Sequence[Sequence[object]]) -> list[list[object]]:
+    return [[_to_json_value(value) for value in row] for row in partition]
+
+
+def iter_export_batches(
+    db: Session,
+    resource: ExportResource,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> tuple[list[str], Iterator[Sequence[Sequence[object]]]]:
+    """Return the column names and an iterator of row batches fetched with ``yield_per``.
+
+    Rows are plain column tuples, so no ORM objects accumulate in the session while
+    the export is streamed.
+    """
+    stmt = _EXPORT_QUERIES[resource]().execution_options(yield_per=batch_size)
+    result = db.execute(stmt)
+    columns = list(result.keys())
+
+    def batches() -> Iterator[Sequence[Sequence[object]]]:
+        try:
+            for partition in result.partitions():
+                yield _to_rows(partition)
+        finally:
+            result.close()
+
+    return columns, batches()
+
+
+def _ndjson_chunk(columns: list[str], batch: Sequence[Sequence[object]]) -> str:
+    return "".join(
+        json.dumps(dict(zip(columns, row, strict=True)), ensure_ascii=False, separators=(",", ":")) + "\n"
+        for row in batch
+    )
+
+
+def _csv_chunk(rows: Iterable[Sequence[object]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def stream_ndjson(columns: list[str], batches: Iterator[Sequence[Sequence[object]]]) -> Iterator[str]:
+    for batch in batches:
+        yield _ndjson_chunk(columns, batch)
+
+
+def stream_csv(columns: list[str], batches: Iterator[Sequence[Sequence[object]]]) -> Iterator[str]:
+    yield _csv_chunk([columns])
+    for batch in batches:
+        yield _csv_chunk(batch)
+
+
+def stream_export(db: Session, resource: ExportResource, export_format: ExportFormat) -> Iterator[str]:
+    columns, batches = iter_export_batches(db, resource)
+    if export_format == "csv":
+        return stream_csv(columns, batches)
+    return stream_ndjson(columns, batches)
+
+
+async def astream_export(
+    db: AsyncSession,
+    resource: ExportResource,
+    export_format: ExportFormat,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[str]:
+    """Async counterpart of ``stream_export`` using a server-side ``AsyncSession.stream`` result."""
+    result = await db.stream(_EXPORT_QUERIES[resource]().execution_options(yield_per=batch_size))
+    columns = list(result.keys())
+    try:
+        if export_format == "csv":
+            yield _csv_chunk([columns])
+        async for partition in result.partitions():
+            rows = _to_rows(partition)
+            yield _csv_chunk(rows) if export_format == "csv" else _ndjson_chunk(columns, rows)
+    finally:
+        await result.close()
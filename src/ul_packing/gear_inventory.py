@@ -1,4 +1,57 @@
 from __future__ import annotations
 
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ul_packing.models import PackingList
+from ul_packing.services import generate_share_token
+
 GEAR_INVENTORY_TITLE = "マイギア一覧"
 GEAR_INVENTORY_DESCRIPTION = "ギア直接登録用に自動作成されたリスト"
+GEAR_INVENTORY_ROLE = "gear_inventory"
+
+_cached_inventory_id: str | None = None
+
+
+def _find_gear_inventory_list(db: Session) -> PackingList | None:
+    return db.execute(
+        select(PackingList).where(PackingList.system_role == GEAR_INVENTORY_ROLE)
+    ).scalar_one_or_none()
+
+
+def get_or_create_gear_inventory_list(db: Session) -> PackingList:
+    """Return the singleton gear inventory list, creating and committing it on first use.
+
+    The id is cached per process so later calls are a primary-key lookup. Concurrent
+    first calls are serialized by the unique index on ``system_role``: the loser rolls
+    back and reads the winner's row.
+    """
+    global _cached_inventory_id
+
+    if _cached_inventory_id is not None:
+        inventory = db.get(PackingList, _cached_inventory_id)
+        if inventory is not None and inventory.system_role == GEAR_INVENTORY_ROLE:
+            return inventory
+
+    inventory = _find_gear_inventory_list(db)
+    if inventory is None:
+        inventory = PackingList(
+            title=GEAR_INVENTORY_TITLE,
+            description=GEAR_INVENTORY_DESCRIPTION,
+            share_token=generate_share_token(),
+            is_shared=False,
+            system_role=GEAR_INVENTORY_ROLE,
+        )
+        db.add(inventory)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            inventory = _find_gear_inventory_list(db)
+            if inventory is None:
+                raise
+        db.refresh(inventory)
+
+    _cached_inventory_id = inventory.id
+    return inventory
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ul_packing.cache import shared_view_cache
+from ul_packing.models import Category, ItemKind
+from ul_packing.ordering import next_sort_order
+from ul_packing.schemas_api import CreateItemIn
+from ul_packing.services import bulk_insert_items
+
+ImportFormat = Literal["csv", "lighterpack"]
+
+IMPORT_CHUNK_SIZE = 500
+IMPORT_SPOOL_MAX_BYTES = 1024 * 1024
+MAX_REPORTED_FAILURES = 100
+
+# LighterPack categories are free text; they are matched on keywords, first hit wins.
+_LIGHTERPACK_CATEGORY_KEYWORDS: tuple[tuple[str, Category], ...] = (
+    ("shelter", Category.SHELTER),
+    ("tent", Category.SHELTER),
+    ("sleep", Category.SLEEPING),
+    ("backpack", Category.BACKPACK),
+    ("pack", Category.BACKPACK),
+    ("cloth", Category.CLOTHING),
+    ("food", Category.FOOD),
+    ("cook", Category.COOKING),
+    ("kitchen", Category.COOKING),
+    ("water", Category.WATER),
+    ("hydration", Category.WATER),
+    ("electronic", Category.ELECTRONICS),
+)
+_GRAMS_PER_UNIT = {
+    "g": 1.0,
+    "gram": 1.0,
+    "kg": 1000.0,
+    "oz": 28.349523125,
+    "ounce": 28.349523125,
+    "lb": 453.59237,
+    "pound": 453.59237,
+}
+_TRUTHY = {"1", "true", "yes", "y", "x", "worn", "consumable"}
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RowFailure:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    failed: int = 0
+    chunks: int = 0
+    failures: list[RowFailure] = field(default_factory=list)
+
+    def record_failure(self, line: int, message: str, rows: int = 1) -> None:
+        # Only the first failures are kept so a hopeless file cannot grow the report without bound.
+        self.failed += rows
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append(RowFailure(line=line, message=message))
+
+
+def _lighterpack_category(value: str) -> Category:
+    lowered = value.strip().lower()
+    for keyword, category in _LIGHTERPACK_CATEGORY_KEYWORDS:
+        if keyword in lowered:
+            return category
+    return Category.OTHER
+
+
+def _lighterpack_weight_grams(weight: str, unit: str) -> int:
+    try:
+        amount = float(weight)
+    except ValueError as exc:
+        raise ImportRowError(f"invalid weight: {weight!r}") from exc
+    factor = _GRAMS_PER_UNIT.get(unit.strip().lower().removesuffix("s") or "g")
+    if factor is None:
+        raise ImportRowError(f"unknown weight unit: {unit!r}")
+    grams = round(amount * factor)
+    # Sub-gram items (a few tenths of an ounce) would round to 0 and fail validation.
+    return max(1, grams) if amount > 0 else grams
+
+
+def _map_lighterpack_row(row: Mapping[str, str]) -> dict[str, Any]:
+    if (row.get("worn") or "").strip().lower() in _TRUTHY:
+        kind = ItemKind.WORN
+    elif (row.get("consumable") or "").strip().lower() in _TRUTHY:
+        kind = ItemKind.CONSUMABLE
+    else:
+        kind = ItemKind.BASE
+    return {
+        "name": row.get("item name") or "",
+        "category": _lighterpack_category(row.get("category") or ""),
+        "weight_grams": _lighterpack_weight_grams(row.get("weight") or "0", row.get("unit") or "g"),
+        "quantity": row.get("qty") or 1,
+        "kind": kind,
+        "notes": row.get("desc") or "",
+    }
+
+
+def _map_csv_row(row: Mapping[str, str]) -> dict[str, Any]:
+    # Same columns as the gear-items CSV export; export-only columns are ignored.
+    mapped: dict[str, Any] = {"name": row.get("name") or "", "weight_grams": row.get("weight_grams")}
+    for column in ("category", "kind", "quantity", "notes"):
+        value = (row.get(column) or "").strip()
+        if value:
+            mapped[column] = value.lower() if column in ("category", "kind") else value
+    return mapped
+
+
+_ROW_MAPPERS: dict[str, Callable[[Mapping[str, str]], dict[str, Any]]] = {
+    "csv": _map_csv_row,
+    "lighterpack": _map_lighterpack_row,
+}
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors())
+
+
+def iter_import_rows(
+    lines: Iterable[str], import_format: ImportFormat
+) -> Iterator[tuple[int, dict[str, Any] | ImportRowError]]:
+    """Parse CSV text lazily, yielding ``(line, item columns)`` or ``(line, error)`` per record.
+
+    Header names are matched case-insensitively. Only one record is held at a time,
+    so the input can be a file object of any size.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    columns = [name.strip().lower() for name in header]
+    mapper = _ROW_MAPPERS[import_format]
+    for record in reader:
+        if not any(value.strip() for value in record):
+            continue
+        line = reader.line_num
+        try:
+            payload = CreateItemIn.model_validate(mapper(dict(zip(columns, record))))
+        except ImportRowError as exc:
+            yield line, exc
+            continue
+        except ValidationError as exc:
+            yield line, ImportRowError(_validation_message(exc))
+            continue
+        yield line, {
+            "name": payload.name.strip(),
+            "category": payload.category,
+            "weight_grams": payload.weight_grams,
+            "quantity": payload.quantity,
+            "kind": payload.kind,
+            "notes": payload.notes.strip(),
+        }
+
+
+def iter_import_chunks(
+    lines: Iterable[str], import_format: ImportFormat, report: ImportReport, chunk_size: int = IMPORT_CHUNK_SIZE
+) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    """Group valid rows into ``(first line, rows)`` chunks of up to ``chunk_size``.
+
+    Invalid rows are recorded in ``report`` and skipped. Nothing here touches the
+    database, so callers may advance the iterator in a worker thread.
+    """
+    chunk: list[dict[str, Any]] = []
+    chunk_first_line = 0
+    for line, row in iter_import_rows(lines, import_format):
+        if isinstance(row, ImportRowError):
+            report.record_failure(line, str(row))
+            continue
+        if not chunk:
+            chunk_first_line = line
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk_first_line, chunk
+            chunk = []
+    if chunk:
+        yield chunk_first_line, chunk
+
+
+def insert_import_chunk(
+    db: Session, list_id: str, first_line: int, rows: list[dict[str, Any]], report: ImportReport
+) -> None:
+    """Insert and commit one chunk; a chunk the database rejects is rolled back on its own."""
+    try:
+        bulk_insert_items(db, list_id, rows, next_sort_order(db, list_id))
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        report.record_failure(first_line, f"chunk rejected by the database: {exc.__class__.__name__}", len(rows))
+    else:
+        report.imported += len(rows)
+        shared_view_cache.invalidate_list(list_id)
+    report.chunks += 1
+
+
+def import_items(
+    db: Session,
+    list_id: str,
+    lines: Iterable[str],
+    import_format: ImportFormat = "csv",
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    progress: Callable[[ImportReport], None] | None = None,
+) -> ImportReport:
+    """Stream rows from ``lines`` into the list, committing every ``chunk_size`` valid rows.
+
+    Invalid rows are recorded in the report and skipped. A chunk the database rejects
+    is rolled back on its own; chunks committed before it stay in place. ``progress``
+    is called after each chunk.
+    """
+    report = ImportReport()
+    for first_line, rows in iter_import_chunks(lines, import_format, report, chunk_size):
+        insert_import_chunk(db, list_id, first_line, rows, report)
+        if progress is not None:
+            progress(report)
+    return report
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("ul_packing.requests")
+
+DEFAULT_QUERY_BUDGET = 8
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class RequestTimings:
+    statements: int = 0
+    db_time: float = 0.0
+    serialization_time: float = 0.0
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar("ul_packing_request_timings", default=None)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current_timings.get()
+
+
+def query_budget(max_statements: int) -> Callable[[EndpointT], EndpointT]:
+    """Declare how many SQL statements a route may run (checked in strict mode)."""
+
+    def decorate(endpoint: EndpointT) -> EndpointT:
+        endpoint.__query_budget__ = max_statements  # type: ignore[attr-defined]
+        return endpoint
+
+    return decorate
+
+
+@contextmanager
+def serialization_timer() -> Iterator[None]:
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.serialization_time += time.perf_counter() - started
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_timings.get() is not None:
+        conn.info.setdefault("ul_packing_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    timings = _current_timings.get()
+    starts = conn.info.get("ul_packing_query_start")
+    if timings is None or not starts:
+        return
+    timings.statements += 1
+    timings.db_time += time.perf_counter() - starts.pop()
+
+
+def instrument_engines() -> None:
+    """Count statements of every engine (async engines included) for the current request."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _server_timing(timings: RequestTimings, total: float) -> str:
+    return (
+        f'db;dur={timings.db_time * 1000:.2f};desc="{timings.statements} queries", '
+        f"serialize;dur={timings.serialization_time * 1000:.2f}, "
+        f"total;dur={total * 1000:.2f}"
+    )
+
+
+class RequestTimingMiddleware:
+    """Adds ``Server-Timing`` and a JSON log line per HTTP request.
+
+    With ``strict`` set, a request whose route ran more statements than its
+    ``query_budget`` raises ``QueryBudgetExceeded`` after the response is sent.
+    """
+
+    def __init__(self, app: ASGIApp, strict: bool = False) -> None:
+        self.app = app
+        self.strict = strict
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", _server_timing(timings, time.perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timings.reset(token)
+            duration = time.perf_counter() - started
+            route = scope.get("route")
+            route_path = getattr(route, "path", None)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    json.dumps(
+                        {
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "route": route_path,
+                            "status": status_code,
+                            "duration_ms": round(duration * 1000, 3),
+                            "db_statements": timings.statements,
+                            "db_ms": round(timings.db_time * 1000, 3),
+                            "serialization_ms": round(timings.serialization_time * 1000, 3),
+                        },
+                        separators=(",", ":"),
+                    )
+                )
+
+        if self.strict and route_path is not None:
+            budget = getattr(scope.get("endpoint"), "__query_budget__", DEFAULT_QUERY_BUDGET)
+            if timings.statements > budget:
+                raise QueryBudgetExceeded(
+                    f"{scope['method']} {route_path} ran {timings.statements} SQL statements (budget {budget})"
+                )
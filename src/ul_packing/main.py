@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -10,38 +12,29 @@ from fastapi.exception_handlers import (
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from ul_packing.config import settings
-from ul_packing.db import Base, SessionLocal, engine
+from ul_packing.db import SessionLocal, engine
+from ul_packing.instrumentation import RequestTimingMiddleware, instrument_engines
+from ul_packing.metrics import MetricsMiddleware, metrics_endpoint
+from ul_packing.migrations import upgrade_schema
 from ul_packing.routes_api import router as api_router
+from ul_packing.routes_async import router as async_api_router
+from ul_packing.routes_internal import router as internal_router
 from ul_packing.sample_data import seed_sample_gear_inventory_data
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
     if settings.seed_sample_data:
         with SessionLocal() as db:
             seed_sample_gear_inventory_data(db)
     yield
 
 
-app = FastAPI(title="UL Packing", lifespan=lifespan)
-app.include_router(api_router)
-
-if settings.allowed_origins:
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.allowed_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-
-
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     if request.url.path.startswith("/api/"):
         return JSONResponse(
@@ -57,7 +50,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     return await default_validation_exception_handler(request, exc)
 
 
-@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     if request.url.path.startswith("/api/"):
         message = exc.detail if isinstance(exc.detail, str) else "Request failed"
@@ -68,3 +60,85 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
             content={"error": {"code": code, "message": message, "details": details}},
         )
     return await default_http_exception_handler(request, exc)
+
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+READ_PRIMARY_COOKIE = "ul_packing_read_primary_until"
+
+
+def mark_primary_reads(response: Response) -> None:
+    """Pin the client's reads to the primary for the read-your-writes window after a write."""
+    window = settings.read_your_writes_seconds
+    if window <= 0:
+        return
+    response.set_cookie(
+        READ_PRIMARY_COOKIE,
+        f"{time.time() + window:.3f}",
+        max_age=math.ceil(window),
+        path="/api",
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def reads_from_primary(request: Request) -> bool:
+    raw = request.cookies.get(READ_PRIMARY_COOKIE)
+    if raw is None:
+        return False
+    try:
+        return float(raw) > time.time()
+    except ValueError:
+        return False
+
+
+async def pin_reads_after_writes(request: Request, call_next):
+    # get_read_db picks the session factory from this flag.
+    request.state.read_primary = reads_from_primary(request)
+    response = await call_next(request)
+    if request.method not in _SAFE_METHODS and request.url.path.startswith("/api/") and response.status_code < 400:
+        mark_primary_reads(response)
+    return response
+
+
+def create_app(
+    database_async: bool | None = None,
+    internal_endpoints: bool | None = None,
+    metrics_enabled: bool | None = None,
+) -> FastAPI:
+    """Build the application; unset flags fall back to ``settings``."""
+    if database_async is None:
+        database_async = settings.database_async
+    if internal_endpoints is None:
+        internal_endpoints = settings.internal_endpoints
+    if metrics_enabled is None:
+        metrics_enabled = settings.metrics_enabled
+
+    app = FastAPI(title="UL Packing", lifespan=lifespan)
+    app.include_router(async_api_router if database_async else api_router)
+    if internal_endpoints:
+        app.include_router(internal_router)
+
+    if settings.database_replica_url:
+        app.middleware("http")(pin_reads_after_writes)
+
+    if settings.allowed_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.allowed_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    instrument_engines()
+    app.add_middleware(RequestTimingMiddleware, strict=settings.query_budget_strict)
+    if metrics_enabled:
+        app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+        app.add_middleware(MetricsMiddleware)
+
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    return app
+
+
+app = create_app()
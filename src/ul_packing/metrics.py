@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ul_packing import db
+from ul_packing.cache import shared_view_cache
+from ul_packing.pool import pool_status
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Unmatched paths share one label value so probes for random URLs cannot grow the series without bound.
+UNMATCHED_ROUTE = "<unmatched>"
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram; ``observe`` is a bisect and two additions under a lock."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: dict[Labels, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # One slot per bucket, one for +Inf, then the running sum.
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in sorted(snapshot.items()):
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, float("inf")), series[:-1], strict=True):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                yield f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(series[-1])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {_format_value(cumulative)}"
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        yield f"{self.name} {self.value}"
+
+
+def _sample_family(
+    name: str, metric_type: str, documentation: str, samples: Iterable[tuple[dict[str, str], float]]
+) -> Iterable[str]:
+    yield f"# HELP {name} {documentation}"
+    yield f"# TYPE {name} {metric_type}"
+    for labels, value in samples:
+        yield f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}"
+
+
+def collect_pool_metrics() -> Iterable[str]:
+    statuses = {name: pool_status(engine) for name, engine in db.named_engines().items()}
+    gauges = {
+        "size": "Configured pool size.",
+        "checked_out": "Connections currently checked out.",
+        "checked_in": "Idle connections in the pool.",
+        "overflow": "Connections open beyond the pool size.",
+    }
+    for field, documentation in gauges.items():
+        yield from _sample_family(
+            f"ul_packing_db_pool_{field}",
+            "gauge",
+            documentation,
+            (({"engine": name}, status[field]) for name, status in statuses.items() if field in status),
+        )
+    counters = {
+        "checkouts": ("ul_packing_db_pool_checkouts_total", "Connection checkouts.", 1),
+        "timeouts": ("ul_packing_db_pool_timeouts_total", "Checkouts that timed out waiting for a connection.", 1),
+        "wait_total_ms": ("ul_packing_db_pool_wait_seconds_total", "Time spent waiting for connections.", 0.001),
+    }
+    for field, (name, documentation, scale) in counters.items():
+        yield from _sample_family(
+            name,
+            "counter",
+            documentation,
+            (({"engine": engine}, status["waits"][field] * scale) for engine, status in statuses.items() if "waits" in status),
+        )
+
+
+def collect_cache_metrics() -> Iterable[str]:
+    caches = {"shared_view": shared_view_cache.entries}
+    yield from _sample_family(
+        "ul_packing_cache_hits_total", "counter", "Cache lookups that hit.", (({"cache": n}, c.hits) for n, c in caches.items())
+    )
+    yield from _sample_family(
+        "ul_packing_cache_misses_total",
+        "counter",
+        "Cache lookups that missed.",
+        (({"cache": n}, c.misses) for n, c in caches.items()),
+    )
+    yield from _sample_family(
+        "ul_packing_cache_hit_ratio",
+        "gauge",
+        "Hits over lookups since start (0 before the first lookup).",
+        (({"cache": n}, c.hits / (c.hits + c.misses) if c.hits + c.misses else 0) for n, c in caches.items()),
+    )
+    yield from _sample_family(
+        "ul_packing_cache_entries", "gauge", "Entries currently cached.", (({"cache": n}, len(c)) for n, c in caches.items())
+    )
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.request_duration = Histogram(
+            "ul_packing_http_request_duration_seconds",
+            "HTTP request latency by route.",
+            ("method", "route", "status"),
+            LATENCY_BUCKETS,
+        )
+        self.response_size = Histogram(
+            "ul_packing_http_response_size_bytes",
+            "HTTP response body size by route.",
+            ("method", "route"),
+            SIZE_BUCKETS,
+        )
+        self.in_flight = Gauge("ul_packing_http_requests_in_flight", "HTTP requests currently being served.")
+        self.collectors: list[Callable[[], Iterable[str]]] = [collect_pool_metrics, collect_cache_metrics]
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in (self.request_duration, self.response_size, self.in_flight):
+            lines.extend(metric.render())
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """Records latency, response size and in-flight requests for every HTTP request."""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        started = time.perf_counter()
+        status = "500"
+        size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        registry.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            registry.in_flight.dec()
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            registry.request_duration.observe(time.perf_counter() - started, method, route, status)
+            registry.response_size.observe(size, method, route)
+
+
+def metrics_endpoint(_: Request) -> Response:
+    return Response(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
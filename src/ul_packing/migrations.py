@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from ul_packing.db import Base
+from ul_packing.gear_inventory import GEAR_INVENTORY_DESCRIPTION, GEAR_INVENTORY_ROLE, GEAR_INVENTORY_TITLE
+
+_migration_metadata = MetaData()
+
+# Arbitrary application-wide key for pg_advisory_xact_lock.
+_MIGRATION_LOCK_KEY = 0x756C_706B
+
+schema_version = Table(
+    "schema_version",
+    _migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+# Steps run against whatever schema the previous step left behind, so they use plain
+# SQL rather than the ORM models, which always describe the head schema.
+
+
+def _create_indexes(conn: Connection, *statements: str) -> None:
+    for statement in statements:
+        conn.execute(text(statement))
+
+
+def _add_list_summary_columns(conn: Connection) -> None:
+    existing = {column["name"] for column in inspect(conn).get_columns("packing_lists")}
+    for column in ("base_weight_g", "consumable_weight_g", "worn_weight_g", "total_pack_g", "item_count"):
+        if column not in existing:
+            conn.execute(text(f"ALTER TABLE packing_lists ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"))
+    conn.execute(
+        text(
+            """
+            UPDATE packing_lists SET
+                base_weight_g = COALESCE((SELECT SUM(weight_grams * quantity) FROM gear_items
+                    WHERE gear_items.list_id = packing_lists.id AND kind = 'BASE'), 0),
+                consumable_weight_g = COALESCE((SELECT SUM(weight_grams * quantity) FROM gear_items
+                    WHERE gear_items.list_id = packing_lists.id AND kind = 'CONSUMABLE'), 0),
+                worn_weight_g = COALESCE((SELECT SUM(weight_grams * quantity) FROM gear_items
+                    WHERE gear_items.list_id = packing_lists.id AND kind = 'WORN'), 0),
+                total_pack_g = COALESCE((SELECT SUM(weight_grams * quantity) FROM gear_items
+                    WHERE gear_items.list_id = packing_lists.id), 0),
+                item_count = (SELECT COUNT(*) FROM gear_items WHERE gear_items.list_id = packing_lists.id)
+            """
+        )
+    )
+
+
+def _add_hot_path_indexes(conn: Connection) -> None:
+    _create_indexes(
+        conn,
+        "CREATE INDEX IF NOT EXISTS ix_packing_lists_created_at_id ON packing_lists (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_gear_items_list_id_sort_order ON gear_items (list_id, sort_order, id)",
+        "CREATE INDEX IF NOT EXISTS ix_gear_items_category_weight ON gear_items (category, weight_grams, id)",
+        "CREATE INDEX IF NOT EXISTS ix_gear_items_kind_weight ON gear_items (kind, weight_grams, id)",
+        "CREATE INDEX IF NOT EXISTS ix_gear_items_weight_grams_id ON gear_items (weight_grams, id)",
+        "CREATE INDEX IF NOT EXISTS ix_gear_items_name_id ON gear_items (name, id)",
+    )
+
+
+def _add_gear_inventory_role(conn: Connection) -> None:
+    existing = {column["name"] for column in inspect(conn).get_columns("packing_lists")}
+    if "system_role" not in existing:
+        conn.execute(text("ALTER TABLE packing_lists ADD COLUMN system_role VARCHAR(32)"))
+    conn.execute(
+        text(
+            """
+            UPDATE packing_lists SET system_role = :role
+            WHERE id = (
+                SELECT id FROM packing_lists WHERE title = :title AND description = :description
+                ORDER BY created_at ASC LIMIT 1
+            )
+            """
+        ),
+        {"role": GEAR_INVENTORY_ROLE, "title": GEAR_INVENTORY_TITLE, "description": GEAR_INVENTORY_DESCRIPTION},
+    )
+    _create_indexes(
+        conn, "CREATE UNIQUE INDEX IF NOT EXISTS uq_packing_lists_system_role ON packing_lists (system_role)"
+    )
+
+
+def _add_list_version(conn: Connection) -> None:
+    existing = {column["name"] for column in inspect(conn).get_columns("packing_lists")}
+    if "version" not in existing:
+        conn.execute(text("ALTER TABLE packing_lists ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "Store per-list weight summary columns", _add_list_summary_columns),
+    Migration(2, "Add indexes for list ordering and gear item lookups", _add_hot_path_indexes),
+    Migration(3, "Mark the gear inventory list with a unique system role", _add_gear_inventory_role),
+    Migration(4, "Add a per-list version for conditional requests", _add_list_version),
+)
+
+HEAD_VERSION = MIGRATIONS[-1].version
+
+
+def _record(conn: Connection, migration: Migration) -> None:
+    conn.execute(
+        schema_version.insert().values(
+            version=migration.version,
+            description=migration.description,
+            applied_at=datetime.now(UTC),
+        )
+    )
+
+
+def current_version(conn: Connection) -> int | None:
+    """Return the applied schema version, 0 for a pre-migration database, or None when empty."""
+    tables = set(inspect(conn).get_table_names())
+    if schema_version.name in tables:
+        return conn.execute(select(func.coalesce(func.max(schema_version.c.version), 0))).scalar_one()
+    if "packing_lists" in tables:
+        return 0
+    return None
+
+
+def _lock_schema(conn: Connection) -> None:
+    """Hold an exclusive migration lock until the current transaction ends.
+
+    Several app processes start against the same database at once (``uvicorn --workers``);
+    without the lock they all read the same version and then stamp it twice.
+    """
+    if conn.dialect.name == "sqlite":
+        # pysqlite would only BEGIN at the first write; take the write lock before reading instead.
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    elif conn.dialect.name == "postgresql":
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+
+
+def upgrade_schema(engine: Engine) -> list[int]:
+    """Bring the database up to ``HEAD_VERSION`` and return the versions that were applied.
+
+    An empty database gets the full schema from the models and is stamped at head;
+    an existing one runs every pending step in order, each in its own transaction.
+    The version is re-read under the migration lock before every step, so concurrent
+    callers apply each step once and the others find it already done.
+    """
+    applied: list[int] = []
+    while True:
+        with engine.begin() as conn:
+            _lock_schema(conn)
+            version = current_version(conn)
+            schema_version.create(conn, checkfirst=True)
+            if version is None:
+                Base.metadata.create_all(conn)
+                for migration in MIGRATIONS:
+                    _record(conn, migration)
+                return applied
+            pending = next((migration for migration in MIGRATIONS if migration.version > version), None)
+            if pending is None:
+                return applied
+            pending.upgrade(conn)
+            _record(conn, pending)
+        applied.append(pending.version)
@@ -4,10 +4,11 @@ from datetime import UTC, datetime
 from enum import StrEnum
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ul_packing.db import Base
+from ul_packing.schemas import Summary
 
 
 class Unit(StrEnum):
@@ -35,6 +36,10 @@ class ItemKind(StrEnum):
 
 class PackingList(Base):
     __tablename__ = "packing_lists"
+    __table_args__ = (
+        Index("ix_packing_lists_created_at_id", "created_at", "id"),
+        Index("uq_packing_lists_system_role", "system_role", unique=True),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     title: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -42,6 +47,7 @@ class PackingList(Base):
     unit: Mapped[Unit] = mapped_column(Enum(Unit), default=Unit.G, nullable=False)
     share_token: Mapped[str] = mapped_column(String(128), unique=True, nullable=False)
     is_shared: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    system_role: Mapped[str | None] = mapped_column(String(32), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -49,6 +55,18 @@ class PackingList(Base):
         onupdate=lambda: datetime.now(UTC),
         nullable=False,
     )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version") + 1,
+        nullable=False,
+    )
+    base_weight_g: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    consumable_weight_g: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    worn_weight_g: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    total_pack_g: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    item_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     items: Mapped[list[GearItem]] = relationship(
         back_populates="packing_list",
@@ -56,9 +74,25 @@ class PackingList(Base):
         order_by="GearItem.sort_order",
     )
 
+    @property
+    def summary(self) -> Summary:
+        return Summary(
+            base_weight_g=self.base_weight_g,
+            consumable_weight_g=self.consumable_weight_g,
+            worn_weight_g=self.worn_weight_g,
+            total_pack_g=self.total_pack_g,
+        )
+
 
 class GearItem(Base):
     __tablename__ = "gear_items"
+    __table_args__ = (
+        Index("ix_gear_items_list_id_sort_order", "list_id", "sort_order", "id"),
+        Index("ix_gear_items_category_weight", "category", "weight_grams", "id"),
+        Index("ix_gear_items_kind_weight", "kind", "weight_grams", "id"),
+        Index("ix_gear_items_weight_grams_id", "weight_grams", "id"),
+        Index("ix_gear_items_name_id", "name", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     list_id: Mapped[str] = mapped_column(String(36), ForeignKey("packing_lists.id", ondelete="CASCADE"))
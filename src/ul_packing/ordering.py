@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session
+
+from ul_packing.models import GearItem
+
+# Items are appended SORT_ORDER_STEP apart so a move can usually take the midpoint
+# of its new neighbours and update a single row. When two neighbours are adjacent
+# integers the list is rebalanced back to even spacing in one UPDATE.
+SORT_ORDER_STEP = 1024
+
+
+class InvalidMoveError(ValueError):
+    pass
+
+
+def next_sort_order(db: Session, list_id: str) -> int:
+    max_order = db.execute(
+        select(GearItem.sort_order)
+        .where(GearItem.list_id == list_id)
+        .order_by(GearItem.sort_order.desc())
+    ).scalars().first()
+    return 0 if max_order is None else max_order + SORT_ORDER_STEP
+
+
+def rebalance_sort_orders(db: Session, list_id: str) -> None:
+    """Respace every item of the list to ``rank * SORT_ORDER_STEP``, keeping the current order."""
+    ranked = (
+        select(
+            GearItem.id.label("id"),
+            (func.row_number().over(order_by=(GearItem.sort_order, GearItem.id)) - 1).label("rank"),
+        )
+        .where(GearItem.list_id == list_id)
+        .subquery()
+    )
+    db.execute(
+        update(GearItem)
+        .where(GearItem.id == ranked.c.id)
+        .values(sort_order=ranked.c.rank * SORT_ORDER_STEP)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _neighbour_order(db: Session, item: GearItem, anchor: GearItem, after: bool) -> int | None:
+    # Sort key of the item directly after (or before) ``anchor``, ignoring ``item``.
+    stmt = select(GearItem.sort_order).where(GearItem.list_id == anchor.list_id, GearItem.id != item.id)
+    if after:
+        stmt = stmt.where(
+            (GearItem.sort_order > anchor.sort_order)
+            | ((GearItem.sort_order == anchor.sort_order) & (GearItem.id > anchor.id))
+        ).order_by(GearItem.sort_order.asc(), GearItem.id.asc())
+    else:
+        stmt = stmt.where(
+            (GearItem.sort_order < anchor.sort_order)
+            | ((GearItem.sort_order == anchor.sort_order) & (GearItem.id < anchor.id))
+        ).order_by(GearItem.sort_order.desc(), GearItem.id.desc())
+    return db.execute(stmt.limit(1)).scalar_one_or_none()
+
+
+def _anchor(db: Session, list_id: str, item_id: str | None) -> GearItem | None:
+    if item_id is None:
+        return None
+    anchor = db.get(GearItem, item_id)
+    if anchor is None or anchor.list_id != list_id:
+        raise InvalidMoveError(f"Item {item_id} is not in this list")
+    return anchor
+
+
+def _bounds(db: Session, item: GearItem, after_id: str | None, before_id: str | None) -> tuple[int | None, int | None]:
+    after = _anchor(db, item.list_id, after_id)
+    before = _anchor(db, item.list_id, before_id)
+    if after is not None and before is not None:
+        if (after.sort_order, after.id) > (before.sort_order, before.id):
+            raise InvalidMoveError("after_id must come before before_id")
+        return after.sort_order, before.sort_order
+    if after is not None:
+        return after.sort_order, _neighbour_order(db, item, after, after=True)
+    assert before is not None
+    return _neighbour_order(db, item, before, after=False), before.sort_order
+
+
+def _position_between(low: int | None, high: int | None) -> int | None:
+    if low is None and high is None:
+        return 0
+    if low is None:
+        return high - SORT_ORDER_STEP
+    if high is None:
+        return low + SORT_ORDER_STEP
+    if high - low > 1:
+        return (low + high) // 2
+    return None
+
+
+def move_item(db: Session, item: GearItem, after_id: str | None, before_id: str | None) -> None:
+    """Place ``item`` between ``after_id`` and ``before_id``; either may be omitted.
+
+    A missing neighbour is looked up, so ``after_id`` alone means "directly after".
+    Only the moved row changes unless the gap is exhausted, in which case the list
+    is rebalanced first.
+    """
+    if after_id is None and before_id is None:
+        raise InvalidMoveError("after_id or before_id is required")
+    if item.id in (after_id, before_id) or after_id == before_id:
+        raise InvalidMoveError("after_id and before_id must be two other items")
+
+    position = _position_between(*_bounds(db, item, after_id, before_id))
+    if position is None:
+        rebalance_sort_orders(db, item.list_id)
+        db.expire_all()
+        position = _position_between(*_bounds(db, item, after_id, before_id))
+    if position is None:
+        raise InvalidMoveError("Could not find a free position")
+    item.sort_order = position
+
+
+def reorder_items(db: Session, list_id: str, item_ids: Sequence[str]) -> None:
+    """Apply a complete ordering of the list's items with one executemany UPDATE."""
+    existing = set(db.execute(select(GearItem.id).where(GearItem.list_id == list_id)).scalars())
+    if len(item_ids) != len(set(item_ids)) or set(item_ids) != existing:
+        raise InvalidMoveError("item_ids must list every item of the list exactly once")
+    if not item_ids:
+        return
+    db.execute(
+        update(GearItem.__table__)
+        .where(GearItem.__table__.c.id == bindparam("item_id"))
+        .values(sort_order=bindparam("new_order")),
+        [{"item_id": item_id, "new_order": index * SORT_ORDER_STEP} for index, item_id in enumerate(item_ids)],
+    )
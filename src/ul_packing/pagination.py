@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SortKey:
+    column: ColumnElement[Any]
+    descending: bool = False
+
+    def order_by(self) -> ColumnElement[Any]:
+        return self.column.desc() if self.descending else self.column.asc()
+
+    def after(self, value: object) -> ColumnElement[bool]:
+        return self.column < value if self.descending else self.column > value
+
+    def parse(self, value: object) -> object:
+        python_type = self.column.type.python_type
+        if python_type is datetime:
+            if not isinstance(value, str):
+                raise InvalidCursorError("Invalid cursor")
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError as exc:
+                raise InvalidCursorError("Invalid cursor") from exc
+        if python_type is int:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise InvalidCursorError("Invalid cursor")
+            return value
+        if not isinstance(value, str):
+            raise InvalidCursorError("Invalid cursor")
+        return value
+
+
+def encode_cursor(values: Sequence[object]) -> str:
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[SortKey]) -> list[object]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursorError("Invalid cursor")
+    return [key.parse(value) for key, value in zip(keys, values, strict=True)]
+
+
+def keyset_order_by(keys: Sequence[SortKey]) -> list[ColumnElement[Any]]:
+    return [key.order_by() for key in keys]
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[object]) -> ColumnElement[bool]:
+    """Rows strictly after ``values`` in the ``keys`` ordering, expanded as OR-of-ANDs
+    so that mixed ascending/descending keys still use the composite index prefix."""
+    clauses = []
+    for index, key in enumerate(keys):
+        equal_prefix = [prefix.column == value for prefix, value in zip(keys[:index], values[:index], strict=True)]
+        clauses.append(and_(*equal_prefix, key.after(values[index])))
+    return or_(*clauses)
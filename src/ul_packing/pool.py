@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# QueuePool's own default, used when create_engine() is not given max_overflow.
+_DEFAULT_MAX_OVERFLOW = 10
+
+
+class PoolWaitStats:
+    """Thread-safe counters for how long checkouts waited on a pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+class _WaitTimingMixin:
+    """Times ``_do_get`` (queue wait plus any overflow connect) for every checkout.
+
+    ``_do_get`` is private SQLAlchemy API: the dependency is pinned below 2.1 and
+    tests/unit/test_pool.py fails if the hook stops being called.
+    """
+
+    wait_stats: PoolWaitStats
+    max_overflow: int
+
+    def __init__(self, *args: Any, max_overflow: int = _DEFAULT_MAX_OVERFLOW, **kwargs: Any) -> None:
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - started)
+        return entry
+
+    def recreate(self) -> Any:
+        # Keep the counters across engine.dispose(), which swaps in a new pool.
+        pool = super().recreate()  # type: ignore[misc]
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+class TimedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    """Live occupancy of the engine's pool; sizing fields only exist for queue pools."""
+    pool: Pool = engine.pool
+    status: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, _WaitTimingMixin):
+        status["max_overflow"] = pool.max_overflow
+        status["waits"] = pool.wait_stats.snapshot()
+    return status
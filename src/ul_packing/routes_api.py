@@ -1,30 +1,114 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+import io
+import tempfile
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, Literal
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from ul_packing.db import get_db
-from ul_packing.gear_inventory import GEAR_INVENTORY_DESCRIPTION, GEAR_INVENTORY_TITLE
-from ul_packing.models import GearItem, PackingList
+from ul_packing.aggregation import Breakdown, aggregate_weights
+from ul_packing.cache import NOT_FOUND, CachedSharedView, shared_view_cache
+from ul_packing.config import settings
+from ul_packing.db import get_db, get_read_db
+from ul_packing.export import EXPORT_MEDIA_TYPES, ExportFormat, ExportResource, stream_export
+from ul_packing.gear_inventory import get_or_create_gear_inventory_list
+from ul_packing.importing import IMPORT_SPOOL_MAX_BYTES, ImportFormat, ImportReport, import_items
+from ul_packing.instrumentation import query_budget, serialization_timer
+from ul_packing.models import Category, GearItem, ItemKind, PackingList
+from ul_packing.pagination import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    InvalidCursorError,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    keyset_order_by,
+)
 from ul_packing.schemas_api import (
+    BatchCreateItemsOut,
+    BatchItemErrorOut,
+    BatchUpdateItemsIn,
+    BatchUpdateItemsOut,
     CreateItemIn,
+    MoveItemIn,
+    ReorderItemsIn,
     CreateListIn,
-    GearListItemOut,
+    DataResponse,
+    DuplicateListIn,
     GearItemOut,
+    MAX_BATCH_ITEMS,
+    GearListItemOut,
+    ImportFailureOut,
+    ImportReportOut,
+    ItemChangesIn,
+    ListDeltaOut,
+    ListSummaryOut,
     PackingListDetailOut,
     PackingListListItemOut,
+    PageResponse,
     SetUnitIn,
     SharedPackingListOut,
     SummaryOut,
     UpdateItemIn,
     UpdateListIn,
+    WeightBucketOut,
+)
+from ul_packing.ordering import InvalidMoveError, move_item, next_sort_order, reorder_items
+from ul_packing.services import (
+    UnknownItemsError,
+    bulk_insert_items,
+    duplicate_list,
+    generate_share_token,
+    item_summary_delta,
+    rebuild_list_summaries,
+    record_list_change,
+    update_items_by_id,
+    update_items_where,
 )
-from ul_packing.services import compute_summary, generate_share_token
 
 router = APIRouter(prefix="/api/v1", tags=["api"])
 
+_LIST_SORT_KEYS = (SortKey(PackingList.created_at, descending=True), SortKey(PackingList.id, descending=True))
+
+GearItemSort = Literal["default", "name", "-name", "weight", "-weight"]
+_GEAR_ITEM_SORT_KEYS: dict[str, tuple[SortKey, ...]] = {
+    "default": (
+        SortKey(PackingList.created_at, descending=True),
+        SortKey(GearItem.list_id),
+        SortKey(GearItem.sort_order),
+        SortKey(GearItem.id),
+    ),
+    "name": (SortKey(GearItem.name), SortKey(GearItem.id)),
+    "-name": (SortKey(GearItem.name, descending=True), SortKey(GearItem.id, descending=True)),
+    "weight": (SortKey(GearItem.weight_grams), SortKey(GearItem.id)),
+    "-weight": (SortKey(GearItem.weight_grams, descending=True), SortKey(GearItem.id, descending=True)),
+}
+
+_GEAR_LIST_ITEM_COLUMNS = (
+    GearItem.id,
+    GearItem.list_id,
+    PackingList.title.label("list_title"),
+    GearItem.name,
+    GearItem.category,
+    GearItem.kind,
+    GearItem.weight_grams,
+    GearItem.quantity,
+    GearItem.notes,
+    GearItem.sort_order,
+)
+
+_GEAR_ITEM_FIELDS = tuple(GearItemOut.model_fields)
+_GEAR_ITEM_COLUMNS = tuple(getattr(GearItem, field) for field in _GEAR_ITEM_FIELDS)
+_gear_item_outs = TypeAdapter(list[GearItemOut])
+
 
 def _api_error(status_code: int, code: str, message: str, details: object | None = None) -> JSONResponse:
     return JSONResponse(
@@ -41,16 +125,16 @@ def _get_list_or_404(db: Session, list_id: str) -> PackingList:
 
 
 def _to_summary_out(packing_list: PackingList) -> SummaryOut:
-    summary = compute_summary(packing_list.items)
-    return SummaryOut(
-        base_weight_g=summary.base_weight_g,
-        consumable_weight_g=summary.consumable_weight_g,
-        worn_weight_g=summary.worn_weight_g,
-        total_pack_g=summary.total_pack_g,
-    )
+    return SummaryOut.model_validate(packing_list.summary)
+
 
+def _json_response(envelope: BaseModel, headers: dict[str, str] | None = None) -> Response:
+    with serialization_timer():
+        content = envelope.model_dump_json()
+    return Response(content=content, media_type="application/json", headers=headers)
 
-def _to_gear_list_item_out(item: GearItem, list_title: str) -> dict[str, object]:
+
+def _to_gear_list_item_out(item: GearItem, list_title: str) -> GearListItemOut:
     return GearListItemOut(
         id=item.id,
         list_id=item.list_id,
@@ -62,19 +146,69 @@ def _to_gear_list_item_out(item: GearItem, list_title: str) -> dict[str, object]
         quantity=item.quantity,
         notes=item.notes,
         sort_order=item.sort_order,
-    ).model_dump(mode="json")
+    )
 
 
-def _to_list_data(packing_list: PackingList, include_items: bool) -> dict[str, object]:
-    data: dict[str, object] = PackingListListItemOut.model_validate(packing_list).model_dump(mode="json")
+def _load_item_outs(db: Session, list_id: str) -> list[GearItemOut]:
+    # Items are read as plain tuples instead of hydrating GearItem objects through
+    # the lazy ``packing_list.items`` relationship, then validated in one batch.
+    rows = db.execute(
+        select(*_GEAR_ITEM_COLUMNS)
+        .where(GearItem.list_id == list_id)
+        .order_by(GearItem.sort_order, GearItem.id)
+    ).tuples()
+    return _gear_item_outs.validate_python([dict(zip(_GEAR_ITEM_FIELDS, row, strict=True)) for row in rows])
+
+
+def _list_response(
+    db: Session,
+    packing_list: PackingList,
+    include_items: bool,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    data: PackingListListItemOut = PackingListListItemOut.model_validate(packing_list)
     if include_items:
-        detail = PackingListDetailOut(
-            **data,
-            items=[GearItemOut.model_validate(item) for item in packing_list.items],
-            summary=_to_summary_out(packing_list),
-        )
-        data = detail.model_dump(mode="json")
-    return data
+        data = PackingListDetailOut.model_construct(**dict(data), items=_load_item_outs(db, packing_list.id))
+    return _json_response(DataResponse(data=data), headers)
+
+
+def _wants_delta(
+    prefer: str | None = Header(default=None),
+    response_mode: Literal["full", "delta"] = Query(default="full", alias="response"),
+) -> bool:
+    if response_mode == "delta":
+        return True
+    if not prefer:
+        return False
+    return "return=minimal" in {preference.strip().lower() for preference in prefer.split(",")}
+
+
+def _delta_response(
+    packing_list: PackingList,
+    item: GearItem | None = None,
+    deleted_item_id: str | None = None,
+) -> Response:
+    delta = ListDeltaOut(
+        list_id=packing_list.id,
+        unit=packing_list.unit,
+        item_count=packing_list.item_count,
+        summary=_to_summary_out(packing_list),
+        item=GearItemOut.model_validate(item) if item is not None else None,
+        deleted_item_id=deleted_item_id,
+    )
+    headers = {"ETag": _list_etag(packing_list), "Preference-Applied": "return=minimal"}
+    return _json_response(DataResponse(data=delta), headers)
+
+
+def _list_etag(packing_list: PackingList) -> str:
+    return f'"{packing_list.id}.{packing_list.version}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 def _get_list_item_or_404(db: Session, list_id: str, item_id: str) -> tuple[PackingList, GearItem]:
@@ -94,20 +228,21 @@ def _apply_item_payload(item: GearItem, payload: CreateItemIn | UpdateItemIn) ->
     item.notes = payload.notes.strip()
 
 
+def _item_changes(changes: ItemChangesIn) -> dict[str, object]:
+    values = changes.model_dump(include={"name", "category", "weight_grams", "quantity", "kind", "notes"}, exclude_none=True)
+    for field in ("name", "notes"):
+        if field in values:
+            values[field] = values[field].strip()
+    return values
+
+
 def _commit_and_refresh_list(db: Session, packing_list: PackingList) -> None:
+    list_id = packing_list.id
     db.commit()
+    shared_view_cache.invalidate_list(list_id)
     db.refresh(packing_list)
 
 
-def _next_sort_order(db: Session, list_id: str) -> int:
-    max_order = db.execute(
-        select(GearItem.sort_order)
-        .where(GearItem.list_id == list_id)
-        .order_by(GearItem.sort_order.desc())
-    ).scalars().first()
-    return (max_order if max_order is not None else -1) + 1
-
-
 def _create_item_entity(list_id: str, payload: CreateItemIn, sort_order: int) -> GearItem:
     item = GearItem(
         list_id=list_id,
@@ -123,46 +258,104 @@ def _create_item_entity(list_id: str, payload: CreateItemIn, sort_order: int) ->
     return item
 
 
-def _get_or_create_gear_inventory_list(db: Session) -> PackingList:
-    inventory = db.execute(
-        select(PackingList)
-        .where(
-            PackingList.title == GEAR_INVENTORY_TITLE,
-            PackingList.description == GEAR_INVENTORY_DESCRIPTION,
-        )
-        .order_by(PackingList.created_at.asc())
-    ).scalars().first()
-    if inventory:
-        return inventory
-
-    inventory = PackingList(
-        title=GEAR_INVENTORY_TITLE,
-        description=GEAR_INVENTORY_DESCRIPTION,
-        share_token=generate_share_token(),
-        is_shared=False,
-    )
-    db.add(inventory)
-    db.commit()
-    db.refresh(inventory)
-    return inventory
-
-
 @router.get("/lists")
-def get_lists(db: Session = Depends(get_db)):
-    lists = db.execute(select(PackingList).order_by(PackingList.created_at.desc())).scalars().all()
-    return {"data": [_to_list_data(packing_list, include_items=False) for packing_list in lists]}
+@query_budget(2)
+def get_lists(
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    db: Session = Depends(get_read_db),
+):
+    stmt = select(PackingList).order_by(*keyset_order_by(_LIST_SORT_KEYS))
+    if cursor is not None:
+        try:
+            stmt = stmt.where(keyset_after(_LIST_SORT_KEYS, decode_cursor(cursor, _LIST_SORT_KEYS)))
+        except InvalidCursorError as exc:
+            return _api_error(422, "validation_error", str(exc))
+
+    lists = db.execute(stmt.limit(limit + 1)).scalars().all()
+    next_cursor = None
+    if len(lists) > limit:
+        lists = lists[:limit]
+        next_cursor = encode_cursor([lists[-1].created_at, lists[-1].id])
+    page = PageResponse[PackingListListItemOut].model_validate(
+        {"data": lists, "next_cursor": next_cursor},
+        from_attributes=True,
+    )
+    return _json_response(page)
 
 
 @router.get("/gear-items")
-def get_gear_items(db: Session = Depends(get_db)):
-    rows = db.execute(
-        select(GearItem, PackingList.title)
+@query_budget(2)
+def get_gear_items(
+    category: Category | None = None,
+    kind: ItemKind | None = None,
+    min_weight_grams: int | None = Query(default=None, ge=0),
+    max_weight_grams: int | None = Query(default=None, ge=0),
+    list_id: str | None = None,
+    q: str | None = Query(default=None, max_length=100),
+    sort: GearItemSort = "default",
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    db: Session = Depends(get_read_db),
+):
+    sort_keys = _GEAR_ITEM_SORT_KEYS[sort]
+    selected = {column.key for column in _GEAR_LIST_ITEM_COLUMNS}
+    stmt = (
+        select(
+            *_GEAR_LIST_ITEM_COLUMNS,
+            *(key.column for key in sort_keys if key.column.key not in selected),
+        )
         .join(PackingList, GearItem.list_id == PackingList.id)
-        .order_by(PackingList.created_at.desc(), GearItem.sort_order.asc(), GearItem.id.asc())
-    ).all()
+        .order_by(*keyset_order_by(sort_keys))
+    )
+    if category is not None:
+        stmt = stmt.where(GearItem.category == category)
+    if kind is not None:
+        stmt = stmt.where(GearItem.kind == kind)
+    if min_weight_grams is not None:
+        stmt = stmt.where(GearItem.weight_grams >= min_weight_grams)
+    if max_weight_grams is not None:
+        stmt = stmt.where(GearItem.weight_grams <= max_weight_grams)
+    if list_id is not None:
+        stmt = stmt.where(GearItem.list_id == list_id)
+    if q is not None and q.strip():
+        stmt = stmt.where(GearItem.name.icontains(q.strip(), autoescape=True))
+    if cursor is not None:
+        try:
+            stmt = stmt.where(keyset_after(sort_keys, decode_cursor(cursor, sort_keys)))
+        except InvalidCursorError as exc:
+            return _api_error(422, "validation_error", str(exc))
+
+    rows = db.execute(stmt.limit(limit + 1)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1]._mapping[key.column] for key in sort_keys])
+
+    page = PageResponse[GearListItemOut].model_validate(
+        {"data": rows, "next_cursor": next_cursor},
+        from_attributes=True,
+    )
+    return _json_response(page)
+
+
+def _export_response(
+    body: Iterator[str] | AsyncIterator[str], resource: ExportResource, export_format: ExportFormat
+) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{resource}.{export_format}"'},
+    )
+
 
-    data = [_to_gear_list_item_out(item, list_title) for item, list_title in rows]
-    return {"data": data}
+@router.get("/export/{resource}")
+def export_data(
+    resource: ExportResource,
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+    db: Session = Depends(get_db),
+):
+    return _export_response(stream_export(db, resource, export_format), resource, export_format)
 
 
 @router.post("/lists")
@@ -179,7 +372,19 @@ def create_list(payload: CreateListIn, db: Session = Depends(get_db)):
     db.add(packing_list)
     db.commit()
     db.refresh(packing_list)
-    return {"data": _to_list_data(packing_list, include_items=False)}
+    return _list_response(db, packing_list, include_items=False)
+
+
+@router.post("/lists/{list_id}/duplicate")
+def duplicate_packing_list(list_id: str, payload: DuplicateListIn | None = None, db: Session = Depends(get_db)):
+    source = _get_list_or_404(db, list_id)
+    title = payload.title.strip() if payload and payload.title is not None else None
+    if title == "":
+        return _api_error(422, "validation_error", "Title is required")
+
+    copy_id = duplicate_list(db, source, title=title)
+    db.commit()
+    return _list_response(db, _get_list_or_404(db, copy_id), include_items=False)
 
 
 @router.patch("/lists/{list_id}")
@@ -192,86 +397,328 @@ def update_list(list_id: str, payload: UpdateListIn, db: Session = Depends(get_d
     packing_list.title = title
     packing_list.description = payload.description.strip()
     _commit_and_refresh_list(db, packing_list)
-    return {"data": _to_list_data(packing_list, include_items=False)}
+    return _list_response(db, packing_list, include_items=False)
 
 
 @router.get("/lists/{list_id}")
-def get_list_detail(list_id: str, db: Session = Depends(get_db)):
+@query_budget(2)
+def get_list_detail(
+    list_id: str,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_read_db),
+):
     packing_list = _get_list_or_404(db, list_id)
-    return {"data": _to_list_data(packing_list, include_items=True)}
+    headers = {"ETag": _list_etag(packing_list), "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    return _list_response(db, packing_list, include_items=True, headers=headers)
+
+
+@router.get("/lists/{list_id}/summary")
+@query_budget(2)
+def get_list_summary(list_id: str, breakdown: Breakdown | None = None, db: Session = Depends(get_db)):
+    packing_list = _get_list_or_404(db, list_id)
+    summary = ListSummaryOut(list_id=packing_list.id, summary=_to_summary_out(packing_list))
+    if breakdown is not None:
+        buckets = aggregate_weights(db, [packing_list.id], breakdown)[packing_list.id]
+        summary.breakdown = [WeightBucketOut.model_validate(bucket) for bucket in buckets]
+    return _json_response(DataResponse(data=summary))
 
 
 @router.post("/lists/{list_id}/items")
-def create_item(list_id: str, payload: CreateItemIn, db: Session = Depends(get_db)):
+def create_item(
+    list_id: str,
+    payload: CreateItemIn,
+    delta: bool = Depends(_wants_delta),
+    db: Session = Depends(get_db),
+):
     packing_list = _get_list_or_404(db, list_id)
 
     item = _create_item_entity(
         list_id=packing_list.id,
         payload=payload,
-        sort_order=_next_sort_order(db, packing_list.id),
+        sort_order=next_sort_order(db, packing_list.id),
     )
     db.add(item)
+    record_list_change(db, packing_list.id, item_summary_delta(item))
     _commit_and_refresh_list(db, packing_list)
 
-    return {"data": _to_list_data(packing_list, include_items=True)}
+    if delta:
+        return _delta_response(packing_list, item=item)
+    return _list_response(db, packing_list, include_items=True)
+
+
+@router.post("/lists/{list_id}/items:batch")
+def create_items_batch(
+    list_id: str,
+    payload: Annotated[list[Any], Body(max_length=MAX_BATCH_ITEMS)],
+    db: Session = Depends(get_db),
+):
+    packing_list = _get_list_or_404(db, list_id)
+
+    valid_items: list[dict[str, object]] = []
+    errors: list[BatchItemErrorOut] = []
+    for index, raw_item in enumerate(payload):
+        try:
+            item = CreateItemIn.model_validate(raw_item)
+        except ValidationError as exc:
+            errors.append(BatchItemErrorOut(index=index, details=exc.errors(include_url=False, include_context=False)))
+            continue
+        valid_items.append(
+            {
+                "name": item.name.strip(),
+                "category": item.category,
+                "weight_grams": item.weight_grams,
+                "quantity": item.quantity,
+                "kind": item.kind,
+                "notes": item.notes.strip(),
+            }
+        )
+
+    rows = bulk_insert_items(db, packing_list.id, valid_items, next_sort_order(db, packing_list.id))
+    if rows:
+        _commit_and_refresh_list(db, packing_list)
+
+    result = BatchCreateItemsOut(
+        list_id=packing_list.id,
+        created=_gear_item_outs.validate_python(rows),
+        errors=errors,
+        item_count=packing_list.item_count,
+        summary=_to_summary_out(packing_list),
+    )
+    return _json_response(DataResponse(data=result), {"ETag": _list_etag(packing_list)})
+
+
+@router.patch("/lists/{list_id}/items:batch")
+def update_items_batch(list_id: str, payload: BatchUpdateItemsIn, db: Session = Depends(get_db)):
+    packing_list = _get_list_or_404(db, list_id)
+
+    updated_count = 0
+    try:
+        for operation in payload.bulk:
+            updated_count += update_items_where(
+                db,
+                packing_list.id,
+                _item_changes(operation.changes),
+                item_ids=operation.where.ids,
+                category=operation.where.category,
+                kind=operation.where.kind,
+            )
+        updated_count += update_items_by_id(
+            db, packing_list.id, [{"id": patch.id, **_item_changes(patch)} for patch in payload.items]
+        )
+    except UnknownItemsError as exc:
+        db.rollback()
+        return _api_error(422, "validation_error", str(exc), details={"item_ids": exc.item_ids})
+
+    # Nothing matched: leave the version, ETag and shared-view cache alone.
+    if updated_count:
+        # Set-based updates don't know the old weights, so the summary is rebuilt once
+        # from the items instead of being adjusted by deltas.
+        rebuild_list_summaries(db, [packing_list.id], touch=True)
+        _commit_and_refresh_list(db, packing_list)
+
+    result = BatchUpdateItemsOut(
+        list_id=packing_list.id,
+        updated_count=updated_count,
+        item_count=packing_list.item_count,
+        summary=_to_summary_out(packing_list),
+    )
+    return _json_response(DataResponse(data=result), {"ETag": _list_etag(packing_list)})
+
+
+@asynccontextmanager
+async def _spooled_body_lines(request: Request) -> AsyncIterator[io.TextIOWrapper]:
+    # The body is spooled (to disk past IMPORT_SPOOL_MAX_BYTES) and parsed lazily,
+    # so memory stays bounded however large the upload is.
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        lines = io.TextIOWrapper(spool, encoding="utf-8-sig", errors="replace", newline="")
+        try:
+            yield lines
+        finally:
+            lines.detach()
+
+
+def _import_report_response(db: Session, list_id: str, report: ImportReport) -> Response:
+    packing_list = _get_list_or_404(db, list_id)
+    db.refresh(packing_list)
+
+    result = ImportReportOut(
+        list_id=packing_list.id,
+        imported=report.imported,
+        failed=report.failed,
+        chunks=report.chunks,
+        failures=[ImportFailureOut(line=failure.line, message=failure.message) for failure in report.failures],
+        item_count=packing_list.item_count,
+        summary=_to_summary_out(packing_list),
+    )
+    return _json_response(DataResponse(data=result), {"ETag": _list_etag(packing_list)})
+
+
+def _import_into_list(db: Session, list_id: str, lines: Iterable[str], import_format: ImportFormat) -> Response:
+    report = import_items(db, list_id, lines, import_format)
+    return _import_report_response(db, list_id, report)
+
+
+@router.post("/lists/{list_id}/items:import")
+async def import_list_items(
+    list_id: str,
+    request: Request,
+    import_format: ImportFormat = Query(default="csv", alias="format"),
+    db: Session = Depends(get_db),
+):
+    await run_in_threadpool(_get_list_or_404, db, list_id)
+    async with _spooled_body_lines(request) as lines:
+        return await run_in_threadpool(_import_into_list, db, list_id, lines, import_format)
 
 
 @router.post("/gear-items")
+@query_budget(10)  # the first call creates the inventory list
 def create_gear_item(payload: CreateItemIn, db: Session = Depends(get_db)):
-    inventory_list = _get_or_create_gear_inventory_list(db)
+    inventory_list = get_or_create_gear_inventory_list(db)
     item = _create_item_entity(
         list_id=inventory_list.id,
         payload=payload,
-        sort_order=_next_sort_order(db, inventory_list.id),
+        sort_order=next_sort_order(db, inventory_list.id),
     )
     db.add(item)
+    record_list_change(db, inventory_list.id, item_summary_delta(item))
     db.commit()
+    shared_view_cache.invalidate_list(inventory_list.id)
     db.refresh(item)
 
-    return {"data": _to_gear_list_item_out(item, inventory_list.title)}
+    return _json_response(DataResponse(data=_to_gear_list_item_out(item, inventory_list.title)))
 
 
 @router.patch("/lists/{list_id}/items/{item_id}")
-def update_item(list_id: str, item_id: str, payload: UpdateItemIn, db: Session = Depends(get_db)):
+def update_item(
+    list_id: str,
+    item_id: str,
+    payload: UpdateItemIn,
+    delta: bool = Depends(_wants_delta),
+    db: Session = Depends(get_db),
+):
     packing_list, item = _get_list_item_or_404(db, list_id, item_id)
+    previous = item_summary_delta(item, sign=-1)
     _apply_item_payload(item, payload)
+    record_list_change(db, packing_list.id, previous, item_summary_delta(item))
     _commit_and_refresh_list(db, packing_list)
 
-    return {"data": _to_list_data(packing_list, include_items=True)}
+    if delta:
+        return _delta_response(packing_list, item=item)
+    return _list_response(db, packing_list, include_items=True)
 
 
 @router.delete("/lists/{list_id}/items/{item_id}")
-def delete_item(list_id: str, item_id: str, db: Session = Depends(get_db)):
+def delete_item(
+    list_id: str,
+    item_id: str,
+    delta: bool = Depends(_wants_delta),
+    db: Session = Depends(get_db),
+):
     packing_list, item = _get_list_item_or_404(db, list_id, item_id)
+    record_list_change(db, packing_list.id, item_summary_delta(item, sign=-1))
     db.delete(item)
     _commit_and_refresh_list(db, packing_list)
 
-    return {"data": _to_list_data(packing_list, include_items=True)}
+    if delta:
+        return _delta_response(packing_list, deleted_item_id=item_id)
+    return _list_response(db, packing_list, include_items=True)
+
+
+@router.post("/lists/{list_id}/items:reorder")
+def reorder_list_items(list_id: str, payload: ReorderItemsIn, db: Session = Depends(get_db)):
+    packing_list = _get_list_or_404(db, list_id)
+    try:
+        reorder_items(db, packing_list.id, payload.item_ids)
+    except InvalidMoveError as exc:
+        return _api_error(422, "validation_error", str(exc))
+    record_list_change(db, packing_list.id)
+    _commit_and_refresh_list(db, packing_list)
+    return _list_response(db, packing_list, include_items=True)
+
+
+@router.post("/lists/{list_id}/items/{item_id}:move")
+@query_budget(16)  # a move into a full gap rebalances the list and retries
+def move_list_item(
+    list_id: str,
+    item_id: str,
+    payload: MoveItemIn,
+    delta: bool = Depends(_wants_delta),
+    db: Session = Depends(get_db),
+):
+    packing_list, item = _get_list_item_or_404(db, list_id, item_id)
+    try:
+        move_item(db, item, after_id=payload.after_id, before_id=payload.before_id)
+    except InvalidMoveError as exc:
+        return _api_error(422, "validation_error", str(exc))
+    record_list_change(db, packing_list.id)
+    _commit_and_refresh_list(db, packing_list)
+
+    if delta:
+        return _delta_response(packing_list, item=item)
+    return _list_response(db, packing_list, include_items=True)
 
 
 @router.patch("/lists/{list_id}/unit")
-def set_unit(list_id: str, payload: SetUnitIn, db: Session = Depends(get_db)):
+def set_unit(
+    list_id: str,
+    payload: SetUnitIn,
+    delta: bool = Depends(_wants_delta),
+    db: Session = Depends(get_db),
+):
     packing_list = _get_list_or_404(db, list_id)
     packing_list.unit = payload.unit
     _commit_and_refresh_list(db, packing_list)
-    return {"data": _to_list_data(packing_list, include_items=True)}
+    if delta:
+        return _delta_response(packing_list)
+    return _list_response(db, packing_list, include_items=True)
 
 
 @router.get("/shared/{share_token}")
-def shared_view(share_token: str, db: Session = Depends(get_db)):
-    packing_list = db.execute(select(PackingList).where(PackingList.share_token == share_token)).scalar_one_or_none()
-    if not packing_list or not packing_list.is_shared:
+@query_budget(2)
+def shared_view(
+    share_token: str,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_read_db),
+):
+    cached = shared_view_cache.get(share_token)
+    if cached is None:
+        # Taken before the read so a write committed meanwhile keeps this result out of the cache.
+        generation = shared_view_cache.generation
+        packing_list = db.execute(select(PackingList).where(PackingList.share_token == share_token)).scalar_one_or_none()
+        if not packing_list or not packing_list.is_shared:
+            shared_view_cache.store_not_found(share_token, generation)
+            raise HTTPException(status_code=404, detail="Shared list not found")
+
+        shared = DataResponse(
+            data=SharedPackingListOut.model_construct(
+                id=packing_list.id,
+                title=packing_list.title,
+                description=packing_list.description,
+                unit=packing_list.unit,
+                items=_load_item_outs(db, packing_list.id),
+                summary=_to_summary_out(packing_list),
+            )
+        )
+        with serialization_timer():
+            body = shared.model_dump_json().encode()
+        cached = CachedSharedView(list_id=packing_list.id, etag=_list_etag(packing_list), body=body)
+        shared_view_cache.store(share_token, cached, generation)
+    elif cached is NOT_FOUND:
         raise HTTPException(status_code=404, detail="Shared list not found")
 
-    shared = SharedPackingListOut(
-        id=packing_list.id,
-        title=packing_list.title,
-        description=packing_list.description,
-        unit=packing_list.unit,
-        items=[GearItemOut.model_validate(item) for item in packing_list.items],
-        summary=_to_summary_out(packing_list),
-    )
-    return {"data": shared.model_dump(mode="json")}
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": f"public, max-age={settings.shared_cache_max_age}, must-revalidate",
+    }
+    if _etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
 
 
 @router.post("/lists/{list_id}/share/regenerate")
@@ -279,4 +726,5 @@ def regenerate_share_token(list_id: str, db: Session = Depends(get_db)):
     packing_list = _get_list_or_404(db, list_id)
     packing_list.share_token = generate_share_token()
     _commit_and_refresh_list(db, packing_list)
-    return {"data": _to_list_data(packing_list, include_items=True)}
+    shared_view_cache.invalidate_token(packing_list.share_token)
+    return _list_response(db, packing_list, include_items=True)
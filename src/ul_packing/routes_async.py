@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ul_packing import routes_api
+from ul_packing.db import get_async_db, get_async_read_db, get_db, get_read_db
+from ul_packing.export import ExportFormat, ExportResource, astream_export
+from ul_packing.importing import ImportFormat, ImportReport, insert_import_chunk, iter_import_chunks
+
+
+async def export_data(
+    resource: ExportResource,
+    export_format: ExportFormat = Query(default="ndjson", alias="format"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return routes_api._export_response(astream_export(db, resource, export_format), resource, export_format)
+
+
+async def import_list_items(
+    list_id: str,
+    request: Request,
+    import_format: ImportFormat = Query(default="csv", alias="format"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    await db.run_sync(routes_api._get_list_or_404, list_id)
+    report = ImportReport()
+    async with routes_api._spooled_body_lines(request) as lines:
+        # CSV parsing and validation run in a worker thread; only the chunk inserts use the event loop.
+        chunks = iter_import_chunks(lines, import_format, report)
+        while (chunk := await run_in_threadpool(next, chunks, None)) is not None:
+            first_line, rows = chunk
+            await db.run_sync(insert_import_chunk, list_id, first_line, rows, report)
+    return await db.run_sync(routes_api._import_report_response, list_id, report)
+
+
+# Endpoints whose sync implementation outlives the handler (streaming) or is already async.
+_NATIVE_ENDPOINTS: dict[Callable[..., Any], Callable[..., Any]] = {
+    routes_api.export_data: export_data,
+    routes_api.import_list_items: import_list_items,
+}
+
+
+_ASYNC_DEPENDENCIES = {get_db: get_async_db, get_read_db: get_async_read_db}
+
+
+def _run_sync_variant(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a sync ``db: Session`` endpoint as an ``async def`` taking an ``AsyncSession``.
+
+    The handler body runs through ``AsyncSession.run_sync``: its queries go through the
+    async driver on the event loop (greenlet hand-off) instead of Starlette's thread pool.
+    Handlers only touch ORM state before returning an already-serialized response.
+    """
+    signature = inspect.signature(endpoint, eval_str=True)
+    parameters = [
+        parameter.replace(annotation=AsyncSession, default=Depends(_ASYNC_DEPENDENCIES[parameter.default.dependency]))
+        if name == "db"
+        else parameter
+        for name, parameter in signature.parameters.items()
+    ]
+
+    async def variant(*args: Any, db: AsyncSession, **kwargs: Any) -> Any:
+        return await db.run_sync(lambda session: endpoint(*args, db=session, **kwargs))
+
+    variant.__name__ = endpoint.__name__
+    variant.__qualname__ = endpoint.__qualname__
+    variant.__doc__ = endpoint.__doc__
+    if hasattr(endpoint, "__query_budget__"):
+        variant.__query_budget__ = endpoint.__query_budget__  # type: ignore[attr-defined]
+    variant.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+    return variant
+
+
+def build_async_router(sync_router: APIRouter) -> APIRouter:
+    """Mirror every route of ``sync_router`` with an async handler bound to the async engine."""
+    async_router = APIRouter()
+    for route in sync_router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        endpoint = _NATIVE_ENDPOINTS.get(route.endpoint)
+        if endpoint is None:
+            if inspect.iscoroutinefunction(route.endpoint):
+                raise TypeError(f"{route.endpoint.__name__} needs a native async variant")
+            endpoint = _run_sync_variant(route.endpoint)
+        async_router.add_api_route(
+            route.path,
+            endpoint,
+            methods=sorted(route.methods),
+            name=route.name,
+            tags=route.tags,
+            response_model=route.response_model,
+            status_code=route.status_code,
+            response_class=route.response_class,
+        )
+    return async_router
+
+
+router = build_async_router(routes_api.router)
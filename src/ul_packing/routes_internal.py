@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from ul_packing import db
+from ul_packing.pool import pool_status
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+
+@router.get("/pool")
+def get_pool_stats() -> dict[str, Any]:
+    return {"data": {name: pool_status(engine) for name, engine in db.named_engines().items()}}
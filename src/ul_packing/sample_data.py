@@ -3,11 +3,12 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from ul_packing.gear_inventory import GEAR_INVENTORY_DESCRIPTION, GEAR_INVENTORY_TITLE
-from ul_packing.models import Category, GearItem, ItemKind, PackingList
-from ul_packing.services import generate_share_token
+from ul_packing.gear_inventory import get_or_create_gear_inventory_list
+from ul_packing.models import Category, GearItem, ItemKind
+from ul_packing.ordering import next_sort_order
+from ul_packing.services import bulk_insert_items
 
-_SAMPLE_GEAR_ITEMS: tuple[dict[str, object], ...] = (
+SAMPLE_GEAR_ITEMS: tuple[dict[str, object], ...] = (
     {"name": "DCFタープ", "category": Category.SHELTER, "weight_grams": 310, "quantity": 1, "kind": ItemKind.BASE, "notes": "ガイライン込み"},
     {"name": "ポリクロシート", "category": Category.SHELTER, "weight_grams": 55, "quantity": 1, "kind": ItemKind.BASE, "notes": "グランドシート"},
     {"name": "ペグセット", "category": Category.SHELTER, "weight_grams": 82, "quantity": 8, "kind": ItemKind.BASE, "notes": "アルミペグ"},
@@ -38,50 +39,10 @@ _SAMPLE_GEAR_ITEMS: tuple[dict[str, object], ...] = (
 
 
 def seed_sample_gear_inventory_data(db: Session) -> None:
-    inventory = db.execute(
-        select(PackingList)
-        .where(
-            PackingList.title == GEAR_INVENTORY_TITLE,
-            PackingList.description == GEAR_INVENTORY_DESCRIPTION,
-        )
-        .order_by(PackingList.created_at.asc())
-    ).scalars().first()
-
-    if inventory is None:
-        inventory = PackingList(
-            title=GEAR_INVENTORY_TITLE,
-            description=GEAR_INVENTORY_DESCRIPTION,
-            share_token=generate_share_token(),
-            is_shared=False,
-        )
-        db.add(inventory)
-        db.flush()
-
-    existing_names = {
-        name for name in db.execute(select(GearItem.name).where(GearItem.list_id == inventory.id)).scalars().all()
-    }
-    max_order = db.execute(
-        select(GearItem.sort_order)
-        .where(GearItem.list_id == inventory.id)
-        .order_by(GearItem.sort_order.desc())
-    ).scalars().first()
-    next_order = (max_order if max_order is not None else -1) + 1
-
-    for item in _SAMPLE_GEAR_ITEMS:
-        if str(item["name"]) in existing_names:
-            continue
-        db.add(
-            GearItem(
-                list_id=inventory.id,
-                name=str(item["name"]),
-                category=item["category"],
-                weight_grams=int(item["weight_grams"]),
-                quantity=int(item["quantity"]),
-                kind=item["kind"],
-                notes=str(item["notes"]),
-                sort_order=next_order,
-            )
-        )
-        next_order += 1
+    inventory = get_or_create_gear_inventory_list(db)
 
+    existing_names = set(db.execute(select(GearItem.name).where(GearItem.list_id == inventory.id)).scalars())
+    new_items = [item for item in SAMPLE_GEAR_ITEMS if item["name"] not in existing_names]
+    if new_items:
+        bulk_insert_items(db, inventory.id, new_items, next_sort_order(db, inventory.id))
     db.commit()
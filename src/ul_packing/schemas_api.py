@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from ul_packing.models import Category, ItemKind, Unit
 
+MAX_BATCH_ITEMS = 1000
+
 
 class ApiError(BaseModel):
     code: str
@@ -19,12 +21,28 @@ class ApiErrorResponse(BaseModel):
 
 
 class SummaryOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     base_weight_g: int
     consumable_weight_g: int
     worn_weight_g: int
     total_pack_g: int
 
 
+class WeightBucketOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    key: str
+    weight_g: int
+    item_count: int
+
+
+class ListSummaryOut(BaseModel):
+    list_id: str
+    summary: SummaryOut
+    breakdown: list[WeightBucketOut] | None = None
+
+
 class GearItemOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -40,6 +58,8 @@ class GearItemOut(BaseModel):
 
 
 class GearListItemOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     list_id: str
     list_title: str
@@ -63,10 +83,55 @@ class PackingListListItemOut(BaseModel):
     is_shared: bool
     created_at: datetime
     updated_at: datetime
+    item_count: int
+    summary: SummaryOut
 
 
 class PackingListDetailOut(PackingListListItemOut):
     items: list[GearItemOut]
+
+
+class ListDeltaOut(BaseModel):
+    list_id: str
+    unit: Unit
+    item_count: int
+    summary: SummaryOut
+    item: GearItemOut | None = None
+    deleted_item_id: str | None = None
+
+
+class BatchItemErrorOut(BaseModel):
+    index: int
+    details: list[dict[str, Any]]
+
+
+class BatchCreateItemsOut(BaseModel):
+    list_id: str
+    created: list[GearItemOut]
+    errors: list[BatchItemErrorOut]
+    item_count: int
+    summary: SummaryOut
+
+
+class BatchUpdateItemsOut(BaseModel):
+    list_id: str
+    updated_count: int
+    item_count: int
+    summary: SummaryOut
+
+
+class ImportFailureOut(BaseModel):
+    line: int
+    message: str
+
+
+class ImportReportOut(BaseModel):
+    list_id: str
+    imported: int
+    failed: int
+    chunks: int
+    failures: list[ImportFailureOut]
+    item_count: int
     summary: SummaryOut
 
 
@@ -79,8 +144,16 @@ class SharedPackingListOut(BaseModel):
     summary: SummaryOut
 
 
-class DataResponse(BaseModel):
-    data: Any
+DataT = TypeVar("DataT")
+
+
+class DataResponse(BaseModel, Generic[DataT]):
+    data: DataT
+
+
+class PageResponse(BaseModel, Generic[DataT]):
+    data: list[DataT]
+    next_cursor: str | None = None
 
 
 class CreateListIn(BaseModel):
@@ -92,6 +165,10 @@ class UpdateListIn(CreateListIn):
     pass
 
 
+class DuplicateListIn(BaseModel):
+    title: str | None = Field(default=None, min_length=1, max_length=100)
+
+
 class CreateItemIn(BaseModel):
     name: str = Field(min_length=1, max_length=120)
     category: Category = Category.OTHER
@@ -105,5 +182,43 @@ class UpdateItemIn(CreateItemIn):
     pass
 
 
+class ItemChangesIn(BaseModel):
+    name: str | None = Field(default=None, min_length=1, max_length=120)
+    category: Category | None = None
+    weight_grams: int | None = Field(default=None, ge=1)
+    quantity: int | None = Field(default=None, ge=1)
+    kind: ItemKind | None = None
+    notes: str | None = None
+
+
+class ItemPatchIn(ItemChangesIn):
+    id: str
+
+
+class ItemFilterIn(BaseModel):
+    ids: list[str] | None = Field(default=None, max_length=MAX_BATCH_ITEMS)
+    category: Category | None = None
+    kind: ItemKind | None = None
+
+
+class BulkItemUpdateIn(BaseModel):
+    where: ItemFilterIn = Field(default_factory=ItemFilterIn)
+    changes: ItemChangesIn
+
+
+class BatchUpdateItemsIn(BaseModel):
+    bulk: list[BulkItemUpdateIn] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+    items: list[ItemPatchIn] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+
+
+class MoveItemIn(BaseModel):
+    after_id: str | None = None
+    before_id: str | None = None
+
+
+class ReorderItemsIn(BaseModel):
+    item_ids: list[str] = Field(max_length=MAX_BATCH_ITEMS)
+
+
 class SetUnitIn(BaseModel):
     unit: Unit
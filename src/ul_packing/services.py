@@ -1,11 +1,43 @@
 from __future__ import annotations
 
 import secrets
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any, Protocol
+from uuid import uuid4
 
-from ul_packing.models import GearItem, ItemKind
+from sqlalchemy import String, case, func, insert, literal, or_, select, update
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
+
+from ul_packing.models import Category, GearItem, ItemKind, PackingList
+from ul_packing.ordering import SORT_ORDER_STEP
 from ul_packing.schemas import Summary
 
+SummaryDelta = dict[str, int]
+
+_SUMMARY_COLUMN_BY_KIND: dict[ItemKind, str] = {
+    ItemKind.BASE: "base_weight_g",
+    ItemKind.CONSUMABLE: "consumable_weight_g",
+    ItemKind.WORN: "worn_weight_g",
+}
+_SUMMARY_COLUMNS = (*_SUMMARY_COLUMN_BY_KIND.values(), "total_pack_g", "item_count")
+
+
+class UnknownItemsError(ValueError):
+    def __init__(self, item_ids: Sequence[str]):
+        super().__init__(f"unknown item ids: {', '.join(item_ids)}")
+        self.item_ids = list(item_ids)
+
+
+class WeighedItem(Protocol):
+    kind: ItemKind
+    weight_grams: int
+    quantity: int
+
 
 def generate_share_token() -> str:
     return secrets.token_urlsafe(24)
@@ -33,6 +65,257 @@ def compute_summary(items: Iterable[GearItem]) -> Summary:
     )
 
 
+def item_summary_delta(item: WeighedItem, sign: int = 1) -> SummaryDelta:
+    weight = sign * item.weight_grams * item.quantity
+    return {_SUMMARY_COLUMN_BY_KIND[item.kind]: weight, "total_pack_g": weight, "item_count": sign}
+
+
+def rows_summary_delta(rows: Iterable[Mapping[str, Any]]) -> SummaryDelta:
+    delta: SummaryDelta = {}
+    for row in rows:
+        weight = row["weight_grams"] * row["quantity"]
+        column = _SUMMARY_COLUMN_BY_KIND[row["kind"]]
+        delta[column] = delta.get(column, 0) + weight
+        delta["total_pack_g"] = delta.get("total_pack_g", 0) + weight
+        delta["item_count"] = delta.get("item_count", 0) + 1
+    return delta
+
+
+def bulk_insert_items(
+    db: Session,
+    list_id: str,
+    items: Sequence[Mapping[str, Any]],
+    start_sort_order: int,
+) -> list[dict[str, Any]]:
+    """Insert item column mappings with one executemany and record them on the list.
+
+    Ids and sort orders (``SORT_ORDER_STEP`` apart, starting at ``start_sort_order``)
+    are assigned here; the caller commits. Returns the inserted rows.
+    """
+    rows = [
+        {
+            **item,
+            "id": str(uuid4()),
+            "list_id": list_id,
+            "sort_order": start_sort_order + offset * SORT_ORDER_STEP,
+        }
+        for offset, item in enumerate(items)
+    ]
+    if rows:
+        db.execute(insert(GearItem), rows)
+        record_list_change(db, list_id, rows_summary_delta(rows))
+    return rows
+
+
+def _ensure_list_items(db: Session, list_id: str, item_ids: Iterable[str]) -> None:
+    item_ids = set(item_ids)
+    if not item_ids:
+        return
+    existing = set(
+        db.execute(select(GearItem.id).where(GearItem.list_id == list_id, GearItem.id.in_(item_ids))).scalars()
+    )
+    unknown = sorted(item_ids - existing)
+    if unknown:
+        raise UnknownItemsError(unknown)
+
+
+def update_items_where(
+    db: Session,
+    list_id: str,
+    changes: Mapping[str, Any],
+    *,
+    item_ids: Sequence[str] | None = None,
+    category: Category | None = None,
+    kind: ItemKind | None = None,
+) -> int:
+    """Apply the same column changes to every matching item with one UPDATE.
+
+    The stored list summary is not adjusted; callers rebuild it once after all
+    their updates. Raises ``UnknownItemsError`` before writing anything if one of
+    ``item_ids`` is not an item of the list. Returns the number of rows matched.
+    """
+    if not changes:
+        return 0
+    stmt = update(GearItem).where(GearItem.list_id == list_id)
+    if item_ids is not None:
+        _ensure_list_items(db, list_id, item_ids)
+        stmt = stmt.where(GearItem.id.in_(item_ids))
+    if category is not None:
+        stmt = stmt.where(GearItem.category == category)
+    if kind is not None:
+        stmt = stmt.where(GearItem.kind == kind)
+    return db.execute(stmt.values(changes).execution_options(synchronize_session=False)).rowcount
+
+
+def update_items_by_id(db: Session, list_id: str, patches: Sequence[Mapping[str, Any]]) -> int:
+    """Apply per-item partial updates (each mapping carries ``id``) as executemany UPDATEs.
+
+    Raises ``UnknownItemsError`` before writing anything if an id is not an item
+    of the list. Like ``update_items_where`` the list summary is left to the caller.
+    """
+    patches = [patch for patch in patches if len(patch) > 1]
+    if not patches:
+        return 0
+    _ensure_list_items(db, list_id, (patch["id"] for patch in patches))
+    # ORM bulk UPDATE by primary key groups the patches by their key sets, so
+    # items changing the same columns share one executemany statement.
+    db.execute(update(GearItem).execution_options(synchronize_session=False), patches)
+    return len(patches)
+
+
+class _random_uuid(FunctionElement):
+    """SQL expression producing a random UUID string, used to copy rows with INSERT ... SELECT."""
+
+    type = String(36)
+    inherit_cache = True
+
+
+@compiles(_random_uuid)
+def _compile_random_uuid(element: _random_uuid, compiler: Any, **kw: Any) -> str:
+    raise CompileError(f"random UUIDs are not supported on {compiler.dialect.name}")
+
+
+@compiles(_random_uuid, "postgresql")
+def _compile_random_uuid_postgresql(element: _random_uuid, compiler: Any, **kw: Any) -> str:
+    return "CAST(gen_random_uuid() AS VARCHAR)"
+
+
+@compiles(_random_uuid, "sqlite")
+def _compile_random_uuid_sqlite(element: _random_uuid, compiler: Any, **kw: Any) -> str:
+    return (
+        "lower(hex(randomblob(4)) || '-' || hex(randomblob(2)) || '-4' || substr(hex(randomblob(2)), 2) || '-' || "
+        "substr('89ab', 1 + (abs(random()) % 4), 1) || substr(hex(randomblob(2)), 2) || '-' || hex(randomblob(6)))"
+    )
+
+
+def duplicate_list(db: Session, source: PackingList, title: str | None = None) -> str:
+    """Copy a list and all of its items inside the database; the caller commits.
+
+    Each table is copied with one ``INSERT ... SELECT`` so the cost does not grow
+    with round trips. Items keep their ``sort_order`` and the stored summary is
+    carried over; the copy gets a fresh share token and no system role.
+    Returns the new list id.
+    """
+    new_list_id = str(uuid4())
+    now = datetime.now(UTC)
+    list_columns = {
+        "id": literal(new_list_id),
+        "title": literal(title) if title is not None else PackingList.title,
+        "description": PackingList.description,
+        "unit": PackingList.unit,
+        "share_token": literal(generate_share_token()),
+        "is_shared": PackingList.is_shared,
+        "created_at": literal(now, PackingList.created_at.type),
+        "updated_at": literal(now, PackingList.updated_at.type),
+        **{column: getattr(PackingList, column) for column in _SUMMARY_COLUMNS},
+    }
+    db.execute(
+        insert(PackingList).from_select(
+            list(list_columns), select(*list_columns.values()).where(PackingList.id == source.id)
+        )
+    )
+
+    item_columns = {
+        "id": _random_uuid(),
+        "list_id": literal(new_list_id),
+        **{
+            column: getattr(GearItem, column)
+            for column in ("name", "category", "weight_grams", "quantity", "kind", "notes", "sort_order")
+        },
+    }
+    db.execute(
+        insert(GearItem).from_select(
+            list(item_columns), select(*item_columns.values()).where(GearItem.list_id == source.id)
+        )
+    )
+    return new_list_id
+
+
+def record_list_change(db: Session, list_id: str, *deltas: SummaryDelta) -> None:
+    """Bump the list's version and adjust its stored summary in the caller's transaction.
+
+    Called for every item change, including ones that leave the weights untouched,
+    so the list version always moves. Updates are ``column = column + delta`` so
+    concurrent writers never overwrite each other's changes.
+    """
+    merged: SummaryDelta = {}
+    for delta in deltas:
+        for column, value in delta.items():
+            merged[column] = merged.get(column, 0) + value
+    values: dict[str, object] = {
+        column: getattr(PackingList, column) + value for column, value in merged.items() if value
+    }
+    values["version"] = PackingList.version + 1
+    values["updated_at"] = datetime.now(UTC)
+    db.execute(update(PackingList).where(PackingList.id == list_id).values(values))
+
+
+def _summary_aggregates() -> dict[str, ColumnElement[int]]:
+    weight = GearItem.weight_grams * GearItem.quantity
+    aggregates: dict[str, ColumnElement[int]] = {
+        column: func.coalesce(func.sum(case((GearItem.kind == kind, weight), else_=0)), 0)
+        for kind, column in _SUMMARY_COLUMN_BY_KIND.items()
+    }
+    aggregates["total_pack_g"] = func.coalesce(func.sum(weight), 0)
+    aggregates["item_count"] = func.count(GearItem.id)
+    return aggregates
+
+
+def find_inconsistent_list_summaries(db: Session) -> list[str]:
+    actual = (
+        select(
+            GearItem.list_id.label("list_id"),
+            *(aggregate.label(column) for column, aggregate in _summary_aggregates().items()),
+        )
+        .group_by(GearItem.list_id)
+        .subquery()
+    )
+    return list(
+        db.execute(
+            select(PackingList.id)
+            .outerjoin(actual, actual.c.list_id == PackingList.id)
+            .where(
+                or_(
+                    *(
+                        getattr(PackingList, column) != func.coalesce(actual.c[column], 0)
+                        for column in _SUMMARY_COLUMNS
+                    )
+                )
+            )
+            .order_by(PackingList.id)
+        ).scalars()
+    )
+
+
+def rebuild_list_summaries(db: Session, list_ids: Sequence[str] | None = None, touch: bool = False) -> int:
+    """Recompute stored summaries from ``gear_items``.
+
+    Rebuilds every list when ``list_ids`` is None. ``updated_at`` is preserved unless
+    ``touch`` is set, for callers that rebuild as part of an item edit (the version
+    is bumped either way). Returns the number of lists updated.
+    """
+    if list_ids is not None and not list_ids:
+        return 0
+    values: dict[str, object] = {
+        column: select(aggregate).where(GearItem.list_id == PackingList.id).scalar_subquery()
+        for column, aggregate in _summary_aggregates().items()
+    }
+    values["updated_at"] = datetime.now(UTC) if touch else PackingList.updated_at
+    stmt = update(PackingList).values(values).execution_options(synchronize_session=False)
+    if list_ids is not None:
+        stmt = stmt.where(PackingList.id.in_(list_ids))
+    return db.execute(stmt).rowcount
+
+
+def check_list_summaries(db: Session, repair: bool = False) -> list[str]:
+    """Return ids of lists whose stored summary drifted from their items, rebuilding them when ``repair``."""
+    inconsistent = find_inconsistent_list_summaries(db)
+    if repair and inconsistent:
+        rebuild_list_summaries(db, inconsistent)
+        db.commit()
+    return inconsistent
+
+
 def to_ounces(weight_grams: int) -> float:
     return round(weight_grams / 28.349523125, 1)
 
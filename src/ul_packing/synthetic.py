@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import base64
+import random
+import secrets
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ul_packing.models import GearItem, PackingList, Unit
+from ul_packing.ordering import SORT_ORDER_STEP
+from ul_packing.sample_data import SAMPLE_GEAR_ITEMS
+from ul_packing.services import rows_summary_delta
+
+SYNTHETIC_BATCH_ROWS = 20_000
+
+_TRAILS = (
+    "北アルプス縦走",
+    "南アルプス",
+    "八ヶ岳",
+    "大峰奥駈道",
+    "熊野古道",
+    "奥秩父主脈",
+    "飯豊連峰",
+    "屋久島",
+    "ジョン・ミューア・トレイル",
+    "パシフィック・クレスト・トレイル",
+)
+_SEASONS = ("春", "夏", "秋", "冬")
+
+
+@dataclass
+class SyntheticReport:
+    lists: int = 0
+    items: int = 0
+    batches: int = 0
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def _share_token(rng: random.Random) -> str:
+    # Same shape as generate_share_token(), but cheaper than secrets for millions of rows.
+    return base64.urlsafe_b64encode(rng.randbytes(24)).rstrip(b"=").decode()
+
+
+def _item_rows(rng: random.Random, id_rng: random.Random, list_id: str, count: int) -> list[dict[str, Any]]:
+    rows = []
+    for position in range(count):
+        template = rng.choice(SAMPLE_GEAR_ITEMS)
+        rows.append(
+            {
+                "id": _uuid(id_rng),
+                "list_id": list_id,
+                "name": template["name"],
+                "category": template["category"],
+                "weight_grams": max(1, round(int(template["weight_grams"]) * rng.uniform(0.8, 1.2))),
+                "quantity": template["quantity"],
+                "kind": template["kind"],
+                "notes": template["notes"],
+                "sort_order": position * SORT_ORDER_STEP,
+            }
+        )
+    return rows
+
+
+def _list_row(
+    rng: random.Random, id_rng: random.Random, items: list[dict[str, Any]], created_at: datetime
+) -> dict[str, Any]:
+    nights = rng.randint(1, 7)
+    return {
+        "title": f"{rng.choice(_TRAILS)} {rng.choice(_SEASONS)} {nights}泊",
+        "description": f"{nights}泊{nights + 1}日の装備",
+        "unit": Unit.OZ if rng.random() < 0.2 else Unit.G,
+        "share_token": _share_token(id_rng),
+        "is_shared": rng.random() < 0.8,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "version": 1,
+        "base_weight_g": 0,
+        "consumable_weight_g": 0,
+        "worn_weight_g": 0,
+        "total_pack_g": 0,
+        "item_count": 0,
+        **rows_summary_delta(items),
+    }
+
+
+def generate_synthetic_data(
+    db: Session,
+    lists: int,
+    min_items: int = 10,
+    max_items: int = 50,
+    seed: int = 0,
+    batch_rows: int = SYNTHETIC_BATCH_ROWS,
+    progress: Callable[[SyntheticReport], None] | None = None,
+) -> SyntheticReport:
+    """Insert ``lists`` packing lists of ``min_items``..``max_items`` items each.
+
+    Titles, items and weights are derived from ``seed`` only, so the same arguments
+    produce the same content. Ids and share tokens come from a per-run random source,
+    so generating into a database that already holds a run never collides. Summaries
+    are computed while generating, and rows go in with one Core executemany per table
+    and a commit roughly every ``batch_rows`` list and item rows. ``progress`` is
+    called after each commit.
+    """
+    rng = random.Random(seed)
+    id_rng = random.Random(secrets.randbits(128))
+    report = SyntheticReport()
+    # Spaced one second apart, oldest first, so keyset pages follow generation order.
+    first_created_at = datetime.now(UTC) - timedelta(seconds=lists)
+    list_rows: list[dict[str, Any]] = []
+    item_rows: list[dict[str, Any]] = []
+
+    def flush() -> None:
+        # Core inserts on the tables: the rows are complete, so the ORM bulk path has nothing to add.
+        db.execute(insert(PackingList.__table__), list_rows)
+        if item_rows:
+            db.execute(insert(GearItem.__table__), item_rows)
+        db.commit()
+        report.lists += len(list_rows)
+        report.items += len(item_rows)
+        report.batches += 1
+        list_rows.clear()
+        item_rows.clear()
+        if progress is not None:
+            progress(report)
+
+    for index in range(lists):
+        list_id = _uuid(id_rng)
+        items = _item_rows(rng, id_rng, list_id, rng.randint(min_items, max_items))
+        list_rows.append({"id": list_id, **_list_row(rng, id_rng, items, first_created_at + timedelta(seconds=index))})
+        item_rows.extend(items)
+        if len(list_rows) + len(item_rows) >= batch_rows:
+            flush()
+    if list_rows:
+        flush()
+    return report
@@ -1,5 +1,83 @@
+import asyncio
+import csv
+import inspect
+import io
+import json
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from ul_packing import db as db_module
+from ul_packing import importing as importing_module
+from ul_packing import main as main_module
+from ul_packing.cache import shared_view_cache
+from ul_packing.db import Base
+from ul_packing.gear_inventory import GEAR_INVENTORY_ROLE, get_or_create_gear_inventory_list
+from ul_packing.main import READ_PRIMARY_COOKIE, create_app
 from ul_packing.models import GearItem, PackingList
-from ul_packing.services import generate_share_token
+from ul_packing.routes_api import router as sync_router
+from ul_packing.routes_async import router as async_router
+from ul_packing.services import check_list_summaries, generate_share_token
+
+
+def test_async_router_mirrors_every_route_with_async_handlers() -> None:
+    def route_keys(router):
+        return {(route.path, tuple(sorted(route.methods))) for route in router.routes}
+
+    assert route_keys(async_router) == route_keys(sync_router)
+    assert all(inspect.iscoroutinefunction(route.endpoint) for route in async_router.routes)
+
+
+def test_internal_pool_endpoint_is_opt_in() -> None:
+    with TestClient(create_app(internal_endpoints=True)) as internal_client:
+        response = internal_client.get("/internal/pool")
+    assert response.status_code == 200
+    assert "pool" in response.json()["data"]["primary"]
+
+    with TestClient(create_app(internal_endpoints=False)) as public_client:
+        assert public_client.get("/internal/pool").status_code == 404
+
+
+def test_metrics_endpoint_is_opt_in_and_exposes_route_pool_and_cache_metrics(session) -> None:
+    app = create_app(database_async=False, metrics_enabled=True)
+    app.dependency_overrides[db_module.get_db] = lambda: session
+    app.dependency_overrides[db_module.get_read_db] = lambda: session
+    with TestClient(app) as metrics_client:
+        metrics_client.get("/api/v1/lists")
+        response = metrics_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'route="/api/v1/lists",status="200"' in response.text
+    assert "# TYPE ul_packing_db_pool_checked_out gauge" in response.text
+    assert 'ul_packing_cache_hit_ratio{cache="shared_view"}' in response.text
+
+    with TestClient(create_app()) as plain_client:
+        assert plain_client.get("/metrics").status_code == 404
+
+
+def test_replica_serves_reads_outside_the_read_your_writes_window(monkeypatch, tmp_path) -> None:
+    def file_sessionmaker(name: str) -> sessionmaker:
+        engine = create_engine(f"sqlite+pysqlite:///{tmp_path / name}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(engine)
+        return sessionmaker(bind=engine, autoflush=False)
+
+    monkeypatch.setattr(db_module, "SessionLocal", file_sessionmaker("primary.db"))
+    monkeypatch.setattr(db_module, "ReplicaSessionLocal", file_sessionmaker("replica.db"))
+    monkeypatch.setattr(main_module, "settings", replace(main_module.settings, database_replica_url="sqlite://"))
+
+    with TestClient(main_module.create_app(database_async=False)) as replica_client:
+        created = replica_client.post("/api/v1/lists", json={"title": "Fresh"})
+        assert READ_PRIMARY_COOKIE in created.cookies
+        assert [item["title"] for item in replica_client.get("/api/v1/lists").json()["data"]] == ["Fresh"]
+
+        replica_client.cookies.clear()
+        assert replica_client.get("/api/v1/lists").json()["data"] == []
+        assert READ_PRIMARY_COOKIE not in replica_client.get("/api/v1/lists").cookies
 
 
 def test_list_api_crud_and_share_flow(client, session) -> None:
@@ -67,6 +145,380 @@ def test_list_api_crud_and_share_flow(client, session) -> None:
     assert delete_item.json()["data"]["items"] == []
 
 
+def test_item_mutations_maintain_stored_summary(client, session) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Summary"}).json()["data"]["id"]
+    item_payload = {"name": "Food", "category": "food", "weight_grams": 300, "quantity": 2, "kind": "base", "notes": ""}
+
+    created = client.post(f"/api/v1/lists/{list_id}/items", json=item_payload).json()["data"]
+    assert created["summary"]["base_weight_g"] == 600
+    assert created["item_count"] == 1
+
+    item_id = created["items"][0]["id"]
+    updated = client.patch(
+        f"/api/v1/lists/{list_id}/items/{item_id}",
+        json={**item_payload, "quantity": 3, "kind": "consumable"},
+    ).json()["data"]
+    assert updated["summary"] == {
+        "base_weight_g": 0,
+        "consumable_weight_g": 900,
+        "worn_weight_g": 0,
+        "total_pack_g": 900,
+    }
+
+    listed = client.get("/api/v1/lists").json()["data"][0]
+    assert listed["item_count"] == 1
+    assert listed["summary"]["total_pack_g"] == 900
+
+    deleted = client.delete(f"/api/v1/lists/{list_id}/items/{item_id}").json()["data"]
+    assert deleted["summary"]["total_pack_g"] == 0
+    assert deleted["item_count"] == 0
+    assert check_list_summaries(session) == []
+
+
+def test_get_list_summary_with_category_breakdown(client) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Breakdown"}).json()["data"]["id"]
+    for name, category, weight_grams in [("Tent", "shelter", 800), ("Tarp", "shelter", 300), ("Stove", "cooking", 50)]:
+        client.post(
+            f"/api/v1/lists/{list_id}/items",
+            json={"name": name, "category": category, "weight_grams": weight_grams, "quantity": 1, "kind": "base", "notes": ""},
+        )
+
+    plain = client.get(f"/api/v1/lists/{list_id}/summary")
+    assert plain.status_code == 200
+    assert plain.json()["data"]["summary"]["base_weight_g"] == 1150
+    assert plain.json()["data"]["breakdown"] is None
+
+    response = client.get(f"/api/v1/lists/{list_id}/summary", params={"breakdown": "category"})
+    assert response.status_code == 200
+    assert response.json()["data"]["breakdown"] == [
+        {"key": "shelter", "weight_g": 1100, "item_count": 2},
+        {"key": "cooking", "weight_g": 50, "item_count": 1},
+    ]
+
+    invalid = client.get(f"/api/v1/lists/{list_id}/summary", params={"breakdown": "color"})
+    assert invalid.status_code == 422
+
+
+def test_list_detail_and_shared_view_support_conditional_get(client) -> None:
+    created = client.post("/api/v1/lists", json={"title": "Conditional"}).json()["data"]
+    list_id = created["id"]
+    item_payload = {"name": "Tent", "category": "shelter", "weight_grams": 800, "quantity": 1, "kind": "base", "notes": ""}
+    item_id = client.post(f"/api/v1/lists/{list_id}/items", json=item_payload).json()["data"]["items"][0]["id"]
+
+    detail = client.get(f"/api/v1/lists/{list_id}")
+    etag = detail.headers["etag"]
+    assert detail.headers["cache-control"] == "private, no-cache"
+
+    not_modified = client.get(f"/api/v1/lists/{list_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+    client.patch(f"/api/v1/lists/{list_id}/items/{item_id}", json={**item_payload, "name": "Tent v2"})
+    renamed = client.get(f"/api/v1/lists/{list_id}", headers={"If-None-Match": etag})
+    assert renamed.status_code == 200
+    assert renamed.headers["etag"] != etag
+
+    shared = client.get(f"/api/v1/shared/{created['share_token']}")
+    assert shared.status_code == 200
+    assert shared.headers["cache-control"].startswith("public, max-age=")
+    shared_etag = shared.headers["etag"]
+    assert client.get(f"/api/v1/shared/{created['share_token']}", headers={"If-None-Match": shared_etag}).status_code == 304
+
+    client.patch(f"/api/v1/lists/{list_id}/unit", json={"unit": "oz"})
+    changed = client.get(f"/api/v1/shared/{created['share_token']}", headers={"If-None-Match": shared_etag})
+    assert changed.status_code == 200
+    assert changed.json()["data"]["unit"] == "oz"
+
+
+def test_item_mutations_return_minimal_delta_when_preferred(client) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Delta"}).json()["data"]["id"]
+    item_payload = {"name": "Tent", "category": "shelter", "weight_grams": 800, "quantity": 1, "kind": "base", "notes": ""}
+    client.post(f"/api/v1/lists/{list_id}/items", json={**item_payload, "name": "Pack"})
+
+    created = client.post(
+        f"/api/v1/lists/{list_id}/items",
+        json=item_payload,
+        headers={"Prefer": "return=minimal"},
+    )
+    assert created.status_code == 200
+    assert created.headers["preference-applied"] == "return=minimal"
+    data = created.json()["data"]
+    assert "items" not in data
+    assert data["item"]["name"] == "Tent"
+    assert data["item"]["sort_order"] == 1024
+    assert data["item_count"] == 2
+    assert data["summary"]["base_weight_g"] == 1600
+
+    item_id = data["item"]["id"]
+    updated = client.patch(
+        f"/api/v1/lists/{list_id}/items/{item_id}",
+        params={"response": "delta"},
+        json={**item_payload, "weight_grams": 500},
+    ).json()["data"]
+    assert updated["item"]["weight_grams"] == 500
+    assert updated["summary"]["base_weight_g"] == 1300
+
+    unit = client.patch(f"/api/v1/lists/{list_id}/unit", params={"response": "delta"}, json={"unit": "oz"}).json()["data"]
+    assert unit["unit"] == "oz"
+    assert unit["item"] is None
+
+    deleted = client.delete(f"/api/v1/lists/{list_id}/items/{item_id}", params={"response": "delta"})
+    assert deleted.json()["data"]["deleted_item_id"] == item_id
+    assert deleted.json()["data"]["summary"]["base_weight_g"] == 800
+    assert deleted.headers["etag"] == client.get(f"/api/v1/lists/{list_id}").headers["etag"]
+
+
+def test_create_items_batch_inserts_valid_items_and_reports_errors(client, session) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Batch"}).json()["data"]["id"]
+    client.post(
+        f"/api/v1/lists/{list_id}/items",
+        json={"name": "Existing", "category": "other", "weight_grams": 10, "quantity": 1, "kind": "base", "notes": ""},
+    )
+
+    response = client.post(
+        f"/api/v1/lists/{list_id}/items:batch",
+        json=[
+            {"name": " Tent ", "category": "shelter", "weight_grams": 800},
+            {"name": "", "weight_grams": 10},
+            {"name": "Snack", "category": "food", "weight_grams": 100, "quantity": 3, "kind": "consumable"},
+            "not an item",
+        ],
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [(item["name"], item["sort_order"]) for item in data["created"]] == [("Tent", 1024), ("Snack", 2048)]
+    assert [error["index"] for error in data["errors"]] == [1, 3]
+    assert data["errors"][0]["details"][0]["loc"] == ["name"]
+    assert data["item_count"] == 3
+    assert data["summary"] == {"base_weight_g": 810, "consumable_weight_g": 300, "worn_weight_g": 0, "total_pack_g": 1110}
+
+    detail = client.get(f"/api/v1/lists/{list_id}").json()["data"]
+    assert [item["name"] for item in detail["items"]] == ["Existing", "Tent", "Snack"]
+    assert check_list_summaries(session) == []
+
+
+def test_update_items_batch_applies_bulk_and_per_item_changes(client, session) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Batch edit"}).json()["data"]["id"]
+    created = client.post(
+        f"/api/v1/lists/{list_id}/items:batch",
+        json=[
+            {"name": "Tent", "category": "shelter", "weight_grams": 800},
+            {"name": "Rice", "category": "food", "weight_grams": 200},
+            {"name": "Bar", "category": "food", "weight_grams": 50, "quantity": 2},
+        ],
+    ).json()["data"]["created"]
+    tent_id, rice_id, _ = (item["id"] for item in created)
+
+    response = client.patch(
+        f"/api/v1/lists/{list_id}/items:batch",
+        json={
+            "bulk": [{"where": {"category": "food"}, "changes": {"kind": "consumable"}}],
+            "items": [
+                {"id": tent_id, "name": " Tarp ", "weight_grams": 300, "kind": "worn"},
+                {"id": rice_id, "quantity": 3},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["updated_count"] == 4
+    assert data["item_count"] == 3
+    assert data["summary"] == {"base_weight_g": 0, "consumable_weight_g": 700, "worn_weight_g": 300, "total_pack_g": 1000}
+    assert response.headers["etag"] == f'"{list_id}.3"'
+
+    items = client.get(f"/api/v1/lists/{list_id}").json()["data"]["items"]
+    assert [(item["name"], item["kind"], item["quantity"]) for item in items] == [
+        ("Tarp", "worn", 1),
+        ("Rice", "consumable", 3),
+        ("Bar", "consumable", 2),
+    ]
+    assert check_list_summaries(session) == []
+
+
+def test_update_items_batch_rejects_unknown_ids_without_writing(client) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Batch edit"}).json()["data"]["id"]
+    other_id = client.post("/api/v1/lists", json={"title": "Other"}).json()["data"]["id"]
+    item_id = client.post(f"/api/v1/lists/{list_id}/items", json={"name": "Tent", "weight_grams": 800}).json()["data"][
+        "items"
+    ][0]["id"]
+    foreign_id = client.post(f"/api/v1/lists/{other_id}/items", json={"name": "Stove", "weight_grams": 90}).json()[
+        "data"
+    ]["items"][0]["id"]
+
+    response = client.patch(
+        f"/api/v1/lists/{list_id}/items:batch",
+        json={
+            "bulk": [{"changes": {"kind": "worn"}}],
+            "items": [{"id": item_id, "weight_grams": 1}, {"id": foreign_id, "weight_grams": 1}],
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error"]["details"] == {"item_ids": [foreign_id]}
+    detail = client.get(f"/api/v1/lists/{list_id}").json()["data"]
+    assert (detail["items"][0]["kind"], detail["items"][0]["weight_grams"]) == ("base", 800)
+    assert detail["summary"]["base_weight_g"] == 800
+
+
+def test_update_items_batch_rejects_unknown_bulk_ids_like_item_patches(client) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Batch edit"}).json()["data"]["id"]
+    item_id = client.post(f"/api/v1/lists/{list_id}/items", json={"name": "Tent", "weight_grams": 800}).json()["data"][
+        "items"
+    ][0]["id"]
+
+    response = client.patch(
+        f"/api/v1/lists/{list_id}/items:batch",
+        json={"bulk": [{"where": {"ids": [item_id, "missing"]}, "changes": {"kind": "worn"}}]},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error"]["details"] == {"item_ids": ["missing"]}
+    assert client.get(f"/api/v1/lists/{list_id}").json()["data"]["items"][0]["kind"] == "base"
+
+
+def test_update_items_batch_without_matches_keeps_the_list_version(client) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Batch edit"}).json()["data"]["id"]
+    client.post(f"/api/v1/lists/{list_id}/items", json={"name": "Tent", "weight_grams": 800})
+    etag = client.get(f"/api/v1/lists/{list_id}").headers["etag"]
+
+    for payload in ({}, {"bulk": [{"where": {"category": "food"}, "changes": {"kind": "consumable"}}]}):
+        response = client.patch(f"/api/v1/lists/{list_id}/items:batch", json=payload)
+        assert response.status_code == 200
+        assert response.json()["data"]["updated_count"] == 0
+        assert response.headers["etag"] == etag
+
+    assert client.get(f"/api/v1/lists/{list_id}").headers["etag"] == etag
+
+
+def test_duplicate_list_copies_items_in_order_with_fresh_token(client, session) -> None:
+    source = client.post("/api/v1/lists", json={"title": "Summer", "description": "JMT"}).json()["data"]
+    client.post(
+        f"/api/v1/lists/{source['id']}/items:batch",
+        json=[
+            {"name": "Tent", "category": "shelter", "weight_grams": 800},
+            {"name": "Snack", "category": "food", "weight_grams": 100, "quantity": 3, "kind": "consumable"},
+        ],
+    )
+
+    response = client.post(f"/api/v1/lists/{source['id']}/duplicate", json={"title": " Autumn "})
+    assert response.status_code == 200
+    copy = response.json()["data"]
+    assert copy["id"] != source["id"]
+    assert (copy["title"], copy["description"], copy["item_count"]) == ("Autumn", "JMT", 2)
+    assert copy["share_token"] != source["share_token"]
+    assert copy["summary"]["total_pack_g"] == 1100
+
+    source_items = client.get(f"/api/v1/lists/{source['id']}").json()["data"]["items"]
+    copy_items = client.get(f"/api/v1/lists/{copy['id']}").json()["data"]["items"]
+    assert [(item["name"], item["sort_order"], item["kind"]) for item in copy_items] == [
+        (item["name"], item["sort_order"], item["kind"]) for item in source_items
+    ]
+    assert not {item["id"] for item in copy_items} & {item["id"] for item in source_items}
+    assert all(len(item["id"]) == 36 for item in copy_items)
+    assert check_list_summaries(session) == []
+
+    untitled = client.post(f"/api/v1/lists/{source['id']}/duplicate")
+    assert untitled.json()["data"]["title"] == "Summer"
+    assert client.post("/api/v1/lists/missing/duplicate").status_code == 404
+
+
+def test_import_items_streams_csv_into_list(client, session) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Import"}).json()["data"]["id"]
+    body = "Item Name,Category,desc,qty,weight,unit,url,price,worn,consumable\n"
+    body += "Tarp,Shelter,,1,300,g,,,,\n"
+    body += ",Shelter,,1,300,g,,,,\n"
+    body += "Fuel,Kitchen,,1,4,oz,,,,1\n"
+
+    response = client.post(
+        f"/api/v1/lists/{list_id}/items:import",
+        params={"format": "lighterpack"},
+        content=body.encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["imported"], data["failed"], data["chunks"]) == (2, 1, 1)
+    assert data["failures"][0]["line"] == 3
+    assert data["item_count"] == 2
+    assert data["summary"]["consumable_weight_g"] == 113
+    items = client.get(f"/api/v1/lists/{list_id}").json()["data"]["items"]
+    assert [(item["name"], item["category"]) for item in items] == [("Tarp", "shelter"), ("Fuel", "cooking")]
+    assert check_list_summaries(session) == []
+    assert client.post("/api/v1/lists/missing/items:import", content=b"name\n").status_code == 404
+
+
+def test_import_items_parses_csv_off_the_event_loop(client, monkeypatch) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Import"}).json()["data"]["id"]
+    parse_threads_with_loop: list[bool] = []
+    original_iter_import_rows = importing_module.iter_import_rows
+
+    def recording_iter_import_rows(lines, import_format):
+        for row in original_iter_import_rows(lines, import_format):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                parse_threads_with_loop.append(False)
+            else:
+                parse_threads_with_loop.append(True)
+            yield row
+
+    monkeypatch.setattr(importing_module, "iter_import_rows", recording_iter_import_rows)
+    body = "name,weight_grams\n" + "".join(f"Item {index},10\n" for index in range(3))
+
+    response = client.post(f"/api/v1/lists/{list_id}/items:import", content=body.encode())
+
+    assert response.json()["data"]["imported"] == 3
+    assert parse_threads_with_loop == [False, False, False]
+
+
+def test_move_item_updates_only_the_moved_row_and_rebalances_when_needed(client, session) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Move"}).json()["data"]["id"]
+    created = client.post(
+        f"/api/v1/lists/{list_id}/items:batch",
+        json=[{"name": name, "weight_grams": 10} for name in ["A", "B", "C"]],
+    ).json()["data"]["created"]
+    a_id, b_id, c_id = (item["id"] for item in created)
+
+    moved = client.post(
+        f"/api/v1/lists/{list_id}/items/{c_id}:move",
+        params={"response": "delta"},
+        json={"after_id": a_id},
+    ).json()["data"]
+    assert moved["item"]["sort_order"] == 512
+    assert [item["name"] for item in client.get(f"/api/v1/lists/{list_id}").json()["data"]["items"]] == ["A", "C", "B"]
+    assert session.get(GearItem, b_id).sort_order == 1024
+
+    session.execute(update(GearItem).where(GearItem.id == b_id).values(sort_order=1))
+    session.commit()
+    to_front = client.post(f"/api/v1/lists/{list_id}/items/{c_id}:move", json={"after_id": a_id, "before_id": b_id})
+    assert to_front.status_code == 200
+    items = to_front.json()["data"]["items"]
+    assert [item["name"] for item in items] == ["A", "C", "B"]
+    assert [item["sort_order"] for item in items] == [0, 512, 1024]
+
+    invalid = client.post(f"/api/v1/lists/{list_id}/items/{c_id}:move", json={"after_id": b_id, "before_id": a_id})
+    assert invalid.status_code == 422
+
+
+def test_reorder_items_applies_full_order(client) -> None:
+    list_id = client.post("/api/v1/lists", json={"title": "Reorder"}).json()["data"]["id"]
+    created = client.post(
+        f"/api/v1/lists/{list_id}/items:batch",
+        json=[{"name": name, "weight_grams": 10} for name in ["A", "B", "C"]],
+    ).json()["data"]["created"]
+    ids = [item["id"] for item in created]
+
+    response = client.post(f"/api/v1/lists/{list_id}/items:reorder", json={"item_ids": ids[::-1]})
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["data"]["items"]] == ["C", "B", "A"]
+
+    partial = client.post(f"/api/v1/lists/{list_id}/items:reorder", json={"item_ids": ids[:2]})
+    assert partial.status_code == 422
+
+
 def test_api_validation_and_not_found(client, session) -> None:
     invalid_list = client.post("/api/v1/lists", json={"title": "", "description": ""})
     assert invalid_list.status_code == 422
@@ -105,12 +557,61 @@ def test_get_lists_returns_desc_order(client, session) -> None:
     assert data[0]["title"] == "Newer"
 
 
+def test_get_lists_paginates_with_cursor(client, session) -> None:
+    for index in range(5):
+        session.add(PackingList(title=f"List {index}", share_token=generate_share_token()))
+        session.commit()
+
+    first_page = client.get("/api/v1/lists", params={"limit": 2})
+    assert first_page.status_code == 200
+    assert [item["title"] for item in first_page.json()["data"]] == ["List 4", "List 3"]
+    next_cursor = first_page.json()["next_cursor"]
+    assert next_cursor
+
+    second_page = client.get("/api/v1/lists", params={"limit": 2, "cursor": next_cursor})
+    assert [item["title"] for item in second_page.json()["data"]] == ["List 2", "List 1"]
+
+    last_page = client.get("/api/v1/lists", params={"limit": 2, "cursor": second_page.json()["next_cursor"]})
+    assert [item["title"] for item in last_page.json()["data"]] == ["List 0"]
+    assert last_page.json()["next_cursor"] is None
+
+
+def test_get_lists_rejects_invalid_cursor(client) -> None:
+    response = client.get("/api/v1/lists", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "validation_error"
+
+
 def test_shared_not_found(client) -> None:
     response = client.get("/api/v1/shared/not-found")
     assert response.status_code == 404
     assert response.json()["error"]["code"] == "not_found"
 
 
+def test_shared_view_is_cached_until_list_mutation(client, session) -> None:
+    created = client.post("/api/v1/lists", json={"title": "Cached"}).json()["data"]
+    token = created["share_token"]
+    assert client.get(f"/api/v1/shared/{token}").json()["data"]["title"] == "Cached"
+
+    session.execute(update(PackingList).where(PackingList.id == created["id"]).values(title="Changed behind cache"))
+    session.commit()
+    assert client.get(f"/api/v1/shared/{token}").json()["data"]["title"] == "Cached"
+    assert shared_view_cache.entries.hits == 1
+
+    client.patch(f"/api/v1/lists/{created['id']}", json={"title": "Renamed", "description": ""})
+    assert client.get(f"/api/v1/shared/{token}").json()["data"]["title"] == "Renamed"
+
+    regenerated = client.post(f"/api/v1/lists/{created['id']}/share/regenerate").json()["data"]
+    assert client.get(f"/api/v1/shared/{token}").status_code == 404
+    assert client.get(f"/api/v1/shared/{regenerated['share_token']}").status_code == 200
+
+
+def test_shared_view_caches_unknown_tokens(client) -> None:
+    assert client.get("/api/v1/shared/probe").status_code == 404
+    assert client.get("/api/v1/shared/probe").status_code == 404
+    assert shared_view_cache.entries.hits == 1
+
+
 def test_get_gear_items_returns_cross_list_items(client, session) -> None:
     older = PackingList(title="Older List", share_token=generate_share_token())
     session.add(older)
@@ -170,6 +671,104 @@ def test_get_gear_items_returns_cross_list_items(client, session) -> None:
     assert data[2]["list_title"] == "Older List"
 
 
+def test_get_gear_items_filters_sorts_and_paginates(client, session) -> None:
+    packing_list = PackingList(title="Filter List", share_token=generate_share_token())
+    other_list = PackingList(title="Other List", share_token=generate_share_token())
+    session.add_all([packing_list, other_list])
+    session.commit()
+    session.add_all(
+        [
+            GearItem(list_id=packing_list.id, name="Tent", category="shelter", weight_grams=800, kind="base", sort_order=0),
+            GearItem(list_id=packing_list.id, name="Tarp", category="shelter", weight_grams=300, kind="base", sort_order=1),
+            GearItem(list_id=packing_list.id, name="Bivy", category="shelter", weight_grams=200, kind="base", sort_order=2),
+            GearItem(list_id=packing_list.id, name="Snack", category="food", weight_grams=150, kind="consumable", sort_order=3),
+            GearItem(list_id=other_list.id, name="Fly", category="shelter", weight_grams=250, kind="base", sort_order=0),
+        ]
+    )
+    session.commit()
+
+    filtered = client.get(
+        "/api/v1/gear-items",
+        params={"category": "shelter", "list_id": packing_list.id, "max_weight_grams": 500, "sort": "-weight"},
+    )
+    assert filtered.status_code == 200
+    assert [item["name"] for item in filtered.json()["data"]] == ["Tarp", "Bivy"]
+
+    searched = client.get("/api/v1/gear-items", params={"q": " ta ", "category": "shelter"})
+    assert [item["name"] for item in searched.json()["data"]] == ["Tarp"]
+    assert client.get("/api/v1/gear-items", params={"q": "%"}).json()["data"] == []
+
+    first_page = client.get("/api/v1/gear-items", params={"kind": "base", "sort": "weight", "limit": 2})
+    assert [item["name"] for item in first_page.json()["data"]] == ["Bivy", "Fly"]
+    second_page = client.get(
+        "/api/v1/gear-items",
+        params={"kind": "base", "sort": "weight", "limit": 2, "cursor": first_page.json()["next_cursor"]},
+    )
+    assert [item["name"] for item in second_page.json()["data"]] == ["Tarp", "Tent"]
+    assert second_page.json()["next_cursor"] is None
+
+
+def test_get_gear_items_default_sort_paginates_across_lists(client, session) -> None:
+    older = PackingList(title="Older List", share_token=generate_share_token())
+    session.add(older)
+    session.commit()
+    newer = PackingList(title="Newer List", share_token=generate_share_token())
+    session.add(newer)
+    session.commit()
+    for index in range(3):
+        session.add(GearItem(list_id=older.id, name=f"Old {index}", category="other", weight_grams=10, sort_order=index))
+        session.add(GearItem(list_id=newer.id, name=f"New {index}", category="other", weight_grams=10, sort_order=index))
+    session.commit()
+
+    names: list[str] = []
+    cursor = None
+    while True:
+        params: dict[str, object] = {"limit": 4}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/v1/gear-items", params=params).json()
+        names.extend(item["name"] for item in page["data"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == ["New 0", "New 1", "New 2", "Old 0", "Old 1", "Old 2"]
+
+
+def test_export_gear_items_streams_ndjson_and_csv(client, session) -> None:
+    packing_list = PackingList(title="Export List", share_token=generate_share_token())
+    session.add(packing_list)
+    session.commit()
+    session.add_all(
+        [
+            GearItem(list_id=packing_list.id, name="Tent", category="shelter", weight_grams=800, sort_order=0),
+            GearItem(list_id=packing_list.id, name="Stove, Ti", category="cooking", weight_grams=50, sort_order=1),
+        ]
+    )
+    session.commit()
+
+    ndjson = client.get("/api/v1/export/gear-items")
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["name"] for row in rows] == ["Tent", "Stove, Ti"]
+    assert rows[0]["list_title"] == "Export List"
+    assert rows[0]["category"] == "shelter"
+
+    exported = client.get("/api/v1/export/gear-items", params={"format": "csv"})
+    assert exported.status_code == 200
+    assert exported.headers["content-type"].startswith("text/csv")
+    csv_rows = list(csv.DictReader(io.StringIO(exported.text)))
+    assert [row["name"] for row in csv_rows] == ["Tent", "Stove, Ti"]
+    assert csv_rows[1]["weight_grams"] == "50"
+
+
+def test_export_lists_with_no_rows_returns_csv_header(client) -> None:
+    response = client.get("/api/v1/export/lists", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.text.splitlines() == ["id,title,description,unit,share_token,is_shared,created_at,updated_at"]
+
+
 def test_create_gear_item_without_list_creates_inventory_list(client, session) -> None:
     response = client.post(
         "/api/v1/gear-items",
@@ -205,6 +804,18 @@ def test_create_gear_item_without_list_creates_inventory_list(client, session) -
     )
     assert follow_up.status_code == 200
     assert follow_up.json()["data"]["list_id"] == payload["list_id"]
+    assert inventory_list.system_role == GEAR_INVENTORY_ROLE
+
+
+def test_gear_inventory_role_is_unique(session) -> None:
+    session.add(PackingList(title="A", share_token=generate_share_token(), system_role=GEAR_INVENTORY_ROLE))
+    session.commit()
+    session.add(PackingList(title="B", share_token=generate_share_token(), system_role=GEAR_INVENTORY_ROLE))
+    with pytest.raises(IntegrityError):
+        session.commit()
+    session.rollback()
+
+    assert get_or_create_gear_inventory_list(session).title == "A"
 
 
 def test_cors_preflight_for_spa_origin(client) -> None:
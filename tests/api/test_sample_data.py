@@ -1,5 +1,6 @@
 from ul_packing.models import Category, GearItem, ItemKind, PackingList
 from ul_packing.sample_data import seed_sample_gear_inventory_data
+from ul_packing.services import check_list_summaries
 
 
 def test_seed_sample_gear_inventory_data_inserts_many_items(session) -> None:
@@ -12,6 +13,8 @@ def test_seed_sample_gear_inventory_data_inserts_many_items(session) -> None:
 
     items = session.query(GearItem).filter(GearItem.list_id == inventory.id).order_by(GearItem.sort_order.asc()).all()
     assert len(items) >= 20
+    assert inventory.item_count == len(items)
+    assert check_list_summaries(session) == []
 
 
 def test_seed_sample_gear_inventory_data_is_idempotent(session) -> None:
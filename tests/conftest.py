@@ -1,25 +1,32 @@
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+os.environ["QUERY_BUDGET_STRICT"] = "true"
 
-from ul_packing.db import Base, get_db  # noqa: E402
-from ul_packing.main import app  # noqa: E402
+from ul_packing.cache import shared_view_cache  # noqa: E402
+from ul_packing.db import Base, get_async_db, get_async_read_db, get_db, get_read_db, to_async_url  # noqa: E402
+from ul_packing.main import create_app  # noqa: E402
+
+apps = {"sync": create_app(database_async=False), "async": create_app(database_async=True)}
+
+
+@pytest.fixture
+def database_url(tmp_path: Path) -> str:
+    return f"sqlite+pysqlite:///{tmp_path / 'test.db'}"
 
 
 @pytest.fixture
-def session() -> Generator[Session, None, None]:
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+def session(database_url: str) -> Generator[Session, None, None]:
+    engine = create_engine(database_url, connect_args={"check_same_thread": False})
     TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
     Base.metadata.create_all(bind=engine)
     db = TestingSessionLocal()
@@ -27,14 +34,32 @@ def session() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+        engine.dispose()
 
 
-@pytest.fixture
-def client(session: Session) -> Generator[TestClient, None, None]:
-    def override_get_db() -> Generator[Session, None, None]:
-        yield session
+@pytest.fixture(params=["sync", "async"])
+def client(request: pytest.FixtureRequest, session: Session, database_url: str) -> Generator[TestClient, None, None]:
+    """API client for each database mode; both modes share the database behind ``session``."""
+    app = apps[request.param]
+    if request.param == "sync":
+
+        def override_get_db() -> Generator[Session, None, None]:
+            yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
+    else:
+        # NullPool: aiosqlite connections must not outlive the test client's event loop.
+        async_engine = create_async_engine(to_async_url(database_url), poolclass=NullPool)
+        TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False)
+
+        async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+            async with TestingAsyncSessionLocal() as db:
+                yield db
 
-    app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        app.dependency_overrides[get_async_read_db] = override_get_async_db
+    shared_view_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
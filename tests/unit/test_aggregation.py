@@ -0,0 +1,32 @@
+from ul_packing.aggregation import WeightBucket, aggregate_weights
+from ul_packing.models import GearItem, ItemKind, PackingList
+from ul_packing.services import generate_share_token
+
+
+def test_aggregate_weights_groups_many_lists_in_one_query(session) -> None:
+    first = PackingList(title="First", share_token=generate_share_token())
+    second = PackingList(title="Second", share_token=generate_share_token())
+    empty = PackingList(title="Empty", share_token=generate_share_token())
+    session.add_all([first, second, empty])
+    session.commit()
+    session.add_all(
+        [
+            GearItem(list_id=first.id, name="Tent", category="shelter", weight_grams=800, quantity=1, kind=ItemKind.BASE),
+            GearItem(list_id=first.id, name="Stakes", category="shelter", weight_grams=10, quantity=8, kind=ItemKind.BASE),
+            GearItem(list_id=first.id, name="Snack", category="food", weight_grams=120, quantity=2, kind=ItemKind.CONSUMABLE),
+            GearItem(list_id=second.id, name="Shell", category="clothing", weight_grams=100, quantity=1, kind=ItemKind.WORN),
+        ]
+    )
+    session.commit()
+
+    by_category = aggregate_weights(session, [first.id, second.id, empty.id], "category")
+
+    assert by_category[first.id] == [
+        WeightBucket(key="shelter", weight_g=880, item_count=2),
+        WeightBucket(key="food", weight_g=240, item_count=1),
+    ]
+    assert by_category[second.id] == [WeightBucket(key="clothing", weight_g=100, item_count=1)]
+    assert by_category[empty.id] == []
+
+    by_kind = aggregate_weights(session, [first.id], "kind")
+    assert [(bucket.key, bucket.weight_g) for bucket in by_kind[first.id]] == [("base", 880), ("consumable", 240)]
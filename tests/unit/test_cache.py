@@ -0,0 +1,60 @@
+from ul_packing.cache import CachedSharedView, SharedViewCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+
+    clock.now = 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    clock.now = 6
+    assert cache.get("a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_shared_view_cache_drops_results_read_before_an_invalidation() -> None:
+    cache = SharedViewCache(maxsize=10, ttl=60, negative_ttl=5)
+    stale = CachedSharedView(list_id="list-1", etag='"list-1.1"', body=b"old")
+
+    generation = cache.generation
+    cache.invalidate_list("list-1")  # a write commits while the reader is in the database
+    assert cache.store("token", stale, generation) is False
+    assert cache.store_not_found("new-token", generation) is False
+    assert cache.get("token") is None
+
+    assert cache.store("token", stale, cache.generation) is True
+    assert cache.get("token") == stale
+
+
+def test_shared_view_cache_holds_off_recently_invalidated_lists() -> None:
+    cache = SharedViewCache(maxsize=10, ttl=60, negative_ttl=5, invalidation_hold=30)
+    cache.invalidate_list("list-1")
+    generation = cache.generation
+
+    # A replica may still return the pre-write rows, so the list is not cached during the hold.
+    assert cache.store("token", CachedSharedView(list_id="list-1", etag="", body=b"old"), generation) is False
+    assert cache.store("other", CachedSharedView(list_id="list-2", etag="", body=b"ok"), generation) is True
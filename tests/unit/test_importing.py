@@ -0,0 +1,66 @@
+import io
+
+from ul_packing.importing import ImportRowError, import_items, iter_import_rows
+from ul_packing.models import Category, GearItem, ItemKind, PackingList
+from ul_packing.services import check_list_summaries, generate_share_token
+
+LIGHTERPACK_CSV = """Item Name,Category,desc,qty,weight,unit,url,price,worn,consumable
+Duplex,Shelter,2P tent,1,19.5,oz,,,,
+Puffy,Clothing,,1,250,g,,,Worn,
+Ramen,Food & Kitchen,,3,0.2,lb,,,,1
+Mystery,Misc,,1,heavy,g,,,,
+"""
+
+
+def test_iter_import_rows_maps_lighterpack_columns() -> None:
+    rows = list(iter_import_rows(io.StringIO(LIGHTERPACK_CSV), "lighterpack"))
+
+    assert [line for line, _ in rows] == [2, 3, 4, 5]
+    tent, puffy, ramen, mystery = (row for _, row in rows)
+    assert (tent["name"], tent["category"], tent["weight_grams"], tent["notes"]) == (
+        "Duplex",
+        Category.SHELTER,
+        553,
+        "2P tent",
+    )
+    assert (puffy["category"], puffy["kind"]) == (Category.CLOTHING, ItemKind.WORN)
+    assert (ramen["category"], ramen["kind"], ramen["quantity"], ramen["weight_grams"]) == (
+        Category.FOOD,
+        ItemKind.CONSUMABLE,
+        3,
+        91,
+    )
+    assert isinstance(mystery, ImportRowError)
+
+
+def test_iter_import_rows_keeps_sub_gram_lighterpack_items() -> None:
+    csv_text = "Item Name,Category,desc,qty,weight,unit,url,price,worn,consumable\nTag,Misc,,1,0.01,oz,,,,\n"
+
+    [(line, row)] = list(iter_import_rows(io.StringIO(csv_text), "lighterpack"))
+
+    assert line == 2
+    assert row["weight_grams"] == 1
+
+
+def test_import_items_commits_per_chunk_and_skips_bad_rows(session) -> None:
+    packing_list = PackingList(title="Import", share_token=generate_share_token())
+    session.add(packing_list)
+    session.commit()
+    lines = ["name,category,kind,weight_grams,quantity,notes\n"]
+    lines += [f"Item {index},food,consumable,10,1,\n" for index in range(5)]
+    lines.insert(3, "Broken,food,consumable,0,1,\n")
+    progress: list[int] = []
+
+    report = import_items(
+        session, packing_list.id, iter(lines), chunk_size=2, progress=lambda r: progress.append(r.imported)
+    )
+
+    assert (report.imported, report.failed, report.chunks) == (5, 1, 3)
+    assert report.failures[0].line == 4
+    assert progress == [2, 4, 5]
+    session.refresh(packing_list)
+    assert packing_list.item_count == 5
+    assert packing_list.consumable_weight_g == 50
+    orders = [item.sort_order for item in session.query(GearItem).order_by(GearItem.sort_order)]
+    assert len(set(orders)) == 5
+    assert check_list_summaries(session) == []
@@ -0,0 +1,51 @@
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from ul_packing.instrumentation import (
+    QueryBudgetExceeded,
+    RequestTimingMiddleware,
+    instrument_engines,
+    query_budget,
+    serialization_timer,
+)
+
+
+def _app(strict: bool) -> FastAPI:
+    instrument_engines()
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    app = FastAPI()
+
+    @app.get("/queries/{count}")
+    @query_budget(2)
+    def run_queries(count: int) -> dict[str, int]:
+        with engine.connect() as conn:
+            for _ in range(count):
+                conn.execute(text("SELECT 1"))
+        with serialization_timer():
+            return {"count": count}
+
+    app.add_middleware(RequestTimingMiddleware, strict=strict)
+    return app
+
+
+def test_request_timing_reports_statements_in_header_and_log(caplog) -> None:
+    with caplog.at_level(logging.INFO, logger="ul_packing.requests"), TestClient(_app(strict=False)) as client:
+        response = client.get("/queries/3")
+
+    assert response.status_code == 200
+    assert 'desc="3 queries"' in response.headers["server-timing"]
+    assert "serialize;dur=" in response.headers["server-timing"]
+    record = json.loads(caplog.records[-1].getMessage())
+    assert (record["route"], record["status"], record["db_statements"]) == ("/queries/{count}", 200, 3)
+
+
+def test_strict_mode_fails_routes_over_their_query_budget() -> None:
+    with TestClient(_app(strict=True)) as client:
+        assert client.get("/queries/2").status_code == 200
+        with pytest.raises(QueryBudgetExceeded, match="ran 3 SQL statements"):
+            client.get("/queries/3")
@@ -0,0 +1,43 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ul_packing.metrics import Histogram, MetricsMiddleware, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "/a")
+
+    assert list(histogram.render()) == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 3.65',
+        'latency_seconds_count{route="/a"} 4',
+    ]
+
+
+def test_middleware_labels_requests_by_route_template() -> None:
+    registry = MetricsRegistry()
+    registry.collectors = []
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    app.add_middleware(MetricsMiddleware, registry=registry)
+    with TestClient(app) as client:
+        client.get("/items/a")
+        client.get("/items/b")
+        client.get("/missing")
+
+    output = registry.render()
+    assert 'ul_packing_http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2' in output
+    assert 'ul_packing_http_request_duration_seconds_count{method="GET",route="<unmatched>",status="404"} 1' in output
+    assert 'ul_packing_http_response_size_bytes_sum{method="GET",route="/items/{item_id}"} 20' in output
+    assert "ul_packing_http_requests_in_flight 0" in output
+
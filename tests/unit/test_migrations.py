@@ -0,0 +1,118 @@
+import threading
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from ul_packing.gear_inventory import GEAR_INVENTORY_DESCRIPTION, GEAR_INVENTORY_ROLE, GEAR_INVENTORY_TITLE
+from ul_packing.migrations import HEAD_VERSION, current_version, upgrade_schema
+
+
+def _memory_engine():
+    return create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+def _indexes(engine) -> set[tuple]:
+    with engine.connect() as conn:
+        return {
+            (table, index["name"], tuple(index["column_names"]), bool(index["unique"]))
+            for table in ("packing_lists", "gear_items")
+            for index in inspect(conn).get_indexes(table)
+        }
+
+
+def test_upgrade_schema_creates_and_stamps_empty_database() -> None:
+    engine = _memory_engine()
+
+    assert upgrade_schema(engine) == []
+
+    with engine.connect() as conn:
+        assert current_version(conn) == HEAD_VERSION
+        index_names = {index["name"] for index in inspect(conn).get_indexes("gear_items")}
+    assert "ix_gear_items_list_id_sort_order" in index_names
+
+
+def test_upgrade_schema_migrates_legacy_database() -> None:
+    engine = _memory_engine()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE packing_lists (id VARCHAR(36) PRIMARY KEY, title VARCHAR(100) NOT NULL, "
+                "description VARCHAR(500) NOT NULL, unit VARCHAR(2) NOT NULL, share_token VARCHAR(128) NOT NULL UNIQUE, "
+                "is_shared BOOLEAN NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE gear_items (id VARCHAR(36) PRIMARY KEY, list_id VARCHAR(36) REFERENCES packing_lists(id), "
+                "name VARCHAR(120) NOT NULL, category VARCHAR(11) NOT NULL, weight_grams INTEGER NOT NULL, "
+                "quantity INTEGER NOT NULL, kind VARCHAR(10) NOT NULL, notes TEXT NOT NULL, sort_order INTEGER NOT NULL)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO packing_lists VALUES "
+                "('list-1', 'Legacy', '', 'G', 'token', 1, '2024-01-01 00:00:00', '2024-01-01 00:00:00'), "
+                "('list-2', :title, :description, 'G', 'token-2', 0, '2024-01-02 00:00:00', '2024-01-02 00:00:00')"
+            ),
+            {"title": GEAR_INVENTORY_TITLE, "description": GEAR_INVENTORY_DESCRIPTION},
+        )
+        conn.execute(
+            text(
+                "INSERT INTO gear_items VALUES "
+                "('item-1', 'list-1', 'Tent', 'SHELTER', 800, 1, 'BASE', '', 0), "
+                "('item-2', 'list-1', 'Snack', 'FOOD', 100, 3, 'CONSUMABLE', '', 1)"
+            )
+        )
+
+    with engine.connect() as conn:
+        assert current_version(conn) == 0
+
+    assert upgrade_schema(engine) == list(range(1, HEAD_VERSION + 1))
+    assert upgrade_schema(engine) == []
+
+    with engine.connect() as conn:
+        assert current_version(conn) == HEAD_VERSION
+        row = conn.execute(
+            text(
+                "SELECT base_weight_g, consumable_weight_g, total_pack_g, item_count, updated_at "
+                "FROM packing_lists WHERE id = 'list-1'"
+            )
+        ).one()
+        roles = conn.execute(text("SELECT id, system_role FROM packing_lists ORDER BY id")).all()
+        index_names = {index["name"] for index in inspect(conn).get_indexes("packing_lists")}
+    assert tuple(row) == (800, 300, 1100, 2, "2024-01-01 00:00:00")
+    assert "ix_packing_lists_created_at_id" in index_names
+    assert [tuple(role) for role in roles] == [("list-1", None), ("list-2", GEAR_INVENTORY_ROLE)]
+
+    head = _memory_engine()
+    upgrade_schema(head)
+    assert _indexes(engine) == _indexes(head)
+
+
+def test_concurrent_upgrades_of_an_empty_database_stamp_it_once(tmp_path) -> None:
+    # One engine per caller, like separate uvicorn worker processes.
+    engines = [create_engine(f"sqlite+pysqlite:///{tmp_path / 'shared.db'}") for _ in range(4)]
+    barrier = threading.Barrier(len(engines))
+    errors: list[Exception] = []
+
+    def upgrade(engine) -> None:
+        barrier.wait()
+        try:
+            upgrade_schema(engine)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=upgrade, args=(engine,)) for engine in engines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with engines[0].connect() as conn:
+        versions = conn.execute(text("SELECT version FROM schema_version ORDER BY version")).scalars().all()
+    assert versions == list(range(1, HEAD_VERSION + 1))
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from ul_packing.db import engine_options
+from ul_packing.pool import TimedQueuePool, pool_status
+
+
+def test_timed_pool_hook_still_exists_on_sqlalchemy_queue_pools() -> None:
+    # TimedQueuePool times checkouts by overriding this private method.
+    for pool_class in (QueuePool, AsyncAdaptedQueuePool):
+        assert callable(getattr(pool_class, "_do_get", None))
+
+
+def test_timed_pool_reports_occupancy_waits_and_timeouts(tmp_path) -> None:
+    engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    held = engine.connect()
+    status = pool_status(engine)
+    assert (status["pool"], status["size"], status["checked_out"], status["overflow"]) == ("TimedQueuePool", 1, 1, 0)
+    assert status["max_overflow"] == 0
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    held.close()
+
+    waits = pool_status(engine)["waits"]
+    assert (waits["checkouts"], waits["timeouts"]) == (1, 1)
+    assert waits["wait_max_ms"] >= 50
+
+    engine.dispose()
+    assert pool_status(engine)["waits"]["timeouts"] == 1
+
+
+def test_engine_options_keep_default_pool_for_in_memory_sqlite(tmp_path) -> None:
+    assert "poolclass" not in engine_options("sqlite+pysqlite:///:memory:")
+    options = engine_options(f"sqlite+pysqlite:///{tmp_path / 'app.db'}")
+    assert options["poolclass"] is TimedQueuePool
+    assert options["connect_args"] == {"check_same_thread": False}
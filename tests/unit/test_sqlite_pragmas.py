@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from ul_packing.config import Settings
+from ul_packing.db import apply_sqlite_pragmas
+
+
+def test_sqlite_pragmas_merge_profile_and_overrides() -> None:
+    assert Settings(sqlite_profile="default").sqlite_pragmas() == {}
+
+    pragmas = Settings(sqlite_profile="production", sqlite_cache_size=-2000, sqlite_foreign_keys=False).sqlite_pragmas()
+    assert pragmas["journal_mode"] == "WAL"
+    assert pragmas["synchronous"] == "NORMAL"
+    assert (pragmas["cache_size"], pragmas["foreign_keys"]) == (-2000, False)
+
+    with pytest.raises(ValueError):
+        Settings(sqlite_profile="turbo").sqlite_pragmas()
+
+
+def test_apply_sqlite_pragmas_configures_every_connection(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'pragmas.db'}")
+    apply_sqlite_pragmas(engine, Settings(sqlite_profile="production").sqlite_pragmas())
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+    engine.dispose()
@@ -1,5 +1,5 @@
-from ul_packing.models import GearItem, ItemKind
-from ul_packing.services import compute_summary
+from ul_packing.models import GearItem, ItemKind, PackingList
+from ul_packing.services import check_list_summaries, compute_summary, generate_share_token
 
 
 def test_compute_summary_by_kind_and_quantity() -> None:
@@ -15,3 +15,27 @@ def test_compute_summary_by_kind_and_quantity() -> None:
     assert summary.consumable_weight_g == 240
     assert summary.worn_weight_g == 250
     assert summary.total_pack_g == 1290
+
+
+def test_check_list_summaries_detects_and_repairs_drift(session) -> None:
+    packing_list = PackingList(title="Drift", share_token=generate_share_token())
+    untouched = PackingList(title="Empty", share_token=generate_share_token())
+    session.add_all([packing_list, untouched])
+    session.commit()
+    session.add_all(
+        [
+            GearItem(list_id=packing_list.id, name="Tent", category="shelter", weight_grams=800, quantity=1, kind=ItemKind.BASE),
+            GearItem(list_id=packing_list.id, name="Snack", category="food", weight_grams=120, quantity=2, kind=ItemKind.CONSUMABLE),
+        ]
+    )
+    session.commit()
+
+    assert check_list_summaries(session) == [packing_list.id]
+
+    assert check_list_summaries(session, repair=True) == [packing_list.id]
+    session.refresh(packing_list)
+    assert packing_list.base_weight_g == 800
+    assert packing_list.consumable_weight_g == 240
+    assert packing_list.total_pack_g == 1040
+    assert packing_list.item_count == 2
+    assert check_list_summaries(session) == []
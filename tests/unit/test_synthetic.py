@@ -0,0 +1,59 @@
+from sqlalchemy import select
+
+from ul_packing.models import GearItem, PackingList
+from ul_packing.services import check_list_summaries
+from ul_packing.synthetic import generate_synthetic_data
+
+
+def test_generate_synthetic_data_commits_in_batches_with_consistent_summaries(session) -> None:
+    batches = []
+    report = generate_synthetic_data(
+        session, 20, min_items=3, max_items=8, seed=7, batch_rows=25, progress=lambda r: batches.append(r.items)
+    )
+
+    assert report.lists == session.query(PackingList).count() == 20
+    assert report.items == session.query(GearItem).count()
+    assert 3 * 20 <= report.items <= 8 * 20
+    assert report.batches == len(batches) > 1
+    assert batches == sorted(batches)
+    assert check_list_summaries(session) == []
+
+
+def test_generate_synthetic_data_batches_lists_without_items(session) -> None:
+    batches = []
+    report = generate_synthetic_data(
+        session, 10, min_items=0, max_items=0, batch_rows=4, progress=lambda r: batches.append(r.lists)
+    )
+
+    assert (report.lists, report.items) == (10, 0)
+    assert batches == [4, 8, 10]
+
+
+def _generated_content(session) -> list[tuple]:
+    return session.execute(
+        select(PackingList.title, PackingList.unit, PackingList.is_shared, GearItem.name, GearItem.weight_grams)
+        .join(GearItem, GearItem.list_id == PackingList.id)
+        .order_by(PackingList.created_at, GearItem.sort_order)
+    ).all()
+
+
+def test_generate_synthetic_data_content_is_deterministic_per_seed(session) -> None:
+    generate_synthetic_data(session, 5, seed=1)
+    first = _generated_content(session)
+    first_ids = set(session.scalars(select(PackingList.id)))
+    session.query(GearItem).delete()
+    session.query(PackingList).delete()
+    session.commit()
+
+    generate_synthetic_data(session, 5, seed=1)
+    assert _generated_content(session) == first
+    assert first_ids.isdisjoint(session.scalars(select(PackingList.id)))
+
+
+def test_generate_synthetic_data_can_run_again_on_a_populated_database(session) -> None:
+    generate_synthetic_data(session, 3, seed=1)
+    generate_synthetic_data(session, 3, seed=1)
+
+    assert session.query(PackingList).count() == 6
+    assert session.query(PackingList.share_token).distinct().count() == 6
+    assert check_list_summaries(session) == []